@@ -6,7 +6,7 @@ a = Analysis(
     pathex=['program'],
     binaries=[],
     datas=[('assets', 'assets'), ('program/ui_files', 'ui_files')],
-    hiddenimports=['windows', 'ui_components', 'utils'],
+    hiddenimports=['windows', 'ui_components', 'utils', 'services', 'models'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
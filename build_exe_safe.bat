@@ -39,7 +39,7 @@ REM [修改注意 5] 設定需要搜尋的模組路徑或隱藏匯入
 REM --paths: 增加額外的模組搜尋資料夾 (例如 program)
 REM --hidden-import: 手動加入 PyInstaller 沒偵測到的模組 (例如 ui_files)
 REM ---------------------------------------------------------------------
-set IMPORT_OPTS=--paths program --hidden-import windows --hidden-import ui_components --hidden-import utils
+set IMPORT_OPTS=--paths program --hidden-import windows --hidden-import ui_components --hidden-import utils --hidden-import services --hidden-import models
 
 REM =====================================================================
 REM 以下為自動執行邏輯，通常不需要修改
@@ -3,12 +3,27 @@ main.py
 -------
 描述：應用程式進入點 (Entry Point)。
 功能：負責初始化 QApplication，設定全域字型，並啟動主要的「後台控制視窗」(ControlWindow)。
+      命令列參數：
+        --display-process     大螢幕改在獨立程序中執行 (或於 utils/config.py 設定 DISPLAY_SEPARATE_PROCESS)
+        --display-node NAME   (內部使用) 以大螢幕子程序身分啟動，連線到控制台的 IPC 通道 NAME
+        --sync-hub PORT       控制台開放 TCP PORT 供其他大螢幕節點同步 (或設定 SYNC_HUB_PORT)
+        --sync-node HOST:PORT 以同步節點身分啟動 (只有大螢幕)，連線到 HOST 上的控制台
+        --audience-port PORT  開啟網頁觀眾端 http://本機IP:PORT/ (或設定 AUDIENCE_SERVER_PORT)
+        --control-api PORT    開啟本機 HTTP 控制 API (或設定 CONTROL_API_PORT)
 """
 import sys
 import os
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QFont
 from windows.control_window import ControlWindow
+from utils.config import DISPLAY_SEPARATE_PROCESS, SYNC_HUB_PORT, AUDIENCE_SERVER_PORT, CONTROL_API_PORT
+
+
+def _arg_value(name):
+    """取得命令列參數 name 後面的值 (沒有則回傳 None)"""
+    if name in sys.argv and sys.argv.index(name) + 1 < len(sys.argv):
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
 
 if __name__ == '__main__':
     from PyQt5.QtCore import QCoreApplication
@@ -22,11 +37,26 @@ if __name__ == '__main__':
     
     app = QApplication(sys.argv)
     
-    # 建立主視窗 (控制台) - 它會自動建立並管理 DisplayWindow
-    control_window = ControlWindow() 
-    control_window.show() # 控制台可以一般顯示，不一定要全螢幕
+    if _arg_value("--display-node"):
+        # 大螢幕子程序：只建立 DisplayWindow，由控制台透過 IPC 操作
+        from windows.display_process import DisplayHost
+        display_host = DisplayHost(_arg_value("--display-node"))
+    elif _arg_value("--sync-node"):
+        # 多螢幕同步節點：只建立 DisplayWindow，依控制台廣播的狀態與轉動計畫重現畫面
+        from services.display_sync import SyncNode
+        host, _, port = _arg_value("--sync-node").rpartition(":")
+        sync_node = SyncNode(host or "127.0.0.1", int(port))
+    else:
+        # 建立主視窗 (控制台) - 它會自動建立並管理 DisplayWindow
+        separate_display = DISPLAY_SEPARATE_PROCESS or "--display-process" in sys.argv
+        sync_port = int(_arg_value("--sync-hub") or SYNC_HUB_PORT)
+        audience_port = int(_arg_value("--audience-port") or AUDIENCE_SERVER_PORT)
+        control_api_port = int(_arg_value("--control-api") or CONTROL_API_PORT)
+        control_window = ControlWindow(separate_display=separate_display, sync_port=sync_port,
+                                       audience_port=audience_port, control_api_port=control_api_port)
+        control_window.show() # 控制台可以一般顯示，不一定要全螢幕
     
     font = QFont("Microsoft JhengHei", 10)
     app.setFont(font)
     
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
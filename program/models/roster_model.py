@@ -0,0 +1,279 @@
+"""
+roster_model.py
+---------------
+描述：抽獎名單資料模型 (Roster Model)。
+功能：
+      1. 名單只在輸入時解析一次，每個人取得穩定的編號 (person id)；同名的兩個人是兩筆不同的紀錄，
+         確認中獎時以編號移除，不會刪錯人。
+      2. 以編號 / 姓名查詢為 O(1)。位置索引 (person id -> 位置) 在變更後只作廢變更位置之後的部分，
+         查詢時才從該處往後補建；以已知位置 (轉盤格子) 移除時完全不必查詢索引。
+         移除本身仍需 del list[i] 搬移後面的元素 (C 層級的記憶體搬移，5 萬人約數十微秒)。
+      3. 變更時發出信號 (itemRemoved / itemsInserted / itemRenamed / rosterReset)，
+         轉盤可只增刪一格，不必每次重新解析整段文字。
+      4. [新增] 本身即為 QAbstractListModel，名單編輯器 (QListView) 只繪製看得到的列，
+         數萬筆名單也不會卡住控制台；打散名單在背景執行緒計算排列後一次套用。
+"""
+import random
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex, pyqtSignal
+
+PersonIdRole = Qt.UserRole + 1
+
+
+def parse_names(text):
+    """將多行文字轉為名單 (去除前後空白與空行)"""
+    if isinstance(text, (list, tuple)):
+        return [str(n).strip() for n in text if str(n).strip()]
+    return [line.strip() for line in (text or "").split('\n') if line.strip()]
+
+
+class _ShuffleJobSignals(QObject):
+    finished = pyqtSignal(int, object) # 名單版本, 打散後的 person id 清單
+
+
+class _ShuffleJob(QRunnable):
+    """背景打散 (只處理 id 清單的複本，不碰觸模型本身)"""
+    def __init__(self, rev, ids):
+        super().__init__()
+        self.rev = rev
+        self.ids = ids
+        self.signals = _ShuffleJobSignals()
+
+    def run(self):
+        random.shuffle(self.ids)
+        self.signals.finished.emit(self.rev, self.ids)
+
+
+class RosterModel(QAbstractListModel):
+    rosterReset = pyqtSignal()                 # 整份名單替換 / 重新排序
+    itemRemoved = pyqtSignal(int, int, str)    # person id, 移除前的位置, 姓名
+    itemsInserted = pyqtSignal(int, list)      # 插入位置, 姓名清單
+    itemRenamed = pyqtSignal(int, str)         # 位置, 新姓名
+
+    def __init__(self, names=None, parent=None):
+        super().__init__(parent)
+        self._order = []      # 依序排列的 person id (與轉盤格子順序相同)
+        self._people = {}     # person id -> 姓名
+        self._by_name = {}    # 姓名 -> {person id: None} (同名者依序排列)
+        self._next_id = 1
+        self._index = {}      # 快取：person id -> 位置 (插入後可能過期，使用前與 _order 核對)
+        self._index_upto = 0  # _order[:_index_upto] 的每個人都已有正確的索引
+        self._rev = 0         # 名單版本 (背景打散完成時據此判斷結果是否過期)
+        self._jobs = set()
+        if names:
+            self._assign(parse_names(names))
+
+    # --- Qt Model 介面 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._order):
+            return None
+        pid = self._order[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._people[pid]
+        if role == PersonIdRole:
+            return pid
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """編輯器內直接改名 (空白視為不變)"""
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        name = str(value).strip()
+        pid = self._order[index.row()]
+        old = self._people[pid]
+        if not name or name == old:
+            return False
+        self._unlink_name(pid, old)
+        self._people[pid] = name
+        self._by_name.setdefault(name, {})[pid] = None
+        self._rev += 1
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.itemRenamed.emit(index.row(), name)
+        return True
+
+    # --- 查詢 ---
+    def count(self):
+        return len(self._order)
+
+    def ids(self):
+        return list(self._order)
+
+    def names(self):
+        people = self._people
+        return [people[pid] for pid in self._order]
+
+    def to_text(self):
+        return "\n".join(self.names())
+
+    def name_of(self, person_id):
+        return self._people.get(person_id)
+
+    def index_of(self, person_id):
+        """
+        名單中的位置 (與轉盤格子順序相同)；不存在時回傳 -1
+        位置在有效範圍內時為 O(1)，否則從最早的變更位置往後補建，找到即停止。
+        """
+        if person_id not in self._people:
+            return -1
+        pos = self._index.get(person_id)
+        if pos is not None and pos < self._index_upto and self._order[pos] == person_id:
+            return pos
+        index, order = self._index, self._order
+        for i in range(self._index_upto, len(order)):
+            pid = order[i]
+            index[pid] = i
+            if pid == person_id:
+                self._index_upto = i + 1
+                return i
+        self._index_upto = len(order)
+        return -1
+
+    def id_at(self, index):
+        return self._order[index] if 0 <= index < len(self._order) else None
+
+    def find(self, name):
+        """依姓名查詢第一位符合者的編號 (找不到回傳 None)"""
+        ids = self._by_name.get(name)
+        return next(iter(ids)) if ids else None
+
+    def resolve(self, name, index=None):
+        """由轉盤結果找出中獎者：優先採用格子位置 (同名時才不會選錯)，位置不符再退回姓名查詢"""
+        if index is not None:
+            pid = self.id_at(index)
+            if pid is not None and self._people[pid] == name:
+                return pid
+        return self.find(name)
+
+    # --- 修改 ---
+    def set_names(self, names):
+        """替換整份名單；內容與順序完全相同時保留原編號且不發出信號"""
+        names = parse_names(names)
+        if names == self.names():
+            return False
+        self.beginResetModel()
+        self._order = []
+        self._people.clear()
+        self._by_name.clear()
+        self._index = {}
+        self._assign(names)
+        self.endResetModel()
+        self.rosterReset.emit()
+        return True
+
+    def insert_names(self, row, names):
+        """在 row 之前插入多人 (一次 rowsInserted；貼上大量名單用)，回傳新編號清單"""
+        names = parse_names(names)
+        if not names:
+            return []
+        row = max(0, min(row, len(self._order)))
+        self.beginInsertRows(QModelIndex(), row, row + len(names) - 1)
+        new_ids = self._assign(names, row)
+        self.endInsertRows()
+        self.itemsInserted.emit(row, names)
+        return new_ids
+
+    def remove(self, person_id, index=None):
+        """
+        以編號移除一人，回傳是否成功
+        index: 已知的位置 (例如中獎格子)，與編號相符時直接使用，不必查詢位置索引
+        """
+        if person_id not in self._people:
+            return False
+        if index is None or self.id_at(index) != person_id:
+            index = self.index_of(person_id)
+        self.beginRemoveRows(QModelIndex(), index, index)
+        del self._order[index]
+        name = self._people.pop(person_id)
+        self._unlink_name(person_id, name)
+        self._index.pop(person_id, None)
+        self._invalidate(index)
+        self.endRemoveRows()
+        self.itemRemoved.emit(person_id, index, name)
+        return True
+
+    def remove_rows(self, rows):
+        """移除多列：連續的列合併為一次 rowsRemoved (由後往前，位置不會錯亂)"""
+        rows = sorted({r for r in rows if 0 <= r < len(self._order)}, reverse=True)
+        if len(rows) == 1:
+            self.remove(self._order[rows[0]])
+            return
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for pid in self._order[first:last + 1]:
+                self._unlink_name(pid, self._people.pop(pid))
+                self._index.pop(pid, None)
+            del self._order[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+        if rows:
+            self._invalidate(rows[-1])
+            self.rosterReset.emit() # 大量刪除：轉盤直接整份更新
+
+    def shuffle(self):
+        order = self.ids()
+        random.shuffle(order)
+        self._apply_order(order)
+
+    def shuffle_async(self):
+        """[新增] 在背景執行緒打散；完成時若名單已被修改則捨棄結果"""
+        if len(self._order) < 2:
+            return
+        job = _ShuffleJob(self._rev, self.ids())
+        job.setAutoDelete(False)
+        job.signals.finished.connect(lambda rev, ids, _job=job: self._on_shuffled(_job, rev, ids))
+        self._jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_shuffled(self, job, rev, ids):
+        self._jobs.discard(job)
+        if rev != self._rev:
+            print("[RosterModel] 打散期間名單已變更，略過此次結果")
+            return
+        self._apply_order(ids)
+
+    def _apply_order(self, order):
+        if len(order) < 2:
+            return
+        self.beginResetModel()
+        self._order = order
+        self._index = {}
+        self._invalidate()
+        self.endResetModel()
+        self.rosterReset.emit()
+
+    def _assign(self, names, row=None):
+        new_ids = list(range(self._next_id, self._next_id + len(names)))
+        self._next_id += len(names)
+        for pid, name in zip(new_ids, names):
+            self._people[pid] = name
+            self._by_name.setdefault(name, {})[pid] = None
+        if row is None:
+            row = len(self._order)
+            self._order.extend(new_ids)
+        else:
+            self._order[row:row] = new_ids
+        self._invalidate(row)
+        return new_ids
+
+    def _unlink_name(self, person_id, name):
+        same_name = self._by_name[name]
+        del same_name[person_id]
+        if not same_name:
+            del self._by_name[name]
+
+    def _invalidate(self, start=0):
+        """名單變更：start 之後的位置索引作廢 (之前的不受影響)"""
+        self._index_upto = min(self._index_upto, start)
+        self._rev += 1
@@ -0,0 +1,180 @@
+"""
+winner_model.py
+---------------
+描述：榮譽榜資料模型 (Winner Model)。
+功能：
+      1. 以 QAbstractListModel 保存中獎紀錄 (獎項、姓名、時間、抽獎序號)，搭配 QListView 虛擬化顯示，
+         上百位得獎者也只繪製畫面上看得到的列。
+      2. append_many() 一次插入多筆 (單一 rowsInserted)，還原存檔時不會逐筆觸發重排。
+      3. 自動存檔至 winners.json (與 data.json 同目錄)；短時間內多次新增只寫檔一次，
+         寫入採暫存檔 + 取代，程式重開時可立即還原榮譽榜。
+"""
+import os
+import sys
+import json
+import time
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, QCoreApplication
+
+SAVE_DELAY_MS = 500   # [設定] 新增後延遲寫檔 (合併連續新增)
+
+PrizeRole = Qt.UserRole + 1
+NameRole = Qt.UserRole + 2
+TimeRole = Qt.UserRole + 3
+DrawIdRole = Qt.UserRole + 4
+
+
+def winners_file_path():
+    """榮譽榜存檔位置 (與 ControlWindow.get_data_file_path 的 data.json 同目錄)"""
+    if getattr(sys, 'frozen', False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        # program/models/winner_model.py -> program/
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "winners.json")
+
+
+def _coerce_record(record, fallback_id):
+    """檢查並整理一筆紀錄 (缺少姓名 / 獎項時回傳 None；序號無效時改用 fallback_id)"""
+    if not isinstance(record, dict) or record.get("name") is None or record.get("prize") is None:
+        return None
+    try:
+        draw_id = int(record.get("draw_id"))
+    except (TypeError, ValueError):
+        draw_id = fallback_id
+    time_text = record.get("time")
+    return {
+        "prize": str(record["prize"]),
+        "name": str(record["name"]),
+        "time": time_text if isinstance(time_text, str) else "",
+        "draw_id": draw_id,
+    }
+
+
+def format_winner(record):
+    """榮譽榜上顯示的文字"""
+    return f"【{record['prize']}】\n   {record['name']}"
+
+
+class WinnerListModel(QAbstractListModel):
+    def __init__(self, path=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._records = []
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush) # 關閉程式前寫入尚未存檔的紀錄
+
+    # --- Qt Model 介面 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._records):
+            return None
+        record = self._records[index.row()]
+        if role == Qt.DisplayRole:
+            return format_winner(record)
+        if role == PrizeRole:
+            return record["prize"]
+        if role == NameRole:
+            return record["name"]
+        if role == TimeRole:
+            return record["time"]
+        if role == DrawIdRole:
+            return record["draw_id"]
+        return None
+
+    # --- 資料操作 ---
+    def records(self, start=0, end=None):
+        return list(self._records[start:end])
+
+    def display_texts(self, start=0, end=None):
+        return [format_winner(r) for r in self._records[start:end]]
+
+    def add_winner(self, prize, name):
+        """新增一位得獎者並排程存檔，回傳新紀錄"""
+        next_id = (self._records[-1]["draw_id"] + 1) if self._records else 1
+        record = {"prize": prize, "name": name, "time": time.strftime("%Y-%m-%d %H:%M:%S"), "draw_id": next_id}
+        self.append_many([record])
+        return record
+
+    def append_many(self, records, persist=True):
+        """一次插入多筆紀錄 (只發出一次 rowsInserted)；先整理好所有紀錄，插入過程不會中途失敗"""
+        first = len(self._records)
+        cleaned = []
+        for r in records:
+            record = _coerce_record(r, first + len(cleaned) + 1)
+            if record is not None:
+                cleaned.append(record)
+        if not cleaned:
+            return
+        self.beginInsertRows(QModelIndex(), first, first + len(cleaned) - 1)
+        self._records.extend(cleaned)
+        self.endInsertRows()
+        if persist:
+            self._schedule_save()
+
+    def replace(self, records, persist=True):
+        """以另一份紀錄整份替換 (先整理好再一次重置)"""
+        cleaned = []
+        for r in records:
+            record = _coerce_record(r, len(cleaned) + 1)
+            if record is not None:
+                cleaned.append(record)
+        self.beginResetModel()
+        self._records = cleaned
+        self.endResetModel()
+        if persist:
+            self._schedule_save()
+
+    def clear(self):
+        self.beginResetModel()
+        self._records = []
+        self.endResetModel()
+        self._schedule_save()
+
+    # --- 存檔 ---
+    def _schedule_save(self):
+        if self.path:
+            self._save_timer.start(SAVE_DELAY_MS)
+
+    def flush(self):
+        if self._save_timer.isActive():
+            self.save()
+
+    def load(self):
+        """讀取存檔並一次還原 (找不到或格式錯誤時維持空白)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            records = data.get("winners", []) if isinstance(data, dict) else []
+            if not isinstance(records, list):
+                raise ValueError("winners 不是清單")
+        except Exception as e:
+            # 保留無法讀取的檔案 (之後的存檔不會覆蓋掉它)，從空白榮譽榜開始
+            backup = f"{self.path}.bad-{time.strftime('%Y%m%d-%H%M%S')}"
+            print(f"[WinnerModel] 讀取榮譽榜失敗，已另存為 {backup}: {e}")
+            try:
+                os.replace(self.path, backup)
+            except OSError:
+                pass
+            return
+        self.replace(records, persist=False)
+        print(f"[WinnerModel] 已還原 {len(self._records)} 位得獎者")
+
+    def save(self):
+        if not self.path:
+            return
+        self._save_timer.stop()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"winners": self._records}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[WinnerModel] 儲存榮譽榜失敗: {e}")
@@ -0,0 +1,290 @@
+"""
+audience_server.py
+------------------
+描述：網頁觀眾端直播伺服器 (Web Audience View)。
+功能：
+      1. 內嵌的 asyncio HTTP / WebSocket 伺服器 (純標準函式庫)，在獨立執行緒中執行，不佔用 Qt GUI 執行緒。
+      2. GUI 執行緒以固定頻率讀取大螢幕狀態 (snapshot_state)，轉成精簡的 JSON 訊框後交給伺服器廣播；
+         瀏覽器頁面 (ui_files/audience.html) 在本地重繪轉盤並依轉速內插角度，遠端同仁不需要影像串流。
+      3. 廣播為一次編碼、多方分送；每個觀眾有自己的待送佇列，狀態訊框只保留最新一份 (慢的連線不會累積延遲)，
+         事件訊框 (名單 / 中獎) 依序送出。每個觀眾的積壓量可由 /stats 查詢。
+
+      訊框格式 (伺服器 -> 瀏覽器)：
+        {"t":"s","a":角度,"v":速度(度/10ms),"sp":是否轉動,"p":獎項}     狀態 (固定頻率)
+        {"t":"items","items":[...],"colors":[...]}                     名單 (版本改變時)
+        {"t":"winners","list":[...]}                                   榮譽榜 (改變時)
+        {"t":"win","name":"王小明","prize":"社長獎"}                     中獎事件
+"""
+import os
+import sys
+import json
+import time
+import base64
+import struct
+import asyncio
+import hashlib
+import threading
+from PyQt5.QtCore import QObject, QTimer
+from utils.config import COLORS
+
+BROADCAST_INTERVAL_MS = 100  # [設定] 狀態訊框的固定更新間隔 (10 FPS，瀏覽器端會內插)
+HEARTBEAT_INTERVAL_S = 2.0   # [設定] 畫面沒變時的心跳間隔
+MAX_PENDING_EVENTS = 64      # [設定] 每個觀眾最多積壓的事件訊框，超過則斷線 (由瀏覽器自動重連)
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def _page_path():
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, "ui_files", "audience.html")
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui_files", "audience.html")
+
+
+def _ws_frame(payload, opcode=0x1):
+    """編碼伺服器端 WebSocket 訊框 (不加遮罩)"""
+    header = bytes([0x80 | opcode])
+    n = len(payload)
+    if n < 126:
+        header += bytes([n])
+    elif n < 65536:
+        header += bytes([126]) + struct.pack("!H", n)
+    else:
+        header += bytes([127]) + struct.pack("!Q", n)
+    return header + payload
+
+
+class _Viewer:
+    """單一觀眾連線 (只在 asyncio 執行緒中存取)"""
+    def __init__(self, writer):
+        self.writer = writer
+        self.peer = writer.get_extra_info('peername')
+        self.state_frame = None     # 最新的狀態訊框 (只保留一份)
+        self.events = []            # 依序送出的事件訊框
+        self.wakeup = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def push_state(self, frame):
+        if self.state_frame is not None:
+            self.dropped += 1
+        self.state_frame = frame
+        self.wakeup.set()
+
+    def push_event(self, frame):
+        self.events.append(frame)
+        self.wakeup.set()
+
+    def stats(self):
+        transport = self.writer.transport
+        return {
+            "peer": f"{self.peer[0]}:{self.peer[1]}" if self.peer else "?",
+            "pending_events": len(self.events),
+            "write_buffer": transport.get_write_buffer_size() if transport else 0,
+            "sent": self.sent,
+            "dropped_states": self.dropped,
+        }
+
+
+class AudienceServer(QObject):
+    """
+    網頁觀眾端伺服器
+    - source 需提供 snapshot_state(known_items_rev) (DisplayWindow / RemoteDisplayProxy / FanoutDisplay)
+    - start() 後於背景執行緒提供 http://<host>:<port>/ (頁面)、/ws (WebSocket)、/stats (積壓統計)
+    """
+    def __init__(self, source, port, host="0.0.0.0", parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.host = host
+        self.port = port
+        self._loop = None
+        self._thread = None
+        self._viewers = set()
+        # 以下只在 GUI 執行緒存取
+        self._items_rev = None
+        self._last_state_key = None
+        self._last_sent_at = 0.0
+        self._last_winners = None
+        self._last_overlay_name = None
+        self._snapshot = {}         # 新觀眾連線時補送的最新訊框 (在 asyncio 執行緒讀取)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._sample)
+
+    # --- 執行緒管理 ---
+    def start(self):
+        self._thread = threading.Thread(target=self._run_loop, name="AudienceServer", daemon=True)
+        self._thread.start()
+        self._timer.start(BROADCAST_INTERVAL_MS)
+
+    def stop(self):
+        self._timer.stop()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port))
+            print(f"[AudienceServer] 網頁觀眾端: http://{self.host}:{self.port}/")
+            self._loop.run_forever()
+            server.close()
+        except Exception as e:
+            print(f"[AudienceServer] 伺服器錯誤: {e}")
+        finally:
+            self._loop.close()
+
+    # --- GUI 執行緒：取樣並轉成訊框 ---
+    def _sample(self):
+        try:
+            state = self.source.snapshot_state(self._items_rev)
+        except Exception as e:
+            print(f"[AudienceServer] 讀取大螢幕狀態失敗: {e}")
+            return
+        if not state or self._loop is None:
+            return
+        wheel = state.get("wheel") or {}
+
+        if "items" in state:
+            self._items_rev = wheel.get("items_rev")
+            self._publish("items", {"t": "items", "items": state["items"],
+                                    "colors": [c.name() for c in COLORS]})
+
+        winners = state.get("winners", [])
+        if winners != self._last_winners:
+            self._last_winners = winners
+            self._publish("winners", {"t": "winners", "list": winners})
+
+        overlay = state.get("overlay") or {}
+        name = overlay.get("name") if overlay.get("visible") else None
+        if name and name != self._last_overlay_name:
+            self._publish(None, {"t": "win", "name": name, "prize": overlay.get("prize", "")})
+        self._last_overlay_name = name
+
+        frame = {"t": "s", "a": round(wheel.get("angle", 0.0), 2), "v": round(wheel.get("speed", 0.0), 3),
+                 "sp": bool(wheel.get("spinning")), "p": state.get("prize", "")}
+        key = (frame["a"], frame["sp"], frame["p"])
+        now = time.monotonic()
+        if key != self._last_state_key or now - self._last_sent_at >= HEARTBEAT_INTERVAL_S:
+            self._last_state_key = key
+            self._last_sent_at = now
+            self._publish("state", frame, is_state=True)
+
+    def _publish(self, snapshot_key, message, is_state=False):
+        """編碼一次，交給 asyncio 執行緒分送給所有觀眾"""
+        frame = _ws_frame(json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        if snapshot_key:
+            self._snapshot[snapshot_key] = frame
+        self._loop.call_soon_threadsafe(self._fan_out, frame, is_state)
+
+    # --- asyncio 執行緒 ---
+    def _fan_out(self, frame, is_state):
+        for viewer in list(self._viewers):
+            if is_state:
+                viewer.push_state(frame)
+            elif len(viewer.events) >= MAX_PENDING_EVENTS:
+                print(f"[AudienceServer] 觀眾 {viewer.stats()['peer']} 積壓過多，中斷連線")
+                viewer.writer.close()
+                self._viewers.discard(viewer)
+            else:
+                viewer.push_event(frame)
+
+    def stats(self):
+        """各觀眾的積壓統計 (asyncio 執行緒呼叫)"""
+        return {"viewers": len(self._viewers), "clients": [v.stats() for v in self._viewers]}
+
+    async def _handle_client(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=10)
+        except Exception:
+            writer.close()
+            return
+        lines = request.decode('latin-1').split("\r\n")
+        parts = lines[0].split(" ")
+        path = parts[1] if len(parts) > 1 else "/"
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+
+        if path.startswith("/ws") and headers.get("upgrade", "").lower() == "websocket":
+            await self._serve_websocket(reader, writer, headers)
+        elif path == "/stats":
+            body = json.dumps(self.stats()).encode('utf-8')
+            await self._respond(writer, "200 OK", "application/json", body)
+        elif path in ("/", "/index.html"):
+            try:
+                with open(_page_path(), 'rb') as f:
+                    body = f.read()
+                await self._respond(writer, "200 OK", "text/html; charset=utf-8", body)
+            except OSError:
+                await self._respond(writer, "500 Internal Server Error", "text/plain", b"audience.html not found")
+        else:
+            await self._respond(writer, "404 Not Found", "text/plain", b"not found")
+
+    async def _respond(self, writer, status, content_type, body):
+        writer.write((f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                      f"Content-Length: {len(body)}\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n").encode('latin-1') + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('latin-1')).digest()).decode('ascii')
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode('latin-1'))
+
+        viewer = _Viewer(writer)
+        for snapshot_key in ("items", "winners", "state"):
+            frame = self._snapshot.get(snapshot_key)
+            if frame is not None:
+                viewer.push_event(frame)
+        self._viewers.add(viewer)
+        sender = asyncio.ensure_future(self._send_loop(viewer))
+        try:
+            await self._read_loop(reader, writer)
+        finally:
+            self._viewers.discard(viewer)
+            sender.cancel()
+            writer.close()
+
+    async def _send_loop(self, viewer):
+        try:
+            while True:
+                await viewer.wakeup.wait()
+                viewer.wakeup.clear()
+                frames, viewer.events = viewer.events, []
+                if viewer.state_frame is not None:
+                    frames.append(viewer.state_frame)
+                    viewer.state_frame = None
+                for frame in frames:
+                    viewer.writer.write(frame)
+                viewer.sent += len(frames)
+                await viewer.writer.drain() # 慢的觀眾只會卡住自己的傳送工作
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    async def _read_loop(self, reader, writer):
+        """讀取瀏覽器訊框：只處理 close / ping，其餘忽略"""
+        try:
+            while True:
+                head = await reader.readexactly(2)
+                opcode = head[0] & 0x0F
+                length = head[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                mask = await reader.readexactly(4) if head[1] & 0x80 else b"\0\0\0\0"
+                data = await reader.readexactly(length)
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+                if opcode == 0x8:
+                    writer.write(_ws_frame(b"", 0x8))
+                    return
+                if opcode == 0x9:
+                    writer.write(_ws_frame(payload, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
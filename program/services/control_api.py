@@ -0,0 +1,280 @@
+"""
+control_api.py
+--------------
+描述：本機 HTTP 控制 API (Control API)。
+功能：
+      1. 內嵌的 asyncio HTTP 伺服器 (背景執行緒)，讓平板或彩排腳本觸發控制台的操作：
+           GET  /api/status                       目前獎項 / 名單數 / 是否轉動 / 待確認中獎者
+           GET  /api/stats                        各端點的延遲統計 (p50 / p95 / max)
+           POST /api/prize    {"index": 0} 或 {"name": "社長獎 - 10,000元"}
+           POST /api/roster   {"names": [...]} 或 {"text": "一行一位"}
+           POST /api/publish                      發布目前設定至大螢幕
+           POST /api/spin                         開始抽獎
+           POST /api/confirm                      確認歸檔待確認的中獎者
+           POST /api/cancel                       保留 (不歸檔)
+           POST /api/mode     {"interactive": false}  關閉確認視窗，改由 API 確認 (無人值守彩排)
+      2. 每個請求都透過 Qt 信號 (Queued Connection) 排入 GUI 執行緒執行，不直接跨執行緒存取元件。
+      3. 量測「請求 -> 大螢幕畫面」延遲：排隊時間、執行時間，以及執行後大螢幕完成下一次重繪的時間；
+         超過 REQUEST_TIMEOUT_S 回傳 504 (逾時的請求不會在之後才執行)，等待重繪最多 FRAME_TIMEOUT_MS。
+         大螢幕在獨立程序時，由子程序在重繪後經 IPC 回傳確認 (frameAck)。
+      4. 安全性：POST 必須是 application/json (否則 415)，不回傳 CORS 標頭，瀏覽器中的網頁無法直接呼叫；
+         未設定 CONTROL_API_TOKEN 時啟動時隨機產生一組 token (顯示於主控台)，請求需帶 X-Api-Token 標頭。
+"""
+import json
+import time
+import secrets
+import asyncio
+import threading
+import concurrent.futures
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+REQUEST_TIMEOUT_S = 3.0     # [設定] 單一請求的最長處理時間
+FRAME_TIMEOUT_MS = 500      # [設定] 等待大螢幕重繪的上限 (視窗被遮住等情況不會重繪)
+LATENCY_SAMPLES = 500       # [設定] 每個端點保留的延遲樣本數
+MAX_BODY_BYTES = 1 << 20
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _QtInvoker(QObject):
+    """在 GUI 執行緒建立；背景執行緒 emit 時由 Qt 自動改為 Queued Connection"""
+    requested = pyqtSignal(object)
+
+    def __init__(self, display, parent=None):
+        super().__init__(parent)
+        self.display = display
+        self.requested.connect(self._run)
+
+    def _run(self, job):
+        fn, future, submitted_at, wait_frame = job
+        if not future.set_running_or_notify_cancel():
+            return # 已逾時 (回傳 504) 的請求不再執行
+        started_at = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            if not isinstance(e, ApiError):
+                print(f"[ControlApi] 執行失敗: {e}")
+                e = ApiError(500, f"執行失敗: {e}")
+            if not future.done():
+                future.set_exception(e)
+            return
+        timing = {"queue_ms": round((started_at - submitted_at) * 1000, 2),
+                  "exec_ms": round((time.perf_counter() - started_at) * 1000, 2),
+                  "frame_ms": None}
+
+        def _finish(painted):
+            if future.done():
+                return
+            if painted:
+                timing["frame_ms"] = round((time.perf_counter() - submitted_at) * 1000, 2)
+            future.set_result((result, timing))
+
+        call_after_next_frame = getattr(self.display, 'call_after_next_frame', None)
+        if wait_frame and call_after_next_frame is not None:
+            call_after_next_frame(lambda: _finish(True))
+            QTimer.singleShot(FRAME_TIMEOUT_MS, lambda: _finish(False))
+        else:
+            _finish(False)
+
+
+class ControlApiServer(QObject):
+    """
+    控制 API 伺服器
+    - window: ControlWindow (所有操作都在 GUI 執行緒上呼叫其方法)
+    """
+    def __init__(self, window, port, host="127.0.0.1", token="", parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.host = host
+        self.port = port
+        self.token = token or secrets.token_urlsafe(16) # 未設定時隨機產生，避免本機網頁任意呼叫
+        self._invoker = _QtInvoker(window.display_window, self)
+        self._latency = {}      # endpoint -> deque(總延遲 ms)
+        self._timeouts = 0
+        self._stats_lock = threading.Lock()
+        self._loop = None
+        self._routes = {
+            ("GET", "/api/status"): (self._status, False),
+            ("POST", "/api/prize"): (self._select_prize, False),
+            ("POST", "/api/roster"): (self._set_roster, False),
+            ("POST", "/api/publish"): (self._publish, True),
+            ("POST", "/api/spin"): (self._spin, True),
+            ("POST", "/api/confirm"): (self._confirm, True),
+            ("POST", "/api/cancel"): (self._cancel, True),
+            ("POST", "/api/mode"): (self._set_mode, False),
+        }
+
+    # --- 執行緒管理 ---
+    def start(self):
+        threading.Thread(target=self._run_loop, name="ControlApi", daemon=True).start()
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            server = self._loop.run_until_complete(asyncio.start_server(self._handle_client, self.host, self.port))
+            print(f"[ControlApi] 控制 API: http://{self.host}:{self.port}/api/status (X-Api-Token: {self.token})")
+            self._loop.run_forever()
+            server.close()
+        except Exception as e:
+            print(f"[ControlApi] 伺服器錯誤: {e}")
+        finally:
+            self._loop.close()
+
+    # --- 操作 (GUI 執行緒) ---
+    def _status(self, body):
+        w = self.window
+        return {
+            "prizes": w.prizes,
+            "prize_index": w.prize_combo.currentIndex(),
+            "prize": w.prize_combo.currentText(),
+            "roster_count": w.roster.count(),
+            "spinning": w.display_window.is_spinning(),
+            "pending_winner": w.pending_winner,
+            "interactive": w.interactive,
+        }
+
+    def _select_prize(self, body):
+        w = self.window
+        if "index" in body:
+            index = int(body["index"])
+        elif "name" in body and body["name"] in w.prizes:
+            index = w.prizes.index(body["name"])
+        else:
+            raise ApiError(400, "需要 index 或有效的 name")
+        if not 0 <= index < w.prize_combo.count():
+            raise ApiError(400, f"index 超出範圍: {index}")
+        w.prize_combo.setCurrentIndex(index)
+        return {"prize_index": index, "prize": w.prize_combo.currentText()}
+
+    def _set_roster(self, body):
+        w = self.window
+        if isinstance(body.get("names"), list):
+            names = [str(n).strip() for n in body["names"] if str(n).strip()]
+        elif isinstance(body.get("text"), str):
+            names = [n.strip() for n in body["text"].split('\n') if n.strip()]
+        else:
+            raise ApiError(400, "需要 names (清單) 或 text")
+        w.roster.set_names(names)
+        w.list_content = w.roster.to_text()
+        w.save_data()
+        return {"roster_count": len(names)}
+
+    def _publish(self, body):
+        self.window.publish_to_display(interactive=False)
+        return {"prize": self.window.prize_combo.currentText()}
+
+    def _spin(self, body):
+        w = self.window
+        if w.pending_winner is not None:
+            raise ApiError(409, f"尚有待確認的中獎者: {w.pending_winner}")
+        if w.display_window.is_spinning():
+            raise ApiError(409, "轉盤轉動中")
+        w.master_start_spin()
+        return {"spinning": w.display_window.is_spinning()}
+
+    def _confirm(self, body):
+        w = self.window
+        if w.pending_winner is None:
+            raise ApiError(409, "沒有待確認的中獎者")
+        winner = w.pending_winner
+        w.confirm_winner(winner)
+        return {"winner": winner}
+
+    def _cancel(self, body):
+        w = self.window
+        if w.pending_winner is None:
+            raise ApiError(409, "沒有待確認的中獎者")
+        winner = w.pending_winner
+        w.cancel_winner()
+        return {"winner": winner}
+
+    def _set_mode(self, body):
+        self.window.interactive = bool(body.get("interactive", True))
+        return {"interactive": self.window.interactive}
+
+    # --- 統計 ---
+    def _record(self, endpoint, total_ms):
+        with self._stats_lock:
+            samples = self._latency.setdefault(endpoint, deque(maxlen=LATENCY_SAMPLES))
+            samples.append(total_ms)
+
+    def stats(self):
+        result = {"timeouts": self._timeouts, "endpoints": {}}
+        with self._stats_lock:
+            for endpoint, samples in self._latency.items():
+                ordered = sorted(samples)
+                n = len(ordered)
+                result["endpoints"][endpoint] = {
+                    "count": n,
+                    "p50_ms": ordered[n // 2],
+                    "p95_ms": ordered[min(n - 1, int(n * 0.95))],
+                    "max_ms": ordered[-1],
+                }
+        return result
+
+    # --- HTTP (asyncio 執行緒) ---
+    async def _handle_client(self, reader, writer):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=10)
+            lines = head.decode('latin-1').split("\r\n")
+            method, path = lines[0].split(" ")[:2]
+            path = path.split("?", 1)[0]
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    k, v = line.split(":", 1)
+                    headers[k.strip().lower()] = v.strip()
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                raise ApiError(413, "請求內容過大")
+            raw = await reader.readexactly(length) if length else b""
+            status, payload = await self._dispatch(method, path, headers, raw)
+        except ApiError as e:
+            status, payload = e.status, {"ok": False, "error": str(e)}
+        except Exception as e:
+            status, payload = 400, {"ok": False, "error": f"無效的請求: {e}"} # 只剩解析錯誤 (GUI 端的例外已轉為 500)
+
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                      "Content-Type: application/json; charset=utf-8\r\n"
+                      f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode('latin-1') + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, headers, raw):
+        if self.token and headers.get("x-api-token") != self.token:
+            raise ApiError(401, "token 錯誤")
+        if (method, path) == ("GET", "/api/stats"):
+            return 200, {"ok": True, **self.stats()}
+        route = self._routes.get((method, path))
+        if route is None:
+            raise ApiError(404, f"未知的端點: {method} {path}")
+        handler, wait_frame = route
+        if method == "POST" and headers.get("content-type", "").split(";")[0].strip().lower() != "application/json":
+            raise ApiError(415, "Content-Type 必須是 application/json")
+        body = json.loads(raw.decode('utf-8')) if raw.strip() else {}
+
+        submitted_at = time.perf_counter()
+        future = concurrent.futures.Future()
+        self._invoker.requested.emit((lambda: handler(body), future, submitted_at, wait_frame))
+        try:
+            result, timing = await asyncio.wait_for(asyncio.wrap_future(future), timeout=REQUEST_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise ApiError(504, f"GUI 執行緒逾時 (> {REQUEST_TIMEOUT_S}s)")
+        total_ms = round((time.perf_counter() - submitted_at) * 1000, 2)
+        self._record(path, total_ms)
+        return 200, {"ok": True, "result": result, "latency": {**timing, "total_ms": total_ms}}
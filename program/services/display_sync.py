@@ -0,0 +1,274 @@
+"""
+display_sync.py
+---------------
+描述：多螢幕同步 (Multi-Display State Sync)。
+功能：大型會場可由多台電腦各自驅動一台投影機，控制台只傳送「狀態」而非影像：
+      1. SyncHub (控制台端)：以 TCP 監聽區網連線，將大螢幕指令與轉動計畫廣播給 N 個節點，
+         並定期 ping 每個節點，量測延遲 (RTT) 與時鐘差 (clock offset)。
+      2. FanoutDisplay (控制台端)：包住主要大螢幕 (DisplayWindow / RemoteDisplayProxy)，
+         呼叫指令時同時廣播給所有節點，主要大螢幕開始轉動時自動廣播轉動計畫。
+      3. SyncNode (節點端)：在任一台電腦上執行 DisplayWindow (無抽獎按鈕)，
+         依轉動計畫 + 時鐘差在本機重現完全相同的轉動 (固定步長物理，見 LuckyWheelWidget.run_spin_plan)。
+
+      協定 (JSON Lines over TCP，欄位 "t" 為訊息類型)：
+        節點 -> 控制台 : {"t":"hello","node":"名稱"}
+                         {"t":"pong","id":n,"t0":控制台時間,"t1":節點時間}
+        控制台 -> 節點 : {"t":"ping","id":n,"t0":控制台時間}
+                         {"t":"clock","offset":秒,"rtt":秒}           (offset = 節點時鐘 - 控制台時鐘)
+                         {"t":"cmd","cmd":"publish","args":[...],"kwargs":{...}}
+                         {"t":"winners","records":[...]}              (連線時：目前的榮譽榜紀錄)
+                         {"t":"spin","plan":{轉動計畫}}                (種子 + 物理參數 + 起始時間)
+                         {"t":"release","step":k}                     (長按在第 k 步放開)
+      測試方式 (同一台 Linux 電腦的多個程序)：
+        python main.py --sync-hub 5599
+        python main.py --sync-node 127.0.0.1:5599   (可開多個)
+"""
+import time
+import socket
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QTcpServer, QTcpSocket, QHostAddress, QAbstractSocket
+from services.json_lines import JsonLineChannel
+from windows.display_window import DisplayWindow
+from windows.display_process import DISPLAY_COMMANDS
+from models.roster_model import parse_names
+
+# 同步給節點的指令 (轉動改以轉動計畫廣播，不直接轉送 start_spin)
+SYNC_COMMANDS = frozenset(DISPLAY_COMMANDS) - {"start_spin"}
+
+PING_INTERVAL_MS = 2000     # [設定] 量測延遲與時鐘差的間隔
+CLOCK_SAMPLES = 8           # [設定] 保留最近幾次量測，取 RTT 最小者的時鐘差 (NTP 式濾波)
+RECONNECT_INTERVAL_MS = 2000
+REPLAY_COMMANDS = ("publish", "set_physics") # 節點 (重新) 連線時補送的最新狀態 (名單另外追蹤，見 SyncHub._track_items)
+
+
+class _NodeLink:
+    """控制台端記錄的單一節點連線"""
+    def __init__(self, sock, channel):
+        self.socket = sock
+        self.channel = channel
+        self.name = f"{sock.peerAddress().toString()}:{sock.peerPort()}"
+        self.samples = deque(maxlen=CLOCK_SAMPLES)  # (rtt, offset)
+        self.rtt = None
+        self.offset = None
+
+    def record(self, rtt, offset):
+        self.samples.append((rtt, offset))
+        self.rtt = rtt
+        self.offset = min(self.samples)[1]
+
+    def stats(self):
+        return {
+            "node": self.name,
+            "rtt_ms": None if self.rtt is None else round(self.rtt * 1000, 2),
+            "offset_ms": None if self.offset is None else round(self.offset * 1000, 2),
+            "backlog": self.channel.pending_bytes(),
+        }
+
+
+class SyncHub(QObject):
+    """控制台端：接受節點連線並廣播"""
+    nodesChanged = pyqtSignal(list) # 每個節點的 stats() 清單
+
+    def __init__(self, port, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self._nodes = {}        # socket -> _NodeLink
+        self._ping_id = 0
+        self._replay = {}       # cmd -> 最新一次的 message
+        self._items = None      # 大螢幕目前的轉盤名單 (隨 publish / set_items / remove_item / celebrate_winner 更新)
+        self.winners_provider = None # callable：目前的榮譽榜紀錄 (由 FanoutDisplay 指定為主要大螢幕)
+        self._active_spin = None # (plan, release_step)：轉動中的計畫，供中途加入的節點追上
+        self._server = QTcpServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        if self._server.listen(QHostAddress.Any, port):
+            print(f"[SyncHub] 等待同步節點連線 (port {port})")
+        else:
+            print(f"[SyncHub] 無法監聽 port {port}: {self._server.errorString()}")
+
+        self._ping_timer = QTimer(self)
+        self._ping_timer.timeout.connect(self._ping_all)
+        self._ping_timer.start(PING_INTERVAL_MS)
+
+    # --- 連線管理 ---
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            sock.setSocketOption(QAbstractSocket.LowDelayOption, 1) # 關閉 Nagle，降低指令延遲
+            channel = JsonLineChannel(sock, self)
+            link = _NodeLink(sock, channel)
+            self._nodes[sock] = link
+            channel.messageReceived.connect(lambda message, _link=link: self._on_message(_link, message))
+            sock.disconnected.connect(lambda _sock=sock: self._on_disconnected(_sock))
+
+            for message in self._replay.values():
+                channel.send(message)
+            if self._items is not None:
+                # publish 附帶的名單可能已移除過中獎者，補送目前的名單
+                channel.send({"t": "cmd", "cmd": "set_items", "args": [self._items], "kwargs": {}})
+            if self.winners_provider is not None:
+                # 榮譽榜以控制台這邊為準 (節點不讀取本機存檔)
+                channel.send({"t": "winners", "records": self.winners_provider()})
+            if self._active_spin is not None:
+                plan, release_step = self._active_spin
+                channel.send({"t": "spin", "plan": plan})
+                if release_step is not None:
+                    channel.send({"t": "release", "step": release_step})
+            self._ping(link)
+            print(f"[SyncHub] 節點已連線: {link.name}")
+            self.nodesChanged.emit(self.stats())
+
+    def _on_disconnected(self, sock):
+        link = self._nodes.pop(sock, None)
+        if link is not None:
+            print(f"[SyncHub] 節點已離線: {link.name}")
+            sock.deleteLater()
+            self.nodesChanged.emit(self.stats())
+
+    def stats(self):
+        return [link.stats() for link in self._nodes.values()]
+
+    # --- 延遲 / 時鐘差量測 ---
+    def _ping(self, link):
+        self._ping_id += 1
+        link.channel.send({"t": "ping", "id": self._ping_id, "t0": time.time()})
+
+    def _ping_all(self):
+        for link in list(self._nodes.values()):
+            self._ping(link)
+
+    def _on_message(self, link, message):
+        kind = message.get("t")
+        if kind == "pong":
+            t3 = time.time()
+            t0, t1 = message["t0"], message["t1"]
+            rtt = t3 - t0
+            link.record(rtt, t1 - (t0 + rtt / 2))
+            link.channel.send({"t": "clock", "offset": link.offset, "rtt": rtt})
+            self.nodesChanged.emit(self.stats())
+        elif kind == "hello":
+            link.name = f"{message.get('node') or link.name} ({link.socket.peerAddress().toString()})"
+            self.nodesChanged.emit(self.stats())
+
+    # --- 廣播 ---
+    def _broadcast(self, message):
+        for link in self._nodes.values():
+            link.channel.send(message)
+
+    def broadcast_command(self, cmd, args=(), kwargs=None):
+        message = {"t": "cmd", "cmd": cmd, "args": list(args), "kwargs": kwargs or {}}
+        if cmd in REPLAY_COMMANDS:
+            self._replay[cmd] = message
+        self._track_items(cmd, list(args), kwargs or {})
+        self._broadcast(message)
+
+    def _track_items(self, cmd, args, kwargs):
+        """依指令更新目前的轉盤名單 (新節點連線時補送)"""
+        if cmd == "remove_item":
+            index = args[0] if args else kwargs.get("index")
+            if self._items is not None and isinstance(index, int) and 0 <= index < len(self._items):
+                del self._items[index]
+            return
+        if cmd == "publish":
+            items = args[1] if len(args) > 1 else kwargs.get("items")
+        elif cmd == "set_items":
+            items = args[0] if args else kwargs.get("items")
+        elif cmd == "celebrate_winner":
+            items = args[1] if len(args) > 1 else kwargs.get("remaining_items")
+        else:
+            return
+        if items is not None:
+            self._items = parse_names(items)
+
+    def broadcast_spin(self, plan):
+        self._active_spin = (plan, None)
+        self._broadcast({"t": "spin", "plan": plan})
+
+    def broadcast_release(self, release):
+        if self._active_spin is not None:
+            self._active_spin = (self._active_spin[0], release["step"])
+        self._broadcast({"t": "release", "step": release["step"]})
+
+    def end_spin(self, *args):
+        self._active_spin = None
+
+
+class FanoutDisplay:
+    """
+    主要大螢幕 + 同步節點的組合
+    - 指令介面 (DISPLAY_COMMANDS) 先交給主要大螢幕，再廣播給所有節點
+    - 其餘屬性與信號 (spinFinished, snapshot_state ...) 直接取自主要大螢幕
+    """
+    def __init__(self, primary, hub):
+        self.primary = primary
+        self.hub = hub
+        primary.spinPlanned.connect(hub.broadcast_spin)
+        primary.spinReleased.connect(hub.broadcast_release)
+        primary.spinFinished.connect(hub.end_spin)
+        hub.winners_provider = primary.winner_records
+
+    def __getattr__(self, name):
+        attr = getattr(self.primary, name)
+        if name not in SYNC_COMMANDS:
+            return attr
+
+        def command(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            self.hub.broadcast_command(name, args, kwargs)
+            return result
+        return command
+
+
+class SyncNode(QObject):
+    """節點端：連線到控制台，在本機重現大螢幕"""
+    def __init__(self, host, port, parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        self.clock_offset = 0.0 # 本機時鐘 - 控制台時鐘 (秒)
+        self.display = DisplayWindow(interactive=False, persist_winners=False)
+        self.display.show_on_preferred_screen()
+
+        self.socket = QTcpSocket(self)
+        self.socket.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        self.channel = JsonLineChannel(self.socket, self)
+        self.channel.messageReceived.connect(self._on_message)
+        self.socket.connected.connect(self._on_connected)
+        self.socket.disconnected.connect(self._schedule_reconnect)
+        self.socket.error.connect(lambda _err: self._schedule_reconnect())
+
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._connect)
+        self._connect()
+
+    def _connect(self):
+        if self.socket.state() == QAbstractSocket.UnconnectedState:
+            print(f"[SyncNode] 連線到控制台 {self.host}:{self.port} ...")
+            self.socket.connectToHost(self.host, self.port)
+
+    def _schedule_reconnect(self):
+        if not self._reconnect_timer.isActive():
+            self._reconnect_timer.start(RECONNECT_INTERVAL_MS)
+
+    def _on_connected(self):
+        print("[SyncNode] 已連線")
+        self.channel.send({"t": "hello", "node": socket.gethostname()})
+
+    def _on_message(self, message):
+        kind = message.get("t")
+        try:
+            if kind == "ping":
+                self.channel.send({"t": "pong", "id": message["id"], "t0": message["t0"], "t1": time.time()})
+            elif kind == "clock":
+                self.clock_offset = message["offset"]
+            elif kind == "spin":
+                self.display.run_spin_plan(message["plan"], self.clock_offset)
+            elif kind == "release":
+                self.display.release_spin(message["step"])
+            elif kind == "winners":
+                self.display.set_winners(message.get("records") or [])
+            elif kind == "cmd" and message.get("cmd") in SYNC_COMMANDS:
+                getattr(self.display, message["cmd"])(*message.get("args", []), **message.get("kwargs", {}))
+        except Exception as e:
+            print(f"[SyncNode] 處理訊息 {kind} 失敗: {e}")
@@ -0,0 +1,46 @@
+"""
+json_lines.py
+-------------
+描述：JSON Lines 訊息通道 (JSON Lines Channel)。
+功能：在任何 Qt 串流裝置 (QLocalSocket / QTcpSocket) 上收發「每行一則 UTF-8 JSON」的訊息，
+      供大螢幕獨立程序 (display_process) 與多螢幕同步 (display_sync) 共用。
+"""
+import json
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+def encode_message(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+class JsonLineChannel(QObject):
+    """QIODevice 上的 JSON Lines 收發 (兩端共用)"""
+    messageReceived = pyqtSignal(object)
+
+    def __init__(self, device, parent=None):
+        super().__init__(parent)
+        self.device = device
+        self._buffer = b""
+        device.readyRead.connect(self._on_ready_read)
+
+    def send(self, message):
+        if self.device.isWritable():
+            self.device.write(encode_message(message))
+            self.device.flush()
+
+    def pending_bytes(self):
+        """尚未寫出的位元組數 (可用於判斷對端是否跟不上)"""
+        return self.device.bytesToWrite()
+
+    def _on_ready_read(self):
+        self._buffer += bytes(self.device.readAll())
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line.decode('utf-8'))
+            except ValueError as e:
+                print(f"[JsonLines] 無法解析訊息: {e}")
+                continue
+            self.messageReceived.emit(message)
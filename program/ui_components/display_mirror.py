@@ -0,0 +1,156 @@
+"""
+display_mirror.py
+-----------------
+描述：控制台的大螢幕「狀態鏡像」預覽 (Display Mirror)。
+功能：
+      1. 不再截圖大螢幕，而是讀取大螢幕的顯示狀態 (snapshot_state)：
+         轉盤角度 / 名單 / 頭像 / 中獎遮罩 / 彩帶 / 榮譽榜 / 飛入中的名字，交給鏡像元件重繪。
+      2. 與大螢幕使用相同的元件：轉盤 LuckyWheelWidget (mirror_mode，頭像共用 AvatarCache 的渲染結果)、
+         中獎遮罩 WinnerOverlay、榮譽榜 WinnerBoard (QListView + WinnerListModel)、飛入圖層 FlyInLayer，
+         字級與邊距依大螢幕寬度等比例縮小。
+      3. 狀態沒變就不重繪；轉動時提高更新率，平時降低，GUI 忙碌時自動降頻。
+      狀態為純 dict，未來大螢幕移到其他程序或機器時，只需替換 source 即可沿用。
+"""
+import time
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QSizePolicy
+from PyQt5.QtCore import Qt, QTimer
+from ui_components.lucky_wheel import LuckyWheelWidget
+from ui_components.effects import ConfettiWidget, WinnerOverlay, FlyInLayer
+from ui_components.winner_board import WinnerBoard
+from models.winner_model import WinnerListModel
+
+SPIN_INTERVAL_MS = 33     # [設定] 轉盤轉動時的鏡像更新間隔 (約 30 FPS)
+IDLE_INTERVAL_MS = 200    # [設定] 平時的鏡像更新間隔
+MAX_INTERVAL_MS = 1000
+LATE_THRESHOLD_MS = 8     # [設定] Timer 延遲超過此值代表 GUI 執行緒忙碌，自動降頻
+REFERENCE_WIDTH = 1920    # 大螢幕尺寸未知時的預設寬度
+
+
+class DisplayMirror(QWidget):
+    """
+    大螢幕狀態鏡像
+    - source 需提供 snapshot_state(known_items_rev) 方法 (DisplayWindow 或遠端代理)
+    """
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self._last_state = None
+        self._items_rev = None
+        self._scale = None
+        self.interval_ms = IDLE_INTERVAL_MS
+        self._expected_at = None
+
+        layout = QHBoxLayout(self)
+        self._layout = layout
+
+        left = QWidget()
+        left_layout = QVBoxLayout(left)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.setSpacing(0)
+        self.prize_label = QLabel()
+        self.prize_label.setAlignment(Qt.AlignCenter)
+        # 字級隨鏡像寬度縮放：標題不可反過來撐大鏡像 (否則寬度 -> 字級 -> 寬度會互相放大)
+        self.prize_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+        self.wheel = LuckyWheelWidget(mirror_mode=True)
+        left_layout.addWidget(self.prize_label)
+        left_layout.addWidget(self.wheel, 1)
+
+        self.winner_model = WinnerListModel(None, self) # 只保存大螢幕最後幾筆紀錄 (不存檔)
+        self.winner_board = WinnerBoard(self.winner_model)
+        self._winner_records = None
+
+        layout.addWidget(left, 7)
+        layout.addWidget(self.winner_board, 3)
+
+        self.overlay = WinnerOverlay(self)
+        self.overlay.hide()
+
+        self.fly_layer = FlyInLayer(self)
+
+        self.confetti = ConfettiWidget(self, mirror_mode=True)
+        self.confetti.hide()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_tick)
+        self._schedule(IDLE_INTERVAL_MS)
+
+    def _apply_scale(self, display_width):
+        """依大螢幕寬度換算字級與邊距，讓鏡像的版面比例與大螢幕一致"""
+        scale = self.width() / float(display_width or REFERENCE_WIDTH)
+        if scale == self._scale:
+            return
+        self._scale = scale
+        px = lambda v: max(6, int(v * scale))
+        margin = int(20 * scale)
+        self._layout.setContentsMargins(margin, margin, margin, margin)
+        self.prize_label.setStyleSheet(
+            f"color: #f1c40f; font-size: {px(50)}px; font-weight: bold; font-family: 'Microsoft JhengHei';")
+        self.winner_board.set_scale(scale)
+        self.overlay.set_scale(scale)
+
+    def apply_state(self, state):
+        """套用大螢幕狀態 (只更新有變動的部分)"""
+        size = state.get("size") or [REFERENCE_WIDTH, 0]
+        self._apply_scale(size[0])
+
+        if self.prize_label.text() != state.get("prize", ""):
+            self.prize_label.setText(state.get("prize", ""))
+
+        wheel_state = state.get("wheel")
+        if wheel_state is not None:
+            items = state.get("items")
+            self.wheel.apply_state(wheel_state, items)
+            self._items_rev = self.wheel.items_rev
+
+        records = state.get("winner_records", [])
+        if records != self._winner_records:
+            self._winner_records = records
+            self.winner_model.replace(records, persist=False)
+            self.winner_board.list_view.scrollToBottom()
+
+        overlay = state.get("overlay") or {}
+        if overlay.get("visible"):
+            name, prize = overlay.get("name", ""), overlay.get("prize", "")
+            if not self.overlay.isVisible() or (self.overlay.current_name, self.overlay.current_prize) != (name, prize):
+                self.overlay.setGeometry(self.rect())
+                self.overlay.show_winner(name, prize)
+        elif self.overlay.isVisible():
+            self.overlay.hide()
+
+        flights = state.get("flights") or []
+        if flights or self.fly_layer.active_count:
+            self.fly_layer.show_snapshot(flights, self._scale)
+
+        if state.get("confetti") and not self.confetti.is_active:
+            self.confetti.resize(self.size())
+            self.confetti.start(state.get("confetti_mode", "normal"))
+        elif not state.get("confetti") and self.confetti.is_active:
+            self.confetti.stop()
+
+    def _schedule(self, interval_ms):
+        self.interval_ms = int(max(SPIN_INTERVAL_MS, min(MAX_INTERVAL_MS, interval_ms)))
+        self._expected_at = time.perf_counter() + self.interval_ms / 1000.0
+        self._timer.start(self.interval_ms)
+
+    def _on_tick(self):
+        late_ms = (time.perf_counter() - self._expected_at) * 1000.0 if self._expected_at else 0.0
+        if not self.isVisible():
+            self._schedule(MAX_INTERVAL_MS)
+            return
+
+        state = self.source.snapshot_state(self._items_rev)
+        if state is not None and state != self._last_state:
+            self.apply_state(state)
+            state.pop("items", None) # 名單只在版本改變時附帶，不納入比較
+            self._last_state = state
+
+        spinning = bool(state and (state.get("wheel") or {}).get("spinning"))
+        flying = bool(state and state.get("flights"))
+        next_interval = SPIN_INTERVAL_MS if spinning or flying else IDLE_INTERVAL_MS
+        if state and state.get("idle"):
+            next_interval = MAX_INTERVAL_MS # [新增] 大螢幕閒置中：只剩呼吸燈，降到最低頻率
+        if late_ms > LATE_THRESHOLD_MS:
+            next_interval = max(next_interval, self.interval_ms * 2)
+        self._schedule(next_interval)
@@ -3,86 +3,375 @@ effects.py
 ----------
 描述：視覺特效元件庫。
 功能：包含應用程式中使用的各種裝飾性特效元件：
-      1. ConfettiWidget: 慶祝彩帶/紙花飄落特效。
+      1. ConfettiWidget: 慶祝彩帶/紙花飄落特效 (一般模式 / 大獎模式)。
       2. WinnerOverlay: 中獎時彈出的全螢幕遮罩 (顯示獎項與得主)。
-      3. FlyingLabel: 名字飛入名單的過渡動畫標籤。
+      3. FlyInLayer: 名字飛入名單的過渡動畫 (Sprite 圖層，可同時多個)。
+      4. DimmedSnapshot: 專注模式下以快取截圖取代變暗的面板。
 """
-import random
+import time
+import numpy as np
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtCore import Qt, QPropertyAnimation, QVariantAnimation, QEasingCurve, QPointF, QRectF, QRect, QPoint
+from PyQt5.QtGui import QPainter, QColor, QPixmap, QFont, QFontMetrics, QRegion
 from utils.config import COLORS
+from utils.frame_clock import frame_clock
+from utils.quality_governor import quality_governor
+
+CONFETTI_STEP_S = 0.02 # 彩帶原本的更新間隔 (一般模式的速度以「像素 / 20ms」設定)
+NORMAL_PARTICLE_COUNT = 100     # [設定] 一般模式的彩帶數量
+GRAND_PARTICLE_COUNT = 5000     # [設定] 大獎模式的紙花數量 (以 1920x1080 為基準，小視窗依面積等比減少；實際繪製數量另受畫面預算限制)
+GRAND_GRAVITY = 500.0           # [設定] 大獎模式重力加速度 (像素 / 秒²)
+GRAND_TERMINAL_SPEED = 380.0    # [設定] 大獎模式最大落下速度 (空氣阻力)
+GRAND_FLUTTER_AMP = 60.0        # [設定] 大獎模式左右飄動幅度 (像素 / 秒)
+CONFETTI_BUDGET_RATIO = 0.35    # [設定] 彩帶繪製最多使用幀預算的比例，超過時減少繪製數量
+SPRITE_CELL = 24                # Atlas 每格大小 (可容納旋轉後的紙花)
+DOT_SIZES = (5, 6, 7, 8, 9, 10) # 一般模式圓點的直徑 (與原本 5~10 像素相同)
+PAPER_SIZES = (9, 12, 15)       # 大獎模式紙花的長度 (短邊為一半)
+PAPER_ROTATIONS = 12            # 紙花旋轉角度的分級 (0~180 度，長方形轉 180 度相同)
+PAPER_FLIPS = 4                 # 紙花翻面 (垂直壓扁) 的分級
+
 
 class ConfettiWidget(QWidget):
-    def __init__(self, parent=None):
+    """
+    [修改] 彩帶特效 (NumPy Struct-of-Arrays)
+    - 位置、速度、大小、顏色、旋轉、飄動相位各存成一個陣列，整批向量化更新與重生
+    - 旋轉 / 翻面 / 大小事先畫進 Sprite Atlas，繪製時每片紙花只是不縮放、不旋轉的貼圖 (最快的 raster 路徑)
+    - PixmapFragment 只在配置時建立一次，每幀只更新位置與 Atlas 來源座標
+    - 依實際繪製時間調整繪製數量，維持在 CONFETTI_BUDGET_RATIO 的幀預算內
+    - start('grand')：大獎模式，數千片紙花，含重力、旋轉與翻面飄動
+    """
+    def __init__(self, parent=None, mirror_mode=False):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.particles = []
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_particles)
+        self.mirror_mode = mirror_mode # 鏡像預覽用：不計入品質調節器
         self.is_active = False
+        self.mode = 'normal'
+        self._rng = np.random.default_rng()
+        self._atlases = {} # 模式 -> Atlas QPixmap
+        self._paint_ms = 0.0 # 繪製時間的移動平均
+        self._allocate(0)
 
-    def start(self):
+    def start(self, mode='normal'):
+        self.mode = mode
         self.is_active = True
-        self.particles = []
-        for _ in range(100):
-            self.particles.append(self._create_particle())
-        self.timer.start(20)
+        if mode == 'grand':
+            area_ratio = min(1.0, max(1, self.width()) * max(1, self.height()) / (1920 * 1080))
+            self._allocate(max(200, int(GRAND_PARTICLE_COUNT * area_ratio)))
+        else:
+            self._allocate(NORMAL_PARTICLE_COUNT)
+        frame_clock().subscribe(self.update_particles) # [修改] 改由全域 FrameClock 驅動
         self.show()
         self.raise_()
 
     def stop(self):
         self.is_active = False
-        self.timer.stop()
+        frame_clock().unsubscribe(self.update_particles)
         self.hide()
 
-    def _create_particle(self):
-        return {
-            'x': random.randint(0, self.width()),
-            'y': random.randint(-self.height(), 0),
-            'speed': random.randint(5, 15),
-            'size': random.randint(5, 10),
-            'color': random.choice(COLORS),
-            'drift': random.uniform(-2, 2)
-        }
-
-    def update_particles(self):
+    @property
+    def particle_count(self):
+        return len(self.x)
+
+    def _allocate(self, n):
+        """建立 n 片彩帶 (一開始分佈在畫面上方一整個螢幕高的範圍內)"""
+        rng = self._rng
+        w, h = max(1, self.width()), max(1, self.height())
+        self.x = rng.uniform(0, w, n)
+        self.y = rng.uniform(-h, 0, n)
+        self.color = rng.integers(0, len(COLORS), n)
+        if self.mode == 'grand':
+            self.vx = rng.uniform(-40, 40, n)
+            self.vy = rng.uniform(50, 300, n)
+            self.size_idx = rng.integers(0, len(PAPER_SIZES), n)
+            self.size = np.take(PAPER_SIZES, self.size_idx).astype(float)
+            self.rot = rng.uniform(0, 360, n)
+            self.spin = rng.uniform(-360, 360, n)     # 度 / 秒
+            self.phase = rng.uniform(0, 2 * np.pi, n)
+            self.flutter = rng.uniform(3, 8, n)       # 弧度 / 秒 (翻面與左右飄動的頻率)
+        else:
+            # 與原本相同的外觀：每 20ms 落下 5~15 像素、左右漂移 ±2 像素的圓點
+            self.vx = rng.uniform(-2, 2, n) / CONFETTI_STEP_S
+            self.vy = rng.integers(5, 16, n) / CONFETTI_STEP_S
+            self.size_idx = rng.integers(0, len(DOT_SIZES), n)
+            self.size = np.take(DOT_SIZES, self.size_idx).astype(float)
+            self.rot = np.zeros(n)
+            self.spin = np.zeros(n)
+            self.phase = np.zeros(n)
+            self.flutter = np.zeros(n)
+        # 每片彩帶一個可重複使用的 PixmapFragment (固定大小，不縮放、不旋轉)
+        self._fragments = [QPainter.PixmapFragment.create(QPointF(), QRectF(0, 0, SPRITE_CELL, SPRITE_CELL))
+                           for _ in range(n)]
+        self._draw_limit = n
+
+    def update_particles(self, dt=CONFETTI_STEP_S):
         if not self.is_active: return
-        for p in self.particles:
-            p['y'] += p['speed']
-            p['x'] += p['drift']
-            if p['y'] > self.height():
-                # Reset to top
-                p['y'] = random.randint(-50, 0)
-                p['x'] = random.randint(0, self.width())
-        self.update()
+        if self.mode == 'grand':
+            np.minimum(self.vy + GRAND_GRAVITY * dt, GRAND_TERMINAL_SPEED, out=self.vy)
+            self.phase += self.flutter * dt
+            self.rot += self.spin * dt
+            self.x += (self.vx + np.sin(self.phase) * GRAND_FLUTTER_AMP) * dt
+        else:
+            self.x += self.vx * dt
+        self.y += self.vy * dt
+
+        # 掉出畫面底部的彩帶重生到上方 (整批處理)
+        out = self.y > self.height()
+        k = int(np.count_nonzero(out))
+        if k:
+            self.y[out] = self._rng.uniform(-50, 0, k)
+            self.x[out] = self._rng.uniform(0, max(1, self.width()), k)
+            if self.mode == 'grand':
+                self.vy[out] = self._rng.uniform(50, 300, k)
+        frame_clock().request_update(self)
+
+    def _atlas(self):
+        """
+        預先畫好所有外觀的 Atlas (每格 SPRITE_CELL)：
+        - 一般模式：欄 = 顏色，列 = 圓點大小
+        - 大獎模式：欄 = 顏色 x 旋轉分級，列 = 紙花大小 x 翻面分級
+        """
+        atlas = self._atlases.get(self.mode)
+        if atlas is not None:
+            return atlas
+        grand = self.mode == 'grand'
+        cols = len(COLORS) * (PAPER_ROTATIONS if grand else 1)
+        rows = len(PAPER_SIZES) * PAPER_FLIPS if grand else len(DOT_SIZES)
+        atlas = QPixmap(SPRITE_CELL * cols, SPRITE_CELL * rows)
+        atlas.fill(Qt.transparent)
+        p = QPainter(atlas)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        half = SPRITE_CELL / 2
+        for c, color in enumerate(COLORS):
+            p.setBrush(color)
+            if not grand:
+                for r, d in enumerate(DOT_SIZES):
+                    p.drawEllipse(QRectF(c * SPRITE_CELL + half - d / 2, r * SPRITE_CELL + half - d / 2, d, d))
+                continue
+            for k in range(PAPER_ROTATIONS):
+                for si, length in enumerate(PAPER_SIZES):
+                    for f in range(PAPER_FLIPS):
+                        p.save()
+                        p.translate((c * PAPER_ROTATIONS + k) * SPRITE_CELL + half,
+                                    (si * PAPER_FLIPS + f) * SPRITE_CELL + half)
+                        p.rotate(k * 180.0 / PAPER_ROTATIONS)
+                        # 翻面：短邊依 |cos(相位)| 壓扁 (0.15 ~ 1.0)
+                        flip = 0.15 + 0.85 * (f + 0.5) / PAPER_FLIPS
+                        h = length * 0.5 * flip
+                        p.drawRect(QRectF(-length / 2, -h / 2, length, h))
+                        p.restore()
+        p.end()
+        self._atlases[self.mode] = atlas
+        return atlas
 
     def paintEvent(self, event):
-        if not self.is_active: return
+        if not self.is_active or not len(self.x): return
+        paint_start = time.perf_counter()
+        governor = quality_governor()
+        atlas = self._atlas()
+
+        # 只畫畫面內的彩帶 (最多 _draw_limit 片)；品質調節器要求時數量再減半
+        visible = np.flatnonzero(self.y > -self.size)
+        if len(visible) > self._draw_limit:
+            visible = visible[:self._draw_limit]
+        if not governor.enabled("confetti"):
+            visible = visible[::2]
+        if not len(visible):
+            return
+
+        # Atlas 來源座標 (整批以 NumPy 計算)
+        if self.mode == 'grand':
+            rot_idx = ((self.rot[visible] % 180.0) * (PAPER_ROTATIONS / 180.0)).astype(int) % PAPER_ROTATIONS
+            flip = np.abs(np.cos(self.phase[visible]))
+            flip_idx = np.minimum((flip * PAPER_FLIPS).astype(int), PAPER_FLIPS - 1)
+            src_x = (self.color[visible] * PAPER_ROTATIONS + rot_idx) * SPRITE_CELL
+            src_y = (self.size_idx[visible] * PAPER_FLIPS + flip_idx) * SPRITE_CELL
+        else:
+            src_x = self.color[visible] * SPRITE_CELL
+            src_y = self.size_idx[visible] * SPRITE_CELL
+
+        # [優化] 重複使用 PixmapFragment，只更新位置與來源座標 (不再每幀建立數千個 Qt 物件)
+        fragments = self._fragments
+        fragments = [fragments[i] for i in visible.tolist()]
+        for frag, x, y, sx, sy in zip(fragments, self.x[visible].tolist(), self.y[visible].tolist(),
+                                      src_x.tolist(), src_y.tolist()):
+            frag.x = x
+            frag.y = y
+            frag.sourceLeft = sx
+            frag.sourceTop = sy
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        for p in self.particles:
-            painter.setBrush(p['color'])
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(int(p['x']), int(p['y']), p['size'], p['size'])
-
-
-class FlyingLabel(QLabel):
-    """飛行動畫用的臨時標籤"""
-    def __init__(self, text, parent=None):
-        super().__init__(text, parent)
-        self.setStyleSheet("color: gold; font-weight: bold; font-size: 40px; background: transparent;")
+        painter.drawPixmapFragments(fragments, atlas)
+        painter.end()
+
+        paint_ms = (time.perf_counter() - paint_start) * 1000.0
+        self._fit_budget(paint_ms, len(visible))
+        # [新增] 彩帶的繪製時間也計入畫面預算 (與同一幀的轉盤加總)，「彩帶減半」才會依實際負載啟動
+        if not self.mirror_mode:
+            governor.record(paint_ms)
+
+    def _fit_budget(self, paint_ms, drawn):
+        """依繪製時間的移動平均調整最多繪製的數量 (超出預算就減少，長時間有餘裕再慢慢增加)"""
+        self._paint_ms = self._paint_ms * 0.8 + paint_ms * 0.2
+        budget = frame_clock().frame_interval_ms * CONFETTI_BUDGET_RATIO
+        if self._paint_ms > budget and drawn > 100:
+            self._draw_limit = max(100, int(drawn * budget / self._paint_ms))
+            self._paint_ms = budget # 重新累積，避免連續多幀重複削減
+        elif self._paint_ms < budget * 0.5 and self._draw_limit < len(self.x):
+            self._draw_limit = min(len(self.x), int(self._draw_limit * 1.05) + 1)
+
+
+class FlyInLayer(QWidget):
+    """
+    [修改] 名字飛入名單的 Sprite 圖層 (取代每幀換字體、重新排版的 FlyingLabel)
+    - 名字只在最大倍率下繪製一次成 QPixmap，動畫過程只改變位置與縮放
+    - 可同時進行多個飛入動畫 (連續確認多位中獎者)，每幀只重繪 Sprite 經過的範圍
+    """
+    MAX_SCALE = 2.5     # 起點倍率 (終點為 1.0 倍)
+    BASE_PIXEL_SIZE = 40 # 與原本 FlyingLabel 的 font-size: 40px 相同 (像素，非點數)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.adjustSize()
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self._flights = [] # 進行中的飛入：{"sprite", "rect", "anim"}
+        self.hide()
+
+    @property
+    def active_count(self):
+        return len(self._flights)
+
+    def snapshot(self):
+        """[新增] 進行中的飛入 (名字與目前的繪製範圍)，供控制台鏡像重現"""
+        return [{"text": f["text"], "rect": [f["rect"].x(), f["rect"].y(), f["rect"].width(), f["rect"].height()]}
+                for f in self._flights if not f["rect"].isNull()]
+
+    def show_snapshot(self, flights, scale=1.0):
+        """[新增] 鏡像模式：依 snapshot() 的位置直接顯示飛入中的名字 (不自行播放動畫)"""
+        sprites = {f["text"]: f["sprite"] for f in self._flights}
+        self._flights = []
+        for f in flights:
+            x, y, w, h = f["rect"]
+            sprite = sprites.get(f["text"]) or self._render_sprite(f["text"])
+            sprites[f["text"]] = sprite
+            self._flights.append({"text": f["text"], "sprite": sprite, "anim": None,
+                                  "rect": QRect(int(x * scale), int(y * scale),
+                                                int((w - 2) * scale) + 2, int((h - 2) * scale) + 2)})
+        self.resize(self.parentWidget().size())
+        self.setVisible(bool(self._flights))
+        if self._flights:
+            self.raise_()
+        self.update()
+
+    def _render_sprite(self, text):
+        font = QFont(self.font())
+        font.setBold(True)
+        font.setPixelSize(int(self.BASE_PIXEL_SIZE * self.MAX_SCALE))
+        metrics = QFontMetrics(font)
+        size = metrics.size(0, text)
+        dpr = self.devicePixelRatioF()
+        sprite = QPixmap(int(size.width() * dpr) + 2, int(size.height() * dpr) + 2)
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+        p = QPainter(sprite)
+        p.setRenderHint(QPainter.TextAntialiasing)
+        p.setFont(font)
+        p.setPen(QColor("gold"))
+        p.drawText(QRectF(0, 0, size.width() + 1, size.height() + 1), Qt.AlignCenter, text)
+        p.end()
+        return sprite
+
+    def fly(self, text, start, ctrl, end, duration_ms=1200, on_finished=None):
+        """沿二次貝茲曲線 (start -> ctrl -> end) 飛行，倍率由 MAX_SCALE 縮到 1.0"""
+        flight = {"text": text, "sprite": self._render_sprite(text), "rect": QRect(), "anim": QVariantAnimation(self)}
+        anim = flight["anim"]
+        anim.setDuration(duration_ms)
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setEasingCurve(QEasingCurve.InOutQuad)
+
+        def update_step(t):
+            # 貝茲曲線公式: (1-t)^2 * P0 + 2(1-t)t * P1 + t^2 * P2
+            x = (1-t)**2 * start.x() + 2*(1-t)*t * ctrl.x() + t**2 * end.x()
+            y = (1-t)**2 * start.y() + 2*(1-t)*t * ctrl.y() + t**2 * end.y()
+            scale = (self.MAX_SCALE - (self.MAX_SCALE - 1.0) * t) / self.MAX_SCALE
+            sprite = flight["sprite"]
+            w = sprite.width() / sprite.devicePixelRatio() * scale
+            h = sprite.height() / sprite.devicePixelRatio() * scale
+            old = flight["rect"]
+            flight["rect"] = QRect(int(x), int(y), int(w) + 2, int(h) + 2)
+            frame_clock().request_update(self, QRegion(old).united(QRegion(flight["rect"])))
+
+        def finished():
+            self._flights.remove(flight)
+            frame_clock().request_update(self, QRegion(flight["rect"]))
+            anim.deleteLater()
+            if not self._flights:
+                self.hide()
+            if on_finished is not None:
+                on_finished()
+
+        anim.valueChanged.connect(update_step)
+        anim.finished.connect(finished)
+        self._flights.append(flight)
+        self.resize(self.parentWidget().size())
         self.show()
+        self.raise_()
+        update_step(0.0)
+        anim.start()
+
+    def paintEvent(self, event):
+        if not self._flights: return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        for flight in self._flights:
+            rect = flight["rect"]
+            if rect.isNull() or not event.region().intersects(rect):
+                continue
+            sprite = flight["sprite"]
+            painter.drawPixmap(QRectF(rect.x(), rect.y(), rect.width() - 2, rect.height() - 2),
+                               sprite, QRectF(sprite.rect()))
+
+class DimmedSnapshot(QWidget):
+    """
+    [新增] 變暗的面板快照 (取代每幀離屏合成的 QGraphicsOpacityEffect)
+    - capture(): 將來源面板畫成一張已變暗的 QPixmap (只在內容改變後重新擷取)
+    - 顯示時只貼上這張圖，來源面板可先隱藏
+    """
+    def __init__(self, opacity=0.2, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.opacity = opacity
+        self._pixmap = None
+        self.hide()
+
+    def is_valid(self):
+        return self._pixmap is not None
+
+    def invalidate(self):
+        self._pixmap = None
+
+    def capture(self, source):
+        dpr = source.devicePixelRatioF()
+        content = QPixmap(source.size() * dpr)
+        content.setDevicePixelRatio(dpr)
+        content.fill(Qt.transparent)
+        source.render(content, QPoint(), QRegion(), QWidget.DrawChildren | QWidget.DrawWindowBackground)
+
+        dimmed = QPixmap(content.size())
+        dimmed.setDevicePixelRatio(dpr)
+        dimmed.fill(Qt.transparent)
+        p = QPainter(dimmed)
+        p.setOpacity(self.opacity)
+        p.drawPixmap(0, 0, content)
+        p.end()
+        self._pixmap = dimmed
+
+    def paintEvent(self, event):
+        if self._pixmap is not None:
+            QPainter(self).drawPixmap(0, 0, self._pixmap)
 
-    def set_scale(self, scale):
-        # 簡單模擬縮放 (調整字體大小)
-        font = self.font()
-        font.setPointSizeF(40 * scale)
-        self.setFont(font)
-        self.adjustSize()
 
 class WinnerOverlay(QWidget):
     """大螢幕的中獎顯示遮罩"""
@@ -92,24 +381,47 @@ class WinnerOverlay(QWidget):
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
+        self._base_margins = layout.contentsMargins()
+        self._base_spacing = layout.spacing()
         
         self.title_label = QLabel("🎉 恭喜中獎 🎉")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("color: #e74c3c; font-size: 80px; font-weight: bold; margin-bottom: 20px;")
         
         self.prize_label = QLabel("")
         self.prize_label.setAlignment(Qt.AlignCenter)
-        self.prize_label.setStyleSheet("color: #ffffff; font-size: 50px; font-weight: bold; margin-bottom: 10px;")
 
         self.name_label = QLabel("")
         self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setStyleSheet("color: #f1c40f; font-size: 120px; font-weight: bold;")
+        self._scale = None
+        self.set_scale(1.0)
         
         layout.addWidget(self.title_label)
         layout.addWidget(self.prize_label)
         layout.addWidget(self.name_label)
 
+        # 目前顯示的內容 (供鏡像預覽同步)
+        self.current_name = ""
+        self.current_prize = ""
+
+    def set_scale(self, scale):
+        """[新增] 依比例設定字級與間距 (大螢幕為 1.0；控制台鏡像依大螢幕寬度縮小)"""
+        if scale == self._scale:
+            return
+        self._scale = scale
+        px = lambda v: max(6, int(v * scale))
+        m = self._base_margins
+        self.layout().setContentsMargins(int(m.left() * scale), int(m.top() * scale),
+                                         int(m.right() * scale), int(m.bottom() * scale))
+        self.layout().setSpacing(int(self._base_spacing * scale))
+        self.title_label.setStyleSheet(
+            f"color: #e74c3c; font-size: {px(80)}px; font-weight: bold; margin-bottom: {int(20 * scale)}px;")
+        self.prize_label.setStyleSheet(
+            f"color: #ffffff; font-size: {px(50)}px; font-weight: bold; margin-bottom: {int(10 * scale)}px;")
+        self.name_label.setStyleSheet(f"color: #f1c40f; font-size: {px(120)}px; font-weight: bold;")
+
     def show_winner(self, name, prize):
+        self.current_name = name
+        self.current_prize = prize
         self.prize_label.setText(f"🎁 {prize} 🎁")
         self.name_label.setText(name)
         self.show()
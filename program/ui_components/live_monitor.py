@@ -0,0 +1,76 @@
+"""
+live_monitor.py
+---------------
+描述：控制台右下角的「大螢幕即時監控」元件 (Live Monitor)。
+功能：
+      1. 直接以監控視窗的解析度 (320x180) 繪製大螢幕，不再 grab() 全螢幕後縮小。
+      2. 以大螢幕的 frame_serial (重繪計數) 作為 Dirty Flag，畫面沒變就跳過。
+      3. 依實際繪製成本與事件迴圈延遲自動調整更新頻率，轉盤轉動時更保守，
+         確保監控不會搶走觀眾端動畫的時間。
+"""
+import time
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import QTimer
+
+MIN_INTERVAL_MS = 100     # [設定] 最快更新間隔 (10 FPS)
+MAX_INTERVAL_MS = 1000    # [設定] 最慢更新間隔
+IDLE_BUDGET_RATIO = 0.05  # [設定] 平時最多佔用 GUI 執行緒 5% 時間
+SPIN_BUDGET_RATIO = 0.02  # [設定] 轉盤轉動時最多佔用 2% 時間
+LATE_THRESHOLD_MS = 8     # [設定] Timer 延遲超過此值代表 GUI 執行緒忙碌，自動降頻
+
+
+class LiveMonitor(QLabel):
+    """
+    低負載即時監控
+    - source 需提供 frame_serial 屬性與 render_preview(size) 方法 (DisplayWindow)
+    """
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.interval_ms = MIN_INTERVAL_MS
+        self._last_serial = None
+        self._expected_at = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_tick)
+        self._schedule(MIN_INTERVAL_MS)
+
+    def _schedule(self, interval_ms):
+        self.interval_ms = int(max(MIN_INTERVAL_MS, min(MAX_INTERVAL_MS, interval_ms)))
+        self._expected_at = time.perf_counter() + self.interval_ms / 1000.0
+        self._timer.start(self.interval_ms)
+
+    def _source_is_busy(self):
+        wheel = getattr(self.source, 'wheel', None)
+        return bool(wheel is not None and wheel.is_spinning)
+
+    def _on_tick(self):
+        now = time.perf_counter()
+        late_ms = (now - self._expected_at) * 1000.0 if self._expected_at else 0.0
+
+        if not self.isVisible() or not self.source.isVisible():
+            self._schedule(MAX_INTERVAL_MS)
+            return
+
+        # Dirty Flag：大螢幕自上次截圖後沒有任何重繪 -> 跳過
+        serial = self.source.frame_serial
+        if serial == self._last_serial:
+            self._schedule(self.interval_ms)
+            return
+
+        start = time.perf_counter()
+        pixmap = self.source.render_preview(self.size())
+        cost_ms = (time.perf_counter() - start) * 1000.0
+        self._last_serial = self.source.frame_serial
+        if pixmap is not None:
+            self.setPixmap(pixmap)
+
+        # 依繪製成本換算下一次間隔 (成本 / 預算比例)，GUI 忙碌時再加倍
+        ratio = SPIN_BUDGET_RATIO if self._source_is_busy() else IDLE_BUDGET_RATIO
+        next_interval = cost_ms / ratio
+        if late_ms > LATE_THRESHOLD_MS:
+            next_interval = max(next_interval, self.interval_ms * 2)
+        if getattr(self.source, 'idle_mode', False):
+            next_interval = MAX_INTERVAL_MS # [新增] 大螢幕閒置中：只剩呼吸燈，降到最低頻率
+        self._schedule(next_interval)
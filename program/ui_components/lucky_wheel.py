@@ -9,30 +9,150 @@ lucky_wheel.py
       4. 處理 LED 跑馬燈特效。
 """
 import os
+import time
 import random
 import math
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt, QTimer, QUrl, QPropertyAnimation, QEasingCurve, QRectF, pyqtSignal, pyqtProperty, QPoint
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QPainterPath, QPixmap, QBrush, QLinearGradient
+from PyQt5.QtCore import Qt, QTimer, QUrl, QPropertyAnimation, QEasingCurve, QRectF, pyqtSignal, pyqtProperty, QPoint, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QRadialGradient, QPainterPath, QPixmap, QBrush, QLinearGradient, QRegion, QImage, QConicalGradient
 from PyQt5.QtMultimedia import QSoundEffect
 from utils.config import COLORS, resource_path
+from utils.avatar_cache import avatar_cache, AVATAR_SIZE
+from utils.image_loader import read_pixmap
+from utils.frame_clock import frame_clock
+from utils.quality_governor import quality_governor
+from utils.layer_renderer import LayerRenderer
+from utils.config import IDLE_LED_INTERVAL_MS, IDLE_BREATH_RATE, WHEEL_LED_COUNT
+
+SPIN_STEP_S = 0.01          # 物理模擬固定步長 (秒)，速度單位為「度/步」
+MAX_CATCHUP_STEPS = 500     # 單次 Timer 最多補足的步數 (避免長時間卡頓後一次算太久)
+LED_INTERVAL_MS = 50        # LED 動畫更新間隔 (20 FPS 順暢度足夠)
+LED_BASE_COUNT = 36         # 跑馬燈速度與拖尾長度的基準燈泡數
+FACE_SCALE_FAST = 0.5       # 高速轉動 (> 20) 時轉盤面的內部解析度
+FACE_SCALE_MEDIUM = 0.75    # 中速轉動 (> 8) 時轉盤面的內部解析度
+FACE_MAX_SECTORS = 720      # [設定] 轉盤面最多繪製的扇形數 (超過時每格不到半度，改畫固定數量的色塊)
+FACE_MIN_LABEL_ARC = 4.0    # [設定] 每格外緣弧長 (像素) 小於此值時不繪製名字 (字已疊成一團)
+FACE_SYNC_LIMIT = 200       # [設定] 超過此人數時不在 GUI 執行緒直接繪製轉盤面，背景渲染完成前先顯示替代圖
+FACE_REQUEST_DELAY_MS = 150 # [設定] 名單連續變更時，停止變更後才排入背景渲染
+
+# LED Sprite Atlas 的顏色 (欄位順序)
+LED_SPRITE_COLORS = [
+    (255, 255, 255), # 頻閃 超亮白
+    (255, 255, 200), # 跑馬頭 (稍微白一點)
+    (255, 165, 0),   # 跑馬燈 亮橘
+    (255, 69, 0),    # 呼吸燈 紅橙
+    (255, 215, 0),   # 呼吸燈 金
+]
+LED_WHITE, LED_HEAD, LED_ORANGE, LED_RED, LED_GOLD = range(len(LED_SPRITE_COLORS))
+SPIN_PLAN_VERSION = 1
+
+def paint_face(painter, items, radius, text_shadow=True):
+    """
+    繪製扇形與獎項文字 (painter 原點為圓心，已套用轉盤角度；可在背景執行緒對 QImage 使用)
+    [優化] 名單很大時簡化：格子小到看不出字就不畫名字，超過 FACE_MAX_SECTORS 格只畫固定數量的色塊，
+    繪製時間不再隨人數增加 (5 萬人從約 18 秒降到 1 秒內)。
+    """
+    n = len(items)
+    detailed = n <= FACE_MAX_SECTORS
+    sectors = n if detailed else FACE_MAX_SECTORS
+    slice_angle = 360 / sectors
+    pen = QPen(Qt.white, 3) if detailed else QPen(Qt.NoPen)
+
+    # Loop 1: 繪製扇形 (背景)
+    for i in range(sectors):
+        painter.save()
+        painter.rotate(-i * slice_angle)
+
+        base_c = COLORS[i % len(COLORS)]
+
+        # 建立線性漸層 (從圓心往外)
+        grad = QLinearGradient(0, 0, radius, 0)
+        grad.setColorAt(0.0, base_c.darker(130))
+        grad.setColorAt(0.5, base_c.lighter(140))
+        grad.setColorAt(1.0, base_c.darker(130))
+
+        painter.setBrush(QBrush(grad))
+        painter.setPen(pen)
+
+        path = QPainterPath()
+        path.moveTo(0, 0)
+        path.arcTo(-radius, -radius, radius*2, radius*2, 0, -slice_angle)
+        path.closeSubpath()
+        painter.drawPath(path)
+        painter.restore()
+
+    if not detailed or 2 * math.pi * radius * 0.95 / n < FACE_MIN_LABEL_ARC:
+        return
+
+    # Loop 2: 繪製文字 (確保文字永遠在扇形上方，且清晰可見)
+    for i in range(n):
+        painter.save()
+        try:
+            # 計算文字角度 (每個扇區的中間線)
+            mid_angle = -i * slice_angle - slice_angle / 2
+            painter.rotate(-mid_angle) 
+
+            font_size = max(10, int(radius * 0.08))
+            if n > 12: font_size = int(font_size * 0.8)
+            font = QFont("Microsoft JhengHei", font_size, QFont.Bold)
+            painter.setFont(font)
+
+            text_rect = QRectF(radius*0.2, -30, radius*0.75, 60)
+            text_str = items[i]
+
+            # [新增] 文字陰影 (Drop Shadow) - 解決金色背景吃字問題
+            if text_shadow:
+                painter.setPen(QColor(0, 0, 0, 120)) # 半透明黑
+                # 稍微偏移畫一次黑色的
+                painter.drawText(text_rect.translated(2, 2), Qt.AlignRight | Qt.AlignVCenter, text_str)
+
+            # 畫白色正文
+            painter.setPen(Qt.white)
+            painter.drawText(text_rect, Qt.AlignRight | Qt.AlignVCenter, text_str)
+
+        finally:
+            painter.restore()
+
+
+def render_face_image(items, radius, angle, text_shadow=True):
+    """[新增] 在背景執行緒以 QImage 繪製指定角度的轉盤面 (邊長取偶數，貼回時不必重新取樣)"""
+    half = radius + 3 # 含白色框線
+    size = int(math.ceil(half)) * 2
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    try:
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(size / 2, size / 2)
+        painter.rotate(angle)
+        paint_face(painter, items, radius, text_shadow)
+    finally:
+        painter.end()
+    return image
+
 
 class LuckyWheelWidget(QWidget):
     spinFinished = pyqtSignal(str)
+    winnerPicked = pyqtSignal(str, int) # [新增] 中獎者與格子位置 (於 spinFinished 之前發出，同名時據此分辨)
+    spinPlanned = pyqtSignal(dict)  # [新增] 本機開始轉動時發出轉動計畫 (供其他大螢幕節點重現)
+    spinReleased = pyqtSignal(dict) # [新增] 長按放開：{"step": 放開時的物理步數}
     
     def get_angle(self):
         return self.current_angle
 
     def set_angle(self, val):
         self.current_angle = val
-        self.update()
+        frame_clock().request_update(self)
         self._process_tick_logic_only() # 在動畫模式下，只處理由角度變動觸發的單音
 
     angle = pyqtProperty(float, fget=get_angle, fset=set_angle)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, mirror_mode=False):
         super().__init__(parent)
+        # [新增] mirror_mode: 僅依外部狀態 (apply_state) 繪製的鏡像轉盤，不載入音效、不啟動 LED Timer
+        self.mirror_mode = mirror_mode
         self.items = ["員工A", "員工B", "員工C", "員工D", "員工E"] 
+        self.items_rev = 0 # 名單版本號 (每次 set_items 遞增，鏡像端據此判斷是否需要重傳名單)
         self.current_angle = 0
         self.rotation_speed = 0
         self.is_spinning = False
@@ -44,7 +164,7 @@ class LuckyWheelWidget(QWidget):
         # 音效設定 (建立音效池以支援多重發聲)
         self.tick_sounds = []
         self.tick_index = 0
-        if os.path.exists(resource_path("assets/sounds/tick.wav")):
+        if not mirror_mode and os.path.exists(resource_path("assets/sounds/tick.wav")):
             for _ in range(50): # 建立 50 個音效實例，避免快速轉動時不夠用
                 effect = QSoundEffect()
                 effect.setSource(QUrl.fromLocalFile(resource_path("assets/sounds/tick.wav")))
@@ -57,22 +177,42 @@ class LuckyWheelWidget(QWidget):
         self.snd_slow = self._load_loop_sound(resource_path("assets/sounds/slow.wav"))
         self.current_sound_mode = None # None, 'fast', 'medium', 'slow'
 
-        # 轉盤邏輯
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_spin)
+        # 轉盤邏輯 ([修改] 改由全域 FrameClock 驅動，轉動時才訂閱)
         self.last_sector_index = -1
+        self.spin_plan = None       # 目前的轉動計畫
+        self._spin_origin = 0.0     # 計畫起點 (本機 time.time())
+        self._spin_steps = 0        # 已執行的物理步數
+        self._release_step = None   # 長按放開的步數
         
         # 圖片資源
         self.presenter_pixmap = None 
         self.logo_pixmap = None
+        self._pending_avatar = None # (路徑, 裁切模式)：等待背景渲染完成的頭像
+        self.presenter_source = None # (路徑, 裁切模式)：目前設定的頭像來源 (供鏡像同步)
+        avatar_cache().avatarReady.connect(self._on_avatar_ready)
         self.load_default_logo()
 
         # LED 裝飾邏輯
-        self.led_count = 36
+        self.led_count = WHEEL_LED_COUNT
+        self._led_positions = None  # ((半徑, 數量), [QPointF])：燈泡位置快取
+        self._led_sprites = None    # (格子大小, Atlas, [來源矩形])：燈泡 Sprite 快取
+        self._streak = None         # (長度, Sprite, 半寬)：速度線 Sprite 快取
+        self._spotlight = None      # ((寬, 高), QPixmap)：聚光燈遮罩快取
+        self._face_cache_key = None # (名單版本, 半徑, 文字陰影)：低解析度轉盤面快取的依據
+        self._face_cache = {}       # 縮放比例 -> 未旋轉的轉盤面 QPixmap
+        self._face_buffer = None    # 旋轉用的低解析度緩衝區 (重複使用)
+        self._layers = LayerRenderer(self) # [新增] 靜止轉盤面的背景渲染
+        self._layers.layerReady.connect(lambda _name: self.invalidate('face'))
+        self._face_request = None   # (key, 半徑, 角度, 文字陰影)：等待排入背景渲染的轉盤面
+        self._face_request_timer = QTimer(self)
+        self._face_request_timer.setSingleShot(True)
+        self._face_request_timer.timeout.connect(self._request_face_render)
         self.led_phase = 0.0
-        self.led_timer = QTimer(self)
-        self.led_timer.timeout.connect(self.update_leds)
-        self.led_timer.start(50) # 20 FPS for LEDs (順暢度足夠)
+        self.idle_mode = False      # [新增] 閒置省電模式 (由 DisplayWindow 切換)
+        self._damage_regions = None # (寬, 高, {名稱: QRegion})：各特效的重繪範圍快取 (依尺寸)
+        if not mirror_mode:
+            frame_clock().subscribe(self.update_leds, LED_INTERVAL_MS)
+        self.strobe_on = False
 
         # 震動特效偏移量
         self.shake_offset = QPoint(0, 0)
@@ -82,7 +222,7 @@ class LuckyWheelWidget(QWidget):
         self.max_speed = 50.0
 
     def _load_loop_sound(self, filename):
-        if os.path.exists(filename):
+        if not self.mirror_mode and os.path.exists(filename):
             snd = QSoundEffect(self)
             snd.setSource(QUrl.fromLocalFile(filename))
             snd.setLoopCount(QSoundEffect.Infinite)
@@ -92,7 +232,7 @@ class LuckyWheelWidget(QWidget):
 
     def load_default_logo(self):
         if os.path.exists(resource_path("assets/images/logo.png")):
-            self.logo_pixmap = QPixmap(resource_path("assets/images/logo.png"))
+            self.logo_pixmap = read_pixmap(resource_path("assets/images/logo.png"), AVATAR_SIZE)
 
     def set_items(self, items_text):
         if isinstance(items_text, list):
@@ -101,95 +241,172 @@ class LuckyWheelWidget(QWidget):
             self.items = []
         else:
             self.items = [line.strip() for line in items_text.split('\n') if line.strip()]
+        self.items_rev += 1
+        self.update()
+
+    def remove_item(self, index):
+        """[新增] 只移除一格 (名單模型的增量更新，不必重新解析整份名單)"""
+        if not 0 <= index < len(self.items):
+            return
+        self.items = self.items[:index] + self.items[index + 1:]
+        self.items_rev += 1
+        self.update()
+
+    def insert_items(self, index, names):
+        """[新增] 在 index 之前插入多格"""
+        index = max(0, min(index, len(self.items)))
+        self.items = self.items[:index] + list(names) + self.items[index:]
+        self.items_rev += 1
+        self.update()
+
+    def rename_item(self, index, name):
+        """[新增] 更改單一格的名字"""
+        if not 0 <= index < len(self.items):
+            return
+        self.items = self.items[:index] + [name] + self.items[index + 1:]
+        self.items_rev += 1
+        self.update()
+
+    def get_state(self):
+        """[新增] 取得繪製所需的轉盤狀態 (可序列化為 JSON)，供鏡像預覽 / 跨程序同步使用"""
+        return {
+            "items_rev": self.items_rev,
+            "angle": self.current_angle,
+            "speed": self.rotation_speed,
+            "spinning": self.is_spinning,
+            "led_phase": self.led_phase,
+            "strobe_on": self.strobe_on,
+            "avatar": list(self.presenter_source) if self.presenter_source else None,
+        }
+
+    def apply_state(self, state, items=None):
+        """[新增] 套用 get_state() 的狀態 (鏡像轉盤用)；items 僅在名單版本改變時需要提供"""
+        if items is not None:
+            self.items = list(items)
+            self.items_rev = state.get("items_rev", self.items_rev)
+        self.current_angle = state.get("angle", self.current_angle)
+        self.rotation_speed = state.get("speed", self.rotation_speed)
+        self.is_spinning = state.get("spinning", self.is_spinning)
+        self.led_phase = state.get("led_phase", self.led_phase)
+        self.strobe_on = state.get("strobe_on", self.strobe_on)
+        avatar = state.get("avatar")
+        avatar = tuple(avatar) if avatar else None
+        if avatar != self.presenter_source:
+            # 頭像使用共用的 AvatarCache，與大螢幕共享同一份渲染結果
+            if avatar:
+                self.set_presenter_avatar(*avatar)
+            else:
+                self.set_presenter_avatar(None)
         self.update()
 
     def set_presenter_avatar(self, image_path, crop_mode='smart'):
         # crop_mode: 'smart' (自動縮放裁切上半身), 'fit' (填滿圓形)
-        size = 900 # [設定] 轉盤中心頭像的清晰度 (尺寸越大越清晰)
+        # [修改] 頭像改由 AvatarCache 於背景執行緒預先渲染，這裡只做 Pixmap 切換
+        # 若尚未準備好，先顯示 LOGO，待 avatarReady 後自動換上 (不阻塞 GUI 執行緒)
+        self._pending_avatar = None
+        self.presenter_source = (image_path, crop_mode) if image_path else None
         try:
             if image_path and os.path.exists(image_path):
-                original = QPixmap(image_path)
-                if original.isNull():
-                    print(f"[LuckyWheel] Error: Failed to load image from {image_path}")
-                    self.presenter_pixmap = None
+                cache = avatar_cache()
+                pix = cache.get(image_path, crop_mode)
+                if pix is not None:
+                    self.presenter_pixmap = pix
                 else:
-                    if crop_mode == 'smart':
-                        # [優化] 自動裁切邏輯：頂部居中裁切 (Top-Center Crop) + 自動縮放 (Zoom)
-                        # 透過 zoom_factor 放大圖片，只取上半身特寫
-                        zoom_factor = 1.8  # [設定] 縮放係數：1.0=原圖裁切, 1.35=半身特寫, 1.5=大頭特寫
-                        
-                        target_w = int(size * zoom_factor)
-                        target_h = int(size * zoom_factor)
-                        
-                        # 1. 等比縮放至填滿 (size * zoom) 的區域
-                        scaled = original.scaled(target_w, target_h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                        
-                        # 2. 計算裁切位置 (保留水平中心，垂直靠上)
-                        # 這樣可以確保裁切出的是 "放大的上半身"
-                        crop_x = (scaled.width() - size) // 2
-                        
-                        # [微調] 垂直偏移：稍微往下挪一點點 (避免頭頂切太齊)，但主要還是靠上
-                        crop_y = 0 
-                        if crop_x < 0: crop_x = 0
-                        
-                        # 3. 取得裁切後的正方形 (size x size)
-                        cropped = scaled.copy(crop_x, crop_y, size, size)
-                        final_pix = cropped
-                        
-                    else:
-                        # [還原] 一般填滿模式 (Fit) - 用於電腦端選取時
-                        # 直接縮放至填滿圓形 (KeepAspectRatioByExpanding) 然後居中裁切
-                        scaled = original.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                        
-                        crop_x = (scaled.width() - size) // 2
-                        crop_y = (scaled.height() - size) // 2
-                        
-                        cropped = scaled.copy(crop_x, crop_y, size, size)
-                        final_pix = cropped
-
-                    self.presenter_pixmap = QPixmap(size, size)
-                    self.presenter_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(self.presenter_pixmap)
-                    try:
-                        painter.setRenderHint(QPainter.Antialiasing)
-                        path = QPainterPath()
-                        path.addEllipse(0, 0, size, size)
-                        painter.setClipPath(path)
-                        # 繪製裁切好的正方形
-                        painter.drawPixmap(0, 0, final_pix)
-                    finally:
-                        painter.end()
+                    self.presenter_pixmap = None
+                    self._pending_avatar = (os.path.abspath(image_path), crop_mode)
+                    cache.prewarm(image_path)
             else:
                 self.presenter_pixmap = None
         except Exception as e:
              print(f"[LuckyWheel] Exception in set_presenter_avatar: {e}")
              self.presenter_pixmap = None
 
-        self.update()
+        self.invalidate('avatar')
+
+    def _on_avatar_ready(self, image_path, crop_mode):
+        # 背景渲染完成：若正是目前等待中的頭像，立即切換
+        if self._pending_avatar != (image_path, crop_mode):
+            return
+        pix = avatar_cache().get(image_path, crop_mode)
+        if pix is not None:
+            self._pending_avatar = None
+            self.presenter_pixmap = pix
+            self.invalidate('avatar')
 
-    def update_leds(self):
-        # LED 動畫更新
+    def update_leds(self, dt=LED_INTERVAL_MS / 1000.0):
+        # LED 動畫更新 (FrameClock 約每 50ms 呼叫一次，dt 為實際經過秒數)
+        ticks = dt / (LED_INTERVAL_MS / 1000.0)
         # [新增] 頻閃模式判定 (快停下來前)
         if self.is_spinning and 0 < abs(self.rotation_speed) < 8.0:
              # Strobe Light: 快速切換開關
              # 頻率: update_leds 是 50ms 一次，每次切換 = 10Hz 閃爍 (非常快)
-             if not hasattr(self, 'strobe_on'): self.strobe_on = False
              self.strobe_on = not self.strobe_on
         elif self.is_spinning:
             # 跑馬燈模式：速度隨轉速變化
-            # rotation_speed 是 "度/10ms"，這裡 led_timer 是 50ms 一次
+            # rotation_speed 是 "度/10ms"，這裡 LED 是 50ms 一次
             # 讓 LED 跑動速度跟轉盤看起來有連動感
             speed_factor = self.rotation_speed * 0.5 
             if speed_factor < 0.5: speed_factor = 0.5 # 最低速度
-            self.led_phase = (self.led_phase + speed_factor) % self.led_count
+            speed_factor *= self.led_count / LED_BASE_COUNT # 燈泡越多跑越多顆，轉一圈的時間不變
+            self.led_phase = (self.led_phase + speed_factor * ticks) % self.led_count
         else:
-            # 呼吸燈模式
-            self.led_phase += 0.4 # 加快速度製造緊張感
+            # 呼吸燈模式 (閒置時放慢)
+            rate = IDLE_BREATH_RATE if self.idle_mode else 1.0
+            self.led_phase += 0.4 * ticks * rate # 加快速度製造緊張感
         
-        # 如果沒有在轉動 (update_spin 沒在跑)，這裡要觸發 update 讓 LED 動起來
-        if not self.is_spinning:
-            self.update()
+        # 轉動中 update_spin 也會要求重繪，FrameClock 會合併成同一次 paint
+        # [優化] 靜止時只有 LED 在變，只重繪燈環
+        if self.is_spinning:
+            frame_clock().request_update(self)
+        else:
+            self.invalidate('leds')
+
+    def damage_regions(self):
+        """
+        [新增] 各特效的重繪範圍 (幾何與 paintEvent / draw_* 一致，依元件尺寸快取)
+        - glow   : 背景光暈 (半徑 1.1)
+        - face   : 扇形與文字 (含白色框線)
+        - leds   : LED 燈環 (含燈泡光暈)
+        - pointer: 指針 (含陰影與震動位移)
+        - avatar : 中心頭像 / LOGO (含金色框線與「抽獎人」標籤)
+        """
+        w, h = self.width(), self.height()
+        if self._damage_regions is None or self._damage_regions[:2] != (w, h):
+            center = self.rect().center()
+            radius = min(w, h) / 2 * 0.8
+
+            def disk(r):
+                r = int(r) + 1
+                return QRegion(center.x() - r, center.y() - r, r * 2, r * 2, QRegion.Ellipse)
+
+            pointer_len = radius * 0.5 * 0.85
+            pointer_w = radius * 0.25
+            pad = 2 + 3 + 1 # 陰影位移 + 最大震動幅度 + 反鋸齒
+            regions = {
+                "glow": disk(radius * 1.1),
+                "face": disk(radius + 2),
+                "leds": disk(radius * (1.12 + 0.032) + 2).subtracted(disk(max(0, radius * (1.12 - 0.032) - 3))),
+                "pointer": QRegion(int(center.x() - pointer_w / 2 - pad), int(center.y() - pointer_len - pad),
+                                   int(pointer_w + pad * 2), int(pointer_len + pad * 2)),
+                "avatar": disk(radius * 0.25 + 3).united(
+                    QRegion(int(center.x() - 41), int(center.y() + radius * 0.25 - 21), 82, 26)),
+            }
+            self._damage_regions = (w, h, regions)
+        return self._damage_regions[2]
+
+    def invalidate(self, *parts):
+        """[新增] 只重繪指定特效的範圍 (同一畫面內由 FrameClock 合併)"""
+        regions = self.damage_regions()
+        for part in parts:
+            frame_clock().request_update(self, regions[part])
+
+    def set_idle(self, idle):
+        """[新增] 切換閒置省電模式：呼吸燈改用較低的更新頻率"""
+        if idle == self.idle_mode:
+            return
+        self.idle_mode = idle
+        if not self.mirror_mode:
+            frame_clock().subscribe(self.update_leds, IDLE_LED_INTERVAL_MS if idle else LED_INTERVAL_MS)
 
     def _update_sound_volumes(self, mode):
         # 根據模式調整音量 (只開啟對應模式的聲音)
@@ -197,54 +414,107 @@ class LuckyWheelWidget(QWidget):
         if self.snd_medium: self.snd_medium.setVolume(1.0 if mode == 'medium' else 0.0)
         if self.snd_slow: self.snd_slow.setVolume(1.0 if mode == 'slow' else 0.0)
 
-    # [保留 for 相容性] 瞬間啟動 (系統端可能會用到，或者作為 Fallback)
-    def start_spin(self, initial_speed=None):
-        if not self.items or self.is_spinning:
+    # --- 轉動計畫 (Spin Plan) ---
+    # [新增] 每次轉動都由一份可序列化的「轉動計畫」描述：起始時間 / 起始角度 / 初速 / 名單 / 物理參數 / 亂數種子。
+    # 物理改為以牆上時鐘驅動的固定步長 (SPIN_STEP_S)，同一份計畫在任何機器上都會轉出完全相同的結果，
+    # 其他大螢幕節點只需收到計畫 (與放開按鈕的步數) 即可在本地重現，不需傳送影像。
+
+    def make_spin_plan(self, mode, initial_speed=None):
+        """建立轉動計畫 (mode: 'spin' 瞬間啟動 / 'hold' 長按加速)"""
+        seed = random.getrandbits(32)
+        if initial_speed is None:
+            initial_speed = random.Random(seed).uniform(25, 40) if mode == 'spin' else 0.0
+        return {
+            "v": SPIN_PLAN_VERSION,
+            "mode": mode,
+            "seed": seed,
+            "start_at": time.time(),
+            "angle": self.current_angle,
+            "speed": initial_speed,
+            "items": list(self.items),
+            "base_friction": self.base_friction,
+            "peg_friction": self.peg_friction,
+            "max_speed": self.max_speed,
+        }
+
+    def run_spin_plan(self, plan, clock_offset=0.0):
+        """
+        依轉動計畫開始轉動。
+        clock_offset: 本機時鐘 - 計畫來源時鐘 (秒)；計畫的 start_at 已過去時會自動追上進度。
+        """
+        if list(plan.get("items", self.items)) != self.items:
+            self.set_items(list(plan["items"]))
+        if not self.items:
             return
-        
-        if initial_speed is not None:
-             self.rotation_speed = initial_speed
-        else:
-             self.rotation_speed = random.uniform(25, 40)
-             
+        self.spin_plan = plan
+        self.base_friction = plan.get("base_friction", self.base_friction)
+        self.peg_friction = plan.get("peg_friction", self.peg_friction)
+        self.max_speed = plan.get("max_speed", self.max_speed)
+        self._spin_origin = plan["start_at"] + clock_offset
+        self._reset_to_plan_start()
+
         self.is_spinning = True
-        self.is_holding = False # 確保不是 Holding 模式
-        
+
         # [預先啟動所有循環音效] 以音量控制切換，避免播放時 lag
         self._start_loop_sounds()
-        
         # 初始狀態通常是 fast (如果速度夠快)
         initial_mode = 'fast' if self.rotation_speed > 20 else 'tick'
         self._update_sound_volumes(initial_mode)
         self.current_sound_mode = initial_mode
-        
-        self.timer.start(10)
+
+        frame_clock().subscribe(self.update_spin)
+
+    def _reset_to_plan_start(self):
+        plan = self.spin_plan
+        self.current_angle = plan["angle"]
+        self.rotation_speed = plan["speed"]
+        self.is_holding = plan["mode"] == 'hold'
+        self._spin_steps = 0
+        self._release_step = None
+
+    def apply_release(self, step):
+        """
+        套用「在第 step 步放開按鈕」。
+        已經跑超過該步數 (訊息晚到) 時，從計畫起點重播長按階段 (純加速、無擋板，成本極低) 再繼續追進度。
+        """
+        if self.spin_plan is None or not self.is_holding:
+            return
+        if self._spin_steps > step:
+            self._reset_to_plan_start()
+            while self._spin_steps < step:
+                self._spin_steps += 1
+                self._physics_step()
+        self._release_step = step
+
+    def _release_speed(self):
+        # [修正] 避免按太快導致速度不夠就停了：放開時速度還太慢，給予一個基礎初速 (由種子決定，各節點一致)
+        return random.Random(self.spin_plan["seed"] + 1).uniform(30.0, 40.0)
+
+    # [保留 for 相容性] 瞬間啟動 (系統端可能會用到，或者作為 Fallback)
+    def start_spin(self, initial_speed=None):
+        if not self.items or self.is_spinning:
+            return
+        plan = self.make_spin_plan('spin', initial_speed)
+        self.run_spin_plan(plan)
+        self.spinPlanned.emit(plan)
 
     # [新增] 按下按鈕：開始加速旋轉
     def start_holding(self):
         if not self.items: return
-        if self.is_spinning and not self.is_holding: return # 已經在跑且不是 holding 狀態，忽略
-        
-        self.is_spinning = True
-        self.is_holding = True
-        
-        # 若是剛開始，速度歸零開始加速
-        if not self.timer.isActive():
-             self.rotation_speed = 0
-             self._start_loop_sounds()
-             self.timer.start(10)
-             
+        if self.is_spinning: return # 已經在跑 (含 holding 中)，忽略
+
+        # 速度歸零開始加速
+        plan = self.make_spin_plan('hold')
+        self.run_spin_plan(plan)
+        self.spinPlanned.emit(plan)
+
     # [新增] 放開按鈕：進入減速模式
     def release_holding(self):
         if self.is_holding:
-            self.is_holding = False
-            
-            # [修正] 避免按太快導致速度不夠就停了
-            # 如果放開時速度還太慢（例如點一下就放開），強制給予一個基礎初速
-            if self.rotation_speed < 30.0:
-                self.rotation_speed = random.uniform(30.0, 40.0)
-            
-            # 此時 rotation_speed 應該已經很快，接下來交給 update_spin 的物理邏輯去減速
+            # 在下一個物理步放開 (接下來交給物理邏輯去減速)
+            step = self._spin_steps
+            self.apply_release(step)
+            self.spinReleased.emit({"step": step})
 
     def _start_loop_sounds(self):
         if self.snd_fast: 
@@ -257,35 +527,55 @@ class LuckyWheelWidget(QWidget):
             self.snd_slow.setVolume(0)
             self.snd_slow.play()
 
-    def update_spin(self):
+    def update_spin(self, dt=0.0):
+        # [修改] 由 FrameClock 每個畫面呼叫一次；以牆上時鐘換算應執行的物理步數 (固定步長)，Timer 延遲或 GUI 忙碌時一次補足多步，
+        # 轉動時間與結果不再受 Timer 抖動影響，多台大螢幕可依同一份計畫得到相同結果
+        due_steps = int((time.time() - self._spin_origin) / SPIN_STEP_S)
+        steps = min(due_steps - self._spin_steps, MAX_CATCHUP_STEPS)
+        if steps <= 0:
+            return # 計畫尚未開始 (start_at 在未來)
+
+        winner_index = None
+        for _ in range(steps):
+            self._spin_steps += 1
+            winner_index = self._physics_step()
+            if winner_index is not None:
+                break
+
+        self._update_spin_audio()
+
+        if winner_index is not None:
+            self.rotation_speed = 0
+            frame_clock().unsubscribe(self.update_spin)
+            self.is_spinning = False
+            self._stop_all_loops()
+
+            winner = self.items[winner_index]
+            # [調整] 轉盤停下後，停頓 1 秒再彈出中獎畫面 (原本是 3秒 太久了)
+            QTimer.singleShot(1000, lambda: self._emit_finished(winner, winner_index))
+
+        frame_clock().request_update(self)
+
+    def _physics_step(self):
+        """執行一個固定步長 (10ms) 的物理模擬；轉盤停止時回傳中獎索引，否則回傳 None"""
         # [修改] 1. 長按加速邏輯
         if self.is_holding:
-            # 加速直到 Max Speed
-            if self.rotation_speed < self.max_speed:
-                self.rotation_speed += 0.8 # 加速度
+            if self._release_step is not None and self._spin_steps > self._release_step:
+                self.is_holding = False
+                if self.rotation_speed < 30.0:
+                    self.rotation_speed = self._release_speed()
             else:
-                self.rotation_speed = self.max_speed
-            
-            # 旋轉更新 (此時不受物理擋板影響，全力衝刺)
-            self.current_angle += self.rotation_speed
-            self.current_angle %= 360
-            
-            # 聲音更新
-            abs_speed = abs(self.rotation_speed)
-            target_mode = 'fast' if abs_speed > 20 else ('medium' if abs_speed > 8 else 'tick')
-            if target_mode != self.current_sound_mode:
-                self._update_sound_volumes(target_mode)
-                self.current_sound_mode = target_mode
-                
-            # 仍然要更新 last_sector_index 避免放開瞬間 index 亂跳
-            n = len(self.items)
-            if n > 0:
-                slice_angle = 360 / n
-                relative_angle = (270 - self.current_angle) % 360
-                self.last_sector_index = int(relative_angle / slice_angle)
-            
-            return # [跳出] 長按時不執行減速/擋板物理
-            
+                # 加速直到 Max Speed
+                if self.rotation_speed < self.max_speed:
+                    self.rotation_speed += 0.8 # 加速度
+                else:
+                    self.rotation_speed = self.max_speed
+
+                # 旋轉更新 (此時不受物理擋板影響，全力衝刺)
+                self.current_angle += self.rotation_speed
+                self.current_angle %= 360
+                return None # [跳出] 長按時不執行減速/擋板物理
+
         # -------------------------------------------------------------------------
         # 以下為原本的物理減速邏輯 (放開按鈕後執行)
         # -------------------------------------------------------------------------
@@ -297,12 +587,12 @@ class LuckyWheelWidget(QWidget):
         # 將擋板視為高能量區，指針在中間是低能量區
         # 當指針靠近擋板(扇區邊緣)時，會受到一個「排斥力/推力」使其離開擋板
         n = len(self.items)
+        peg_influence = 0.5  # [修正] 縮小影響範圍 (只在交界處 1 度內)
         if n > 0:
             slice_angle = 360 / n
             offset = (270 - self.current_angle) % slice_angle
             
             # 參數設定
-            peg_influence = 0.5  # [修正] 縮小影響範圍 (只在交界處 1 度內)
             force_strength = 0.24 # 原本的力道
             
             total_force = 0
@@ -351,8 +641,6 @@ class LuckyWheelWidget(QWidget):
             if is_rebounding_next or is_rebounding_prev:
                 self.rotation_speed *= self.peg_friction # 強力阻尼 (可調整)
                 
-            # [核心修正] 動能耗損邏輯
-            
             # [核心修正] 動能耗損邏輯
             # 當速度方向改變 (例如正轉變反轉，代表撞到擋板彈回來了)
             # 強制將動力降為剩餘的 30% (模擬非彈性碰撞)
@@ -365,12 +653,29 @@ class LuckyWheelWidget(QWidget):
 
         # 摩擦力衰減 (全程使用 base_friction，因為阻力來源已經由力場模擬了)
         self.rotation_speed *= self.base_friction
-        
+
+        # [修正] 停止條件
+        # 必須同時滿足：
+        # 1. 速度極低
+        # 2. 不受顯著外力 (代表已經滑進扇區中間，不在擋板上)
+        if n > 0 and abs(self.rotation_speed) <= 0.05:
+            # 檢查是否在穩定的中間區域 (沒受擋板力)
+            # 即 offset > peg_influence AND dist_from_end > peg_influence
+            offset = (270 - self.current_angle) % slice_angle
+            dist_from_end = slice_angle - offset
+            if offset > peg_influence and dist_from_end > peg_influence:
+                relative_angle = (270 - self.current_angle) % 360
+                return int(relative_angle / slice_angle)
+        return None
+
+    def _update_spin_audio(self):
+        """依目前速度切換循環音效，並在跨越扇區時播放滴答聲 (每個畫面一次)"""
         # --- 音效觸發邏輯 ---
         # 決定聲音模式
         abs_speed = abs(self.rotation_speed)
-        target_mode = 'tick'
-        if abs_speed > 20: target_mode = 'fast'
+        if self.is_holding:
+            target_mode = 'fast' if abs_speed > 20 else ('medium' if abs_speed > 8 else 'tick')
+        elif abs_speed > 20: target_mode = 'fast'
         elif abs_speed > 8: target_mode = 'medium'
         elif abs_speed > 4: target_mode = 'slow'
         else: target_mode = 'tick'
@@ -380,51 +685,30 @@ class LuckyWheelWidget(QWidget):
             self._update_sound_volumes(target_mode)
             self.current_sound_mode = target_mode
 
+        n = len(self.items)
         if n > 0:
             # 更新索引與播放滴答聲 (tick)
             # 使用目前的指針角度判定
+            slice_angle = 360 / n
             relative_angle = (270 - self.current_angle) % 360
             current_index = int(relative_angle / slice_angle)
             
-            if target_mode == 'tick':
+            if target_mode == 'tick' and not self.is_holding:
                  if current_index != self.last_sector_index:
                     # 只要跨越格子邊界 (index 改變)，就播放音效
                     if abs_speed > 0.1: # 避免靜止時微動一直響
                         self._play_tick()
                     self.last_sector_index = current_index
             else:
+                # 長按時仍然要更新 last_sector_index 避免放開瞬間 index 亂跳
                 self.last_sector_index = current_index
 
-        # [修正] 停止條件
-        # 必須同時滿足：
-        # 1. 速度極低
-        # 2. 不受顯著外力 (代表已經滑進扇區中間，不在擋板上)
-        is_stable = False
-        if n > 0:
-             # 檢查是否在穩定的中間區域 (沒受擋板力)
-             # 即 offset > peg_influence AND dist_from_end > peg_influence
-             offset = (270 - self.current_angle) % slice_angle
-             dist_from_end = 360/n - offset
-             if offset > peg_influence and dist_from_end > peg_influence:
-                 is_stable = True
-        
-        if abs(self.rotation_speed) <= 0.05 and self.is_spinning and is_stable:
-             self.rotation_speed = 0
-             self.timer.stop()
-             self.is_spinning = False
-             self._stop_all_loops()
-             
-             winner = self.items[current_index]
-             # [調整] 轉盤停下後，停頓 1 秒再彈出中獎畫面 (原本是 3秒 太久了)
-             QTimer.singleShot(1000, lambda: self._emit_finished(winner))
-        
-        self.update()
-
     def _play_tick(self):
          # [新增] 震動特效：每次跟著音效產生微小位移
          shift_x = random.randint(-3, 3) 
          shift_y = random.randint(-3, 3)
          self.shake_offset = QPoint(shift_x, shift_y)
+         self.invalidate('pointer') # [修改] 震動只作用於指針，不再整個轉盤重繪
 
          if self.tick_sounds:
              effect = self.tick_sounds[self.tick_index]
@@ -447,7 +731,7 @@ class LuckyWheelWidget(QWidget):
 
     def stop_spin(self):
         # 將物理旋轉模式切換為「動畫著陸模式」
-        self.timer.stop()
+        frame_clock().unsubscribe(self.update_spin)
         self.is_spinning = False # 標記物理引擎停止
         self._stop_all_loops()   # 停止循環音效
         
@@ -491,9 +775,10 @@ class LuckyWheelWidget(QWidget):
         # 確保最後角度精確
         winner = self.items[winner_index]
         # [新增] 停止後等待 3 秒再發送訊號 (顯示結果)
-        QTimer.singleShot(3000, lambda: self._emit_finished(winner))
+        QTimer.singleShot(3000, lambda: self._emit_finished(winner, winner_index))
 
-    def _emit_finished(self, winner):
+    def _emit_finished(self, winner, index):
+        self.winnerPicked.emit(winner, index)
         self.spinFinished.emit(winner)
         # Animation finished, clean up?
         # self.current_angle %= 360 # Optional reset, but might jump visually if redraw happens
@@ -517,105 +802,216 @@ class LuckyWheelWidget(QWidget):
         index = index % n
         
         winner = self.items[index]
-        self.spinFinished.emit(winner)
+        self._emit_finished(winner, index)
 
     def paintEvent(self, event):
+        paint_start = time.perf_counter()
+        governor = quality_governor() # [新增] 畫面預算不足時依序關閉特效
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # [新增] 應用震動位移
-        if not self.shake_offset.isNull():
-            painter.translate(self.shake_offset)
-            # 畫完這一幀後重置，確保只持續一幀 (Impulse)
-            # 注意：不能在這裡直接修改 self.shake_offset，因為 paintEvent 可能會被重繪多次
-            # 但在這個邏輯下，我們希望它顯現一次就消失，所以這是一種簡單的 auto-reset
-            self.shake_offset = QPoint(0, 0)
+        painter.setRenderHint(QPainter.Antialiasing, governor.enabled("antialiasing"))
+        text_shadow = governor.enabled("text_shadow")
+
+        # [新增] 只繪製與重繪範圍 (Dirty Region) 相交的特效，其餘整段跳過
+        dirty = event.region()
+        painter.setClipRegion(dirty)
+        regions = self.damage_regions()
             
         rect = self.rect()
         center = rect.center()
         radius = min(rect.width(), rect.height()) / 2 * 0.8 
 
         # 1. 轉盤背景光暈
-        painter.setPen(Qt.NoPen)
-        radial = QRadialGradient(center, radius * 1.1)
-        radial.setColorAt(0, QColor(255, 215, 0, 80))
-        radial.setColorAt(1, Qt.transparent)
-        painter.setBrush(radial)
-        painter.drawEllipse(center, radius * 1.1, radius * 1.1)
+        if dirty.intersects(regions["glow"]):
+            painter.setPen(Qt.NoPen)
+            radial = QRadialGradient(center, radius * 1.1)
+            radial.setColorAt(0, QColor(255, 215, 0, 80))
+            radial.setColorAt(1, Qt.transparent)
+            painter.setBrush(radial)
+            painter.drawEllipse(center, radius * 1.1, radius * 1.1)
 
         # 2. 扇形
-        n = len(self.items)
-        if n > 0:
-            slice_angle = 360 / n
-            painter.save()
-            try:
-                painter.translate(center)
-                painter.rotate(self.current_angle)
-
-                # Loop 1: 繪製扇形 (背景)
-                for i in range(n):
-                    painter.save()
-                    painter.rotate(-i * slice_angle)
-                    
-                    base_c = COLORS[i % len(COLORS)]
-                    
-                    # 建立線性漸層 (從圓心往外)
-                    grad = QLinearGradient(0, 0, radius, 0)
-                    grad.setColorAt(0.0, base_c.darker(130))
-                    grad.setColorAt(0.5, base_c.lighter(140))
-                    grad.setColorAt(1.0, base_c.darker(130))
-                    
-                    painter.setBrush(QBrush(grad))
-                    painter.setPen(QPen(Qt.white, 3))
-                    
-                    path = QPainterPath()
-                    path.moveTo(0, 0)
-                    path.arcTo(-radius, -radius, radius*2, radius*2, 0, -slice_angle)
-                    path.closeSubpath()
-                    painter.drawPath(path)
-                    painter.restore()
-
-                # Loop 2: 繪製文字 (確保文字永遠在扇形上方，且清晰可見)
-                for i in range(n):
+        if self.items and dirty.intersects(regions["face"]):
+            # [新增] 高速轉動時以較低的內部解析度繪製 (文字反正看不清)，隨減速逐級恢復
+            scale = self._face_scale()
+            if scale < 1.0:
+                self.draw_face_scaled(painter, center, radius, scale, text_shadow)
+            elif not self._draw_resting_face(painter, center, radius, text_shadow):
+                if len(self.items) > FACE_SYNC_LIMIT:
+                    # 大量名單慢速轉動 / 停車動畫中：旋轉快取的轉盤面，不逐格向量繪製
+                    self.draw_face_scaled(painter, center, radius, 1.0, text_shadow)
+                else:
                     painter.save()
                     try:
-                        # 計算文字角度 (每個扇區的中間線)
-                        mid_angle = -i * slice_angle - slice_angle / 2
-                        painter.rotate(-mid_angle) 
-                        
-                        font_size = max(10, int(radius * 0.08))
-                        if n > 12: font_size = int(font_size * 0.8)
-                        font = QFont("Microsoft JhengHei", font_size, QFont.Bold)
-                        painter.setFont(font)
-                        
-                        text_rect = QRectF(radius*0.2, -30, radius*0.75, 60)
-                        text_str = self.items[i]
-                        
-                        # [新增] 文字陰影 (Drop Shadow) - 解決金色背景吃字問題
-                        painter.setPen(QColor(0, 0, 0, 120)) # 半透明黑
-                        # 稍微偏移畫一次黑色的
-                        painter.drawText(text_rect.translated(2, 2), Qt.AlignRight | Qt.AlignVCenter, text_str)
-                        
-                        # 畫白色正文
-                        painter.setPen(Qt.white)
-                        painter.drawText(text_rect, Qt.AlignRight | Qt.AlignVCenter, text_str)
-
+                        painter.translate(center)
+                        painter.rotate(self.current_angle)
+                        self.draw_face(painter, radius, text_shadow)
                     finally:
                         painter.restore()
-            finally:
-                painter.restore()
-        
-
 
         # [新增] 速度線特效 (當速度夠快時)
-        if abs(self.rotation_speed) > 20:
+        if abs(self.rotation_speed) > 20 and governor.enabled("speed_lines"):
              self.draw_speed_lines(painter, center, radius)
 
         # 3. 指針 (從中間往外指，指向12點鐘方向)
-        self.draw_pointer(painter, rect, radius)
+        if dirty.intersects(regions["pointer"]):
+            # [修改] 震動位移只套用在指針 (像是撞到擋板)；只持續一幀，之後再重繪一次指針範圍復位
+            painter.save()
+            try:
+                if not self.shake_offset.isNull():
+                    painter.translate(self.shake_offset)
+                    self.shake_offset = QPoint(0, 0)
+                    self.invalidate('pointer')
+                self.draw_pointer(painter, rect, radius)
+            finally:
+                painter.restore()
 
         # 4. 中心區域 (抽獎人頭像 或 LOGO)
         # 如果有抽獎人頭像，優先顯示；否則顯示 LOGO
+        if dirty.intersects(regions["avatar"]):
+            self.draw_center(painter, center, radius)
+
+        # [新增] 聚光燈特效 (轉動時背景變暗，聚焦於指針)
+        if self.is_spinning and governor.enabled("spotlight"):
+            self.draw_spotlight(painter, rect, radius)
+            
+        # [修改] 將 LED 移至最上層繪製 (避免被 Spotlight 遮住)
+        if dirty.intersects(regions["leds"]):
+            self.draw_leds(painter, center, radius, halo=governor.enabled("led_halo"))
+
+        # 只統計轉動中的整幀 (靜止時只重繪 LED 燈環，不代表真正的負載；監控縮圖期間調節器會暫停收集)
+        if self.is_spinning and not self.mirror_mode:
+            painter.end()
+            governor.record((time.perf_counter() - paint_start) * 1000.0)
+
+    def draw_face(self, painter, radius, text_shadow=True):
+        """繪製扇形與獎項文字 (painter 原點為圓心，已套用轉盤角度)"""
+        paint_face(painter, self.items, radius, text_shadow)
+
+    def _draw_resting_face(self, painter, center, radius, text_shadow):
+        """
+        [新增] 靜止時改貼背景執行緒繪製好的轉盤面 (依角度繪製，1:1 貼上不失真)
+        [修改] 名單連續變更時等停下來才排入背景渲染；新的轉盤面完成前先沿用舊的，
+        人數超過 FACE_SYNC_LIMIT 時完全不在 GUI 執行緒繪製 (改顯示替代圖)，預覽轉盤也不會卡住控制台。
+        回傳 False 代表需改用向量繪製。
+        """
+        anim = getattr(self, 'anim', None)
+        if self.is_spinning or (anim is not None and anim.state() == QPropertyAnimation.Running):
+            return False
+        key = (self.items_rev, round(radius, 1), text_shadow, round(self.current_angle % 360, 3))
+        cached = self._layers.get('face')
+        if cached is None or cached[0] != key:
+            self._schedule_face_render(key, radius, text_shadow)
+            if cached is None or cached[0][1:] != key[1:]:
+                if len(self.items) <= FACE_SYNC_LIMIT:
+                    return False
+                self._draw_face_placeholder(painter, center, radius, cached)
+                return True
+        pix = cached[1]
+        painter.drawPixmap(QPointF(center.x() - pix.width() / 2, center.y() - pix.height() / 2), pix)
+        return True
+
+    def _schedule_face_render(self, key, radius, text_shadow):
+        """[新增] 延遲排入背景渲染 (只有 key 改變時才重新計時，LED 等其他重繪不會一直延後)"""
+        if self._face_request is not None and self._face_request[0] == key:
+            return
+        self._face_request = (key, radius, self.current_angle, text_shadow)
+        self._face_request_timer.start(FACE_REQUEST_DELAY_MS)
+
+    def _request_face_render(self):
+        request, self._face_request = self._face_request, None
+        if request is None:
+            return
+        key, radius, angle, text_shadow = request
+        if key[0] != self.items_rev:
+            self.invalidate('face') # 名單又變了：重繪時以最新名單重新排程
+            return
+        self._layers.request('face', key, render_face_image, list(self.items), radius, angle, text_shadow)
+
+    def _draw_face_placeholder(self, painter, center, radius, cached):
+        """[新增] 背景渲染完成前的替代圖：舊的轉盤面轉到目前角度並縮放到目前尺寸，沒有時畫彩色圓盤"""
+        painter.save()
+        try:
+            painter.translate(center)
+            if cached is not None:
+                (_rev, old_radius, _shadow, old_angle), pix = cached
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.rotate(self.current_angle - old_angle)
+                painter.scale(radius / old_radius, radius / old_radius)
+                painter.drawPixmap(QPointF(-pix.width() / 2, -pix.height() / 2), pix)
+            else:
+                grad = QConicalGradient(0, 0, 0)
+                for i, color in enumerate(COLORS):
+                    grad.setColorAt(i / len(COLORS), color)
+                grad.setColorAt(1.0, COLORS[0])
+                painter.setPen(QPen(Qt.white, 3))
+                painter.setBrush(QBrush(grad))
+                painter.drawEllipse(QPointF(0, 0), radius, radius)
+        finally:
+            painter.restore()
+
+    def _face_scale(self):
+        """依轉速決定轉盤面的內部解析度 (門檻與音效模式相同：快 > 20、中 > 8)"""
+        speed = abs(self.rotation_speed)
+        if not self.is_spinning or speed <= 8:
+            return 1.0
+        return FACE_SCALE_FAST if speed > 20 else FACE_SCALE_MEDIUM
+
+    def _face_sprite(self, radius, scale, text_shadow):
+        """[新增] 未旋轉的轉盤面 (依縮放比例快取)，名單 / 尺寸 / 文字陰影改變時重畫"""
+        key = (self.items_rev, round(radius, 1), text_shadow)
+        if self._face_cache_key != key:
+            self._face_cache_key = key
+            self._face_cache = {}
+        sprite = self._face_cache.get(scale)
+        if sprite is None:
+            half = radius + 3 # 含白色框線
+            size = int(math.ceil(half * 2 * scale))
+            sprite = QPixmap(size, size)
+            sprite.fill(Qt.transparent)
+            p = QPainter(sprite)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.scale(scale, scale)
+            p.translate(half, half)
+            self.draw_face(p, radius, text_shadow)
+            p.end()
+            self._face_cache[scale] = sprite
+        return sprite
+
+    def draw_face_scaled(self, painter, center, radius, scale, text_shadow):
+        """
+        以降低的內部解析度繪製旋轉中的轉盤面：
+        在小尺寸緩衝區旋轉快取的轉盤面 (最快速時疊加前一角度做動態模糊)，再放大貼回畫面
+        """
+        sprite = self._face_sprite(radius, scale, text_shadow)
+        size = sprite.width()
+        if self._face_buffer is None or self._face_buffer.width() != size:
+            self._face_buffer = QPixmap(size, size)
+        buf = self._face_buffer
+        buf.fill(Qt.transparent)
+
+        p = QPainter(buf)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        p.translate(size / 2, size / 2)
+        if scale <= FACE_SCALE_FAST:
+            # 動態模糊：先畫半步前的角度，再以 60% 透明度疊上目前角度
+            p.save()
+            p.rotate(self.current_angle - self.rotation_speed * 0.5)
+            p.drawPixmap(-size // 2, -size // 2, sprite)
+            p.restore()
+            p.setOpacity(0.6)
+        p.rotate(self.current_angle)
+        p.drawPixmap(-size // 2, -size // 2, sprite)
+        p.end()
+
+        half = radius + 3
+        painter.save()
+        try:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawPixmap(QRectF(center.x() - half, center.y() - half, half * 2, half * 2), buf, QRectF(buf.rect()))
+        finally:
+            painter.restore()
+
+    def draw_center(self, painter, center, radius):
         logo_radius = radius * 0.25 # [設定] 轉盤中心頭像的顯示大小 (半徑比例 0.25)
         painter.setBrush(Qt.white)
         painter.setPen(QPen(QColor(218, 165, 32), 5))
@@ -628,7 +1024,7 @@ class LuckyWheelWidget(QWidget):
             try:
                 path = QPainterPath()
                 path.addEllipse(center, logo_radius-5, logo_radius-5)
-                painter.setClipPath(path)
+                painter.setClipPath(path, Qt.IntersectClip) # 與重繪範圍取交集
                 target_rect = QRectF(center.x() - logo_radius, center.y() - logo_radius, logo_radius*2, logo_radius*2)
                 painter.drawPixmap(target_rect.toRect(), display_pixmap)
             finally:
@@ -649,92 +1045,85 @@ class LuckyWheelWidget(QWidget):
             painter.setFont(QFont("Microsoft JhengHei", 10, QFont.Bold))
             painter.drawText(QRectF(lx, ly, label_w, label_h), Qt.AlignCenter, "抽獎人")
 
-        # [新增] 聚光燈特效 (轉動時背景變暗，聚焦於指針)
-        if self.is_spinning:
-            self.draw_spotlight(painter, rect, radius)
-            
-        # [修改] 將 LED 移至最上層繪製 (避免被 Spotlight 遮住)
-        self.draw_leds(painter, center, radius)
+    def _led_layout(self, radius):
+        """[新增] 燈泡位置 (相對圓心) 依尺寸與數量快取，不必每幀計算 cos / sin"""
+        key = (round(radius, 1), self.led_count)
+        if self._led_positions is None or self._led_positions[0] != key:
+            led_radius = radius * 1.12 # 稍微在光暈外
+            step = 2 * math.pi / self.led_count
+            positions = [QPointF(led_radius * math.cos(i * step), led_radius * math.sin(i * step))
+                         for i in range(self.led_count)]
+            self._led_positions = (key, positions)
+        return self._led_positions[1]
+
+    def _led_atlas(self, bulb_size):
+        """
+        [新增] 燈泡 Sprite Atlas：每種顏色預先畫好一顆，排成一列 (第一列含光暈，第二列只有本體)
+        亮度改用 PixmapFragment 的 opacity，所有燈泡一次 drawPixmapFragments 畫完
+        """
+        cell = int(math.ceil(bulb_size * 1.6)) + 2
+        if self._led_sprites is None or self._led_sprites[0] != cell:
+            atlas = QPixmap(cell * len(LED_SPRITE_COLORS), cell * 2)
+            atlas.fill(Qt.transparent)
+            p = QPainter(atlas)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            for row, halo in enumerate((True, False)):
+                for col, rgb in enumerate(LED_SPRITE_COLORS):
+                    c = QPointF(col * cell + cell / 2, row * cell + cell / 2)
+                    # 1. 燈泡光暈 (本體一半的透明度)
+                    if halo:
+                        p.setBrush(QColor(*rgb, 127))
+                        p.drawEllipse(c, bulb_size * 0.8, bulb_size * 0.8)
+                    # 2. 燈泡本體
+                    p.setBrush(QColor(*rgb))
+                    p.drawEllipse(c, bulb_size / 2, bulb_size / 2)
+            p.end()
+            sources = [[QRectF(col * cell, row * cell, cell, cell) for col in range(len(LED_SPRITE_COLORS))]
+                       for row in range(2)]
+            self._led_sprites = (cell, atlas, sources)
+        return self._led_sprites[1], self._led_sprites[2]
 
-    def draw_leds(self, painter, center, radius):
-        # LED 參數
-        led_radius = radius * 1.12 # 稍微在光暈外
+    def draw_leds(self, painter, center, radius, halo=True):
+        # [優化] 位置快取 + Sprite Atlas + 單次批次繪製 (LED 數量增加到數百顆也不影響幀時間)
         bulb_size = radius * 0.04  # 燈泡大小
-        
-        painter.save()
-        painter.translate(center)
-        
-        for i in range(self.led_count):
-            angle_deg = i * (360 / self.led_count)
-            angle_rad = math.radians(angle_deg)
-            
-            # 計算位置
-            lx = led_radius * math.cos(angle_rad)
-            ly = led_radius * math.sin(angle_rad)
-            
-            # 計算亮度/顏色
-            if self.is_spinning and 0 < abs(self.rotation_speed) < 8.0:
-                # [新增] 頻閃模式 (全亮/全暗)
-                is_on = getattr(self, 'strobe_on', True)
-                if is_on:
-                    color = QColor(255, 255, 255, 255) # 超亮白
-                    alpha = 255
-                else:
-                    color = QColor(0, 0, 0, 0)
-                    alpha = 0
-            
-            elif self.is_spinning:
-                # 跑馬燈 (Chasing)
-                # 計算當前 LED 距離 "跑馬頭" (led_phase) 的距離
-                # 這裡 led_phase 是 0 ~ led_count 的浮點數
-                dist = (self.led_phase - i) % self.led_count
-                
-                # 拖尾效果: 距離越近越亮
-                # 假設尾巴長度 8 顆
-                tail_len = 8.0
-                if dist < tail_len:
-                    intensity = 1.0 - (dist / tail_len)
-                else:
-                    intensity = 0.1 # 底色微亮
-                
-                # 顏色: 旋轉時用彩色或亮黃色
-                # 這裡用 金黃色 高亮
-                alpha = int(255 * intensity)
-                # color = QColor(255, 215, 0, alpha)
-                # 讓頭部稍微白一點
-                if intensity > 0.8:
-                     color = QColor(255, 255, 200, alpha)
-                else:
-                     color = QColor(255, 165, 0, alpha)
-                     
-            else:
-                # 呼吸燈 (Breathing)
-                # 全部一起閃爍
-                # sin 範圍 -1 ~ 1 -> 0 ~ 1
-                intensity = (math.sin(self.led_phase) + 1) / 2
-                # 限制最小值，不要全暗
-                intensity = 0.3 + 0.7 * intensity
-                
-                alpha = int(255 * intensity)
-                # 呼吸時用 喜氣洋洋的紅色 或 金色? 用多色交替?
-                # 偶數紅，奇數黃
-                if i % 2 == 0:
-                    color = QColor(255, 69, 0, alpha) # 紅橙
-                else:
-                    color = QColor(255, 215, 0, alpha) # 金
-            
-            # 畫燈泡
-            
-            # 1. 燈泡光暈
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(color.red(), color.green(), color.blue(), int(alpha * 0.5)))
-            painter.drawEllipse(QRectF(lx - bulb_size*0.8, ly - bulb_size*0.8, bulb_size*1.6, bulb_size*1.6))
-            
-            # 2. 燈泡本體
-            painter.setBrush(color)
-            painter.drawEllipse(QRectF(lx - bulb_size/2, ly - bulb_size/2, bulb_size, bulb_size))
-            
-        painter.restore()
+        positions = self._led_layout(radius)
+        atlas, rows = self._led_atlas(bulb_size)
+        sources = rows[0] if halo else rows[1]
+        n = self.led_count
+        scale = n / LED_BASE_COUNT # 跑馬燈的速度 / 拖尾以 36 顆為基準等比放大
+        cx, cy = center.x(), center.y()
+        create = QPainter.PixmapFragment.create
+
+        fragments = []
+        if self.is_spinning and 0 < abs(self.rotation_speed) < 8.0:
+            # [新增] 頻閃模式 (全亮/全暗)
+            if getattr(self, 'strobe_on', True):
+                src = sources[LED_WHITE]
+                fragments = [create(QPointF(cx + pos.x(), cy + pos.y()), src) for pos in positions]
+
+        elif self.is_spinning:
+            # 跑馬燈 (Chasing)
+            # 計算當前 LED 距離 "跑馬頭" (led_phase) 的距離
+            # 這裡 led_phase 是 0 ~ led_count 的浮點數
+            tail_len = 8.0 * scale # 拖尾效果: 距離越近越亮 (36 顆時尾巴長度 8 顆)
+            for i, pos in enumerate(positions):
+                dist = (self.led_phase - i) % n
+                intensity = 1.0 - (dist / tail_len) if dist < tail_len else 0.1 # 底色微亮
+                # 讓頭部稍微白一點，其餘用亮橘色
+                src = sources[LED_HEAD if intensity > 0.8 else LED_ORANGE]
+                fragments.append(create(QPointF(cx + pos.x(), cy + pos.y()), src, 1, 1, 0, intensity))
+
+        else:
+            # 呼吸燈 (Breathing)：全部一起閃爍，sin 範圍 -1 ~ 1 -> 0 ~ 1，限制最小值不要全暗
+            intensity = 0.3 + 0.7 * (math.sin(self.led_phase) + 1) / 2
+            # 偶數紅橙，奇數金
+            for i, pos in enumerate(positions):
+                src = sources[LED_RED if i % 2 == 0 else LED_GOLD]
+                fragments.append(create(QPointF(cx + pos.x(), cy + pos.y()), src, 1, 1, 0, intensity))
+
+        if fragments:
+            painter.drawPixmapFragments(fragments, atlas)
 
     def draw_pointer(self, painter, rect, radius):
         center_x = rect.center().x()
@@ -769,104 +1158,79 @@ class LuckyWheelWidget(QWidget):
         finally:
              painter.restore()
 
+    def _streak_sprite(self, radius):
+        """[新增] 速度線 Sprite：最長 (40% 半徑) / 最寬 (±5px) 的白色三角形，畫一次後只靠縮放與旋轉重用"""
+        length = max(1, int(radius * 0.4))
+        if self._streak is None or self._streak[0] != length:
+            half_w = 5
+            sprite = QPixmap(half_w * 2, length)
+            sprite.fill(Qt.transparent)
+            p = QPainter(sprite)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            p.setBrush(Qt.white)
+            path = QPainterPath()
+            path.moveTo(half_w, length) # 尖端朝圓心 (下方)
+            path.lineTo(0, 0)
+            path.lineTo(half_w * 2, 0)
+            path.closeSubpath()
+            p.drawPath(path)
+            p.end()
+            self._streak = (length, sprite, half_w)
+        return self._streak
+
     def draw_speed_lines(self, painter, center, radius):
         """繪製速度線特效 (白色半透明放射狀線條)"""
-        # 使用隨機與時間因子產生動態感
-        # 這裡不重度依賴 random 以免閃爍太嚴重，可以用 current_angle 當作種子
-        
-        painter.save()
-        painter.translate(center)
-        
-        # 不需要跟隨轉盤旋轉 (這是一種視覺殘留特效)
-        # 但給一點偏移讓它看起來不是死的
-        import time
+        # [優化] 預先畫好的速度線 Sprite + 每條線只算縮放 / 旋轉 / 透明度，一次 drawPixmapFragments 畫完
+        # 不需要跟隨轉盤旋轉 (這是一種視覺殘留特效)，但給一點偏移讓它看起來不是死的
+        max_len, sprite, half_w = self._streak_sprite(radius)
+        source = QRectF(sprite.rect())
         t = time.time() * 10 
-        
+        outer_r = radius * 1.05 # 稍微超出轉盤
         count = 12 # 線條數量
-        
+
+        fragments = []
         for i in range(count):
-            painter.save()
-            
-            # 角度分佈均勻但帶有一些隨機偏移
-            base_angle = i * (360 / count)
-            # 隨機偏移 (-15 ~ +15 度)
-            # 使用偽隨機，讓它在每幀變化
-            offset = (math.sin(t + i) * 20) 
-            angle = base_angle + offset
-            
-            painter.rotate(angle)
-            
-            # 繪製長條三角形
-            # 從外圈向內指
-            # Y軸負方向是上方
-            
-            # 隨機長度與寬度
+            # 角度分佈均勻，帶有隨時間變化的偏移 (-20 ~ +20 度)
+            angle = i * (360 / count) + math.sin(t + i) * 20
             length_factor = 0.3 + (math.cos(t * 2 + i) * 0.1) # 20% ~ 40% 半徑長
             width_factor = 3 + (math.sin(t * 3 + i) * 2)      # 1 ~ 5 px 寬
-            
-            # 透明度
-            alpha = int(100 + math.sin(t + i*2) * 80) # 20 ~ 180
-            alpha = max(0, min(255, alpha))
-            
-            color = QColor(255, 255, 255, alpha)
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            
-            path = QPainterPath()
-            # 三角形尖端朝圓心 (半徑 * (1-length)) 位置
+            alpha = max(0.0, min(1.0, (100 + math.sin(t + i*2) * 80) / 255)) # 20 ~ 180
+
+            # 三角形尖端在半徑 * (1-length) 處，Fragment 以中心點定位後旋轉
             inner_r = radius * (1.0 - length_factor)
-            outer_r = radius * 1.05 # 稍微超出轉盤
-            
-            # 這裡我們畫一個細長的梯形/三角形
-            # y 軸向上 (painter 預設是 y 向下，但我們 rotate 了)
-            # 其實不用太複雜，就畫一個三角形
-            # p1: (0, -outer_r)
-            # p2: (-w, -outer_r)
-            # p3: (0, -inner_r)
-            # p4: (w, -outer_r)
-            
-            path.moveTo(0, -inner_r)
-            path.lineTo(-width_factor, -outer_r)
-            path.lineTo(width_factor, -outer_r)
-            path.closeSubpath()
-            
-            painter.drawPath(path)
-            
-            painter.restore()
-            
-        painter.restore()
+            mid_r = (inner_r + outer_r) / 2
+            rad = math.radians(angle)
+            pos = QPointF(center.x() + mid_r * math.sin(rad), center.y() - mid_r * math.cos(rad))
+            fragments.append(QPainter.PixmapFragment.create(
+                pos, source, width_factor / half_w, (outer_r - inner_r) / max_len, angle, alpha))
 
-    def draw_spotlight(self, painter, rect, radius):
-        """繪製聚光燈效果 (黑色遮罩 + 挖洞)"""
-        # 1. 建立遮罩路徑 (全螢幕矩形)
-        overlay_path = QPainterPath()
-        overlay_path.addRect(QRectF(rect))
-        
-        # 2. 建立挖洞路徑 (圓形亮區)
-        # 洞的位置應該在指針尖端，並往上延伸以覆蓋文字
-        center = rect.center()
-        
-        # 文字大約分佈在半徑的 0.2 ~ 0.95 處
-        # 我們將聚光燈中心定在約 0.65 半徑處 (偏上方)，以覆蓋指針下方的文字區
-        target_dist = radius * 0.65
-        spot_center_y = center.y() - target_dist
-        
-        # 亮區大小 (加大以覆蓋整個扇區文字)
-        spot_radius = radius * 0.45
-        spot_center = QPoint(center.x(), int(spot_center_y))
-        
-        spot_path = QPainterPath()
-        spot_path.addEllipse(spot_center, spot_radius, spot_radius)
-        
-        # 3. 相減得到「有洞的遮罩」 (OddEvenFill 規則)
-        overlay_path.addPath(spot_path)
-        
-        painter.save()
-        painter.setPen(Qt.NoPen)
-        # 半透明黑色
-        painter.setBrush(QColor(0, 0, 0, 160))
-        # 設置填充規則為 OddEven (重疊部分挖空)
-        painter.drawPath(overlay_path)
-        painter.restore()
+        painter.drawPixmapFragments(fragments, sprite)
+
+    def _spotlight_mask(self, rect, radius):
+        """[新增] 聚光燈遮罩 (半透明黑 + 圓形亮區) 依元件尺寸畫一次快取"""
+        key = (rect.width(), rect.height())
+        if self._spotlight is None or self._spotlight[0] != key:
+            mask = QPixmap(rect.size())
+            mask.fill(QColor(0, 0, 0, 160)) # 半透明黑色
 
+            # 洞的位置應該在指針尖端，並往上延伸以覆蓋文字
+            # 文字大約分佈在半徑的 0.2 ~ 0.95 處，聚光燈中心定在約 0.65 半徑處 (偏上方)
+            center = rect.center()
+            spot_center = QPointF(center.x(), center.y() - radius * 0.65)
+            spot_radius = radius * 0.45 # 亮區大小 (加大以覆蓋整個扇區文字)
 
+            p = QPainter(mask)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setCompositionMode(QPainter.CompositionMode_Clear) # 挖洞
+            p.setPen(Qt.NoPen)
+            p.setBrush(Qt.black)
+            p.drawEllipse(spot_center, spot_radius, spot_radius)
+            p.end()
+            self._spotlight = (key, mask)
+        return self._spotlight[1]
+
+    def draw_spotlight(self, painter, rect, radius):
+        """繪製聚光燈效果 (黑色遮罩 + 挖洞)"""
+        # [優化] 不再每幀建立全視窗 Path 並以 OddEven 規則填滿，改為貼上快取的遮罩
+        painter.drawPixmap(rect.topLeft(), self._spotlight_mask(rect, radius))
@@ -17,6 +17,8 @@ from PyQt5.QtCore import QPoint, QTimer
 from PyQt5.QtCore import QPropertyAnimation
 import cv2
 import numpy as np
+from utils.image_loader import read_pixmap, COVER
+from utils.face_index import face_index
 
 # -----------------------------
 # 可調整的互動參數（中文註解）
@@ -220,7 +222,8 @@ class SelectablePhoto(QLabel):
         return final
 
     def set_image(self, path, size):
-        pix = QPixmap(path)
+        # [優化] 以 render_size 直接解碼 (短邊對齊)，避免完整解碼數千萬像素的原圖
+        pix = read_pixmap(path, size, size, COVER)
         if pix and not pix.isNull():
             # 1. 產生 [一般狀態] 圖片：白色邊框
             try:
@@ -438,7 +441,7 @@ class PhotoSelectorOverlay(QWidget):
         try:
             # Load Hover Cursor (Hammer Up)
             if os.path.exists(self._cursor_img_hover_path):
-                pix = QPixmap(self._cursor_img_hover_path)
+                pix = read_pixmap(self._cursor_img_hover_path, CURSOR_SIZE)
                 if not pix.isNull():
                     pix = pix.scaled(CURSOR_SIZE, CURSOR_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                     # 設定熱點在中心
@@ -446,7 +449,7 @@ class PhotoSelectorOverlay(QWidget):
 
             # Load Click Cursor (Hammer Down)
             if os.path.exists(self._cursor_img_click_path):
-                pix = QPixmap(self._cursor_img_click_path)
+                pix = read_pixmap(self._cursor_img_click_path, CURSOR_SIZE)
                 if not pix.isNull():
                     pix = pix.scaled(CURSOR_SIZE, CURSOR_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                     # 設定熱點在中心
@@ -507,6 +510,9 @@ class PhotoSelectorOverlay(QWidget):
             self.grid_layout.addWidget(lbl, 0, 0)
             return
             
+        # [新增] 背景建立人臉索引 (每張照片只偵測一次)，選取後的 smart 裁切只需查詢
+        face_index().schedule([os.path.join(self.real_dir, f) for f in files])
+
         # Add items
         row, col = 0, 0
         cols = 5 # 每行 5 張
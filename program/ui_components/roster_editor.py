@@ -0,0 +1,96 @@
+"""
+roster_editor.py
+----------------
+描述：名單編輯器 (Roster Editor)。
+功能：
+      1. 以 QListView 顯示 RosterModel，固定列高，只繪製畫面上看得到的列 (數萬筆名單也不卡)。
+      2. 新增 / 刪除 / 改名 (雙擊) 都是針對單列的增量操作，不會重建整份文字。
+      3. 沿用「一行一個名字」的貼上流程：Ctrl+V 或「貼上名單」按鈕會將剪貼簿的多行文字一次匯入，
+         插入在目前選取的列之後 (未選取則加在最後)。
+"""
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView, QLineEdit, QLabel,
+                             QPushButton, QAbstractItemView, QApplication)
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import Qt, QEvent
+from models.roster_model import parse_names
+
+
+class RosterEditor(QWidget):
+    def __init__(self, roster, parent=None):
+        super().__init__(parent)
+        self.roster = roster
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # 新增單一姓名 (Enter 送出)
+        add_row = QHBoxLayout()
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("輸入姓名後按 Enter 新增")
+        self.name_input.returnPressed.connect(self.add_from_input)
+        self.count_label = QLabel()
+        add_row.addWidget(self.name_input, 1)
+        add_row.addWidget(self.count_label)
+        layout.addLayout(add_row)
+
+        self.view = QListView()
+        self.view.setModel(roster)
+        self.view.setUniformItemSizes(True) # 固定列高：捲動與版面計算不必逐列量測
+        self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.view.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+        self.view.installEventFilter(self)
+        layout.addWidget(self.view, 1)
+
+        btn_row = QHBoxLayout()
+        paste_btn = QPushButton("📋 貼上名單")
+        paste_btn.setToolTip("從剪貼簿匯入 (一行一個名字)")
+        paste_btn.clicked.connect(self.paste_from_clipboard)
+        delete_btn = QPushButton("🗑 刪除選取")
+        delete_btn.clicked.connect(self.delete_selected)
+        btn_row.addWidget(paste_btn)
+        btn_row.addWidget(delete_btn)
+        layout.addLayout(btn_row)
+
+        for sig in (roster.rowsInserted, roster.rowsRemoved, roster.modelReset):
+            sig.connect(self._update_count)
+        self._update_count()
+
+    def eventFilter(self, obj, event):
+        if obj is self.view and event.type() == QEvent.KeyPress and self.view.state() != QAbstractItemView.EditingState:
+            if event.matches(QKeySequence.Paste):
+                self.paste_from_clipboard()
+                return True
+            if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
+                self.delete_selected()
+                return True
+        return super().eventFilter(obj, event)
+
+    def _insert_row(self):
+        """新名字插入的位置：最後一個選取列之後，未選取則加在最後"""
+        rows = [index.row() for index in self.view.selectionModel().selectedRows()]
+        return max(rows) + 1 if rows else self.roster.rowCount()
+
+    def _insert(self, names):
+        row = self._insert_row()
+        new_ids = self.roster.insert_names(row, names)
+        if new_ids:
+            self.view.scrollTo(self.roster.index(row + len(new_ids) - 1))
+        return len(new_ids)
+
+    def add_from_input(self):
+        if self._insert(self.name_input.text()):
+            self.name_input.clear()
+
+    def paste_from_clipboard(self):
+        text = QApplication.clipboard().text()
+        count = self._insert(parse_names(text))
+        if count:
+            print(f"[RosterEditor] 已匯入 {count} 位")
+
+    def delete_selected(self):
+        rows = [index.row() for index in self.view.selectionModel().selectedRows()]
+        if rows:
+            self.roster.remove_rows(rows)
+
+    def _update_count(self, *args):
+        self.count_label.setText(f"共 {self.roster.rowCount()} 人")
@@ -0,0 +1,80 @@
+"""
+winner_board.py
+---------------
+描述：榮譽榜面板 (Winner Board)。
+功能：
+      1. 標題 + QListView (WinnerListModel)，固定列高 + 逐像素捲動，只繪製看得到的列。
+      2. 大螢幕與控制台的鏡像預覽共用同一個面板，鏡像以 set_scale() 依大螢幕寬度等比例縮小，
+         兩邊的列高、字級與邊框完全一致。
+"""
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QListView
+from PyQt5.QtCore import Qt
+
+BOARD_WIDTH = 350 # 大螢幕上的面板寬度 (像素)
+
+
+class WinnerBoard(QWidget):
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        layout = QVBoxLayout(self)
+        self._base_margins = layout.contentsMargins()
+        self._base_spacing = layout.spacing()
+        self._scale = None
+
+        self.title_label = QLabel("🏆 榮譽榜")
+        self.title_label.setAlignment(Qt.AlignCenter)
+
+        self.list_view = QListView()
+        self.list_view.setModel(model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.list_view.setEditTriggers(QListView.NoEditTriggers)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.list_view)
+        self.set_scale(1.0)
+
+    def set_scale(self, scale):
+        """依比例設定寬度、字級與邊距 (大螢幕為 1.0)"""
+        if scale == self._scale:
+            return
+        self._scale = scale
+        px = lambda v: max(1, int(v * scale))
+        font_px = lambda v: max(6, int(v * scale))
+        m = self._base_margins
+        self.layout().setContentsMargins(int(m.left() * scale), int(m.top() * scale),
+                                         int(m.right() * scale), int(m.bottom() * scale))
+        self.layout().setSpacing(int(self._base_spacing * scale))
+        self.setFixedWidth(px(BOARD_WIDTH))
+        self.setStyleSheet(f"""
+            QWidget {{
+                background-color: rgba(0, 0, 0, 0.4);
+                border-left: {px(3)}px solid rgba(255, 215, 0, 0.5);
+                border-radius: {px(15)}px;
+            }}
+        """)
+        self.title_label.setStyleSheet(
+            f"color: #f1c40f; font-size: {font_px(32)}px; font-weight: bold; padding: {px(10)}px;"
+            " background: transparent; border: none;")
+        self.list_view.setStyleSheet(f"""
+            QListView {{
+                background-color: transparent;
+                border: none;
+                color: white;
+                font-size: {font_px(24)}px;
+                font-weight: bold;
+                font-family: "Microsoft JhengHei";
+                outline: none;
+            }}
+            QListView::item {{
+                padding: {px(15)}px;
+                border-bottom: 1px solid rgba(255,255,255,0.1);
+                color: #ecf0f1;
+            }}
+            QListView::item:selected {{
+                background: transparent;
+                color: #f1c40f;
+            }}
+        """)
@@ -0,0 +1,238 @@
+"""
+avatar_cache.py
+---------------
+描述：抽獎人頭像的背景預先渲染快取 (Avatar Pre-warming Cache)。
+功能：
+      1. 將「解碼原圖 -> 縮放 -> 裁切 -> 圓形遮罩」整套流程改為在背景執行緒 (QThreadPool) 以 QImage 完成。
+      2. 依 (路徑, 檔案修改時間, 裁切模式) 快取結果，發布獎項時只需切換 Pixmap，不再卡住大螢幕。
+      3. 同一張照片會同時準備 'fit' 與 'smart' 兩種版本 (prewarm)。
+      4. 'smart' 模式優先依人臉索引 (face_index) 裁切，找不到人臉時才退回頂部居中放大。
+      5. 已指定給獎項的照片 (pin) 不會被淘汰，獎項再多也不會在發布前被擠出快取。
+"""
+import os
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QRect, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPainterPath
+from utils.image_loader import read_image, probe_image, COVER, FIT
+from utils.face_index import face_index
+
+AVATAR_SIZE = 900          # [設定] 轉盤中心頭像的清晰度 (尺寸越大越清晰)
+SMART_ZOOM_FACTOR = 1.8    # [設定] 縮放係數：1.0=原圖裁切, 1.35=半身特寫, 1.5=大頭特寫
+CROP_MODES = ('fit', 'smart')
+MAX_CACHED_AVATARS = 24    # [設定] 未指定給獎項的頭像最多保留數量 (900x900 約 3MB/張)；已指定的獎項照片不受此限
+FACE_WIDTH_RATIO = 0.38    # [設定] 人臉寬度佔裁切框的比例 (越大臉越大)
+FACE_CENTER_Y = 0.42       # [設定] 人臉中心在裁切框中的垂直位置 (0=頂端, 1=底部)
+
+
+def _cache_key(image_path, crop_mode):
+    try:
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        mtime = 0
+    return (os.path.abspath(image_path), mtime, crop_mode)
+
+
+def _face_crop_rect(src_w, src_h, face):
+    """依人臉框 (相對座標) 計算原圖上的正方形裁切範圍 (left, top, side)"""
+    fx, fy = face[0] * src_w, face[1] * src_h
+    fw, fh = face[2] * src_w, face[3] * src_h
+    side = max(fw, fh) / FACE_WIDTH_RATIO
+    side = min(side, src_w, src_h)
+    cx = fx + fw / 2
+    cy = fy + fh / 2
+    left = min(max(cx - side / 2, 0), src_w - side)
+    top = min(max(cy - side * FACE_CENTER_Y, 0), src_h - side)
+    return left, top, side
+
+
+def _render_face_crop(image_path, face, size):
+    """以人臉為中心裁切；只解碼到裁切框足夠 size 像素所需的解析度"""
+    src = probe_image(image_path)
+    if src is None:
+        return None
+    left, top, side = _face_crop_rect(src.width(), src.height(), face)
+    scale = min(1.0, size / side)
+    decoded = read_image(image_path, round(src.width() * scale), round(src.height() * scale), FIT)
+    if decoded.isNull():
+        return None
+    k = decoded.width() / src.width()
+    rect = QRect(int(left * k), int(top * k), max(1, int(side * k)), max(1, int(side * k)))
+    return decoded.copy(rect).scaled(size, size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def render_avatar_image(image_path, crop_mode='smart', size=AVATAR_SIZE, detect_faces=True):
+    """
+    產生圓形頭像 QImage (可在背景執行緒呼叫，只使用 QImage / QPainter)。
+
+    Args:
+        image_path (str): 原始照片路徑。
+        crop_mode (str): 'smart' (依人臉裁切上半身) 或 'fit' (填滿圓形)。
+        size (int): 輸出的正方形邊長。
+        detect_faces (bool): smart 模式下若尚未建立人臉索引，是否就地偵測 (僅限背景執行緒)。
+
+    Returns:
+        QImage | None: 失敗時回傳 None。
+    """
+    if not image_path or not os.path.exists(image_path):
+        return None
+
+    cropped = None
+    if crop_mode == 'smart':
+        index = face_index()
+        faces = index.ensure(image_path) if detect_faces else index.lookup(image_path)
+        if faces:
+            cropped = _render_face_crop(image_path, faces[0], size)
+    if cropped is None:
+        cropped = _render_default_crop(image_path, crop_mode, size)
+    if cropped is None:
+        return None
+
+    result = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    try:
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addEllipse(0, 0, size, size)
+        painter.setClipPath(path)
+        painter.drawImage(0, 0, cropped)
+    finally:
+        painter.end()
+    return result
+
+
+def _render_default_crop(image_path, crop_mode, size):
+    """沒有人臉資訊時的裁切 (smart: 頂部居中放大；fit: 居中填滿)"""
+    # [優化] 直接以目標解析度解碼 (smart 模式需要 size * zoom 的填滿尺寸)
+    target = int(size * SMART_ZOOM_FACTOR) if crop_mode == 'smart' else size
+    original = read_image(image_path, target, target, COVER)
+    if original.isNull():
+        print(f"[AvatarCache] Error: Failed to load image from {image_path}")
+        return None
+
+    if crop_mode == 'smart':
+        # [優化] 自動裁切邏輯：頂部居中裁切 (Top-Center Crop) + 自動縮放 (Zoom)
+        # 透過 zoom_factor 放大圖片，只取上半身特寫
+        scaled = original.scaled(target, target, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        # 保留水平中心，垂直靠上
+        crop_x = max(0, (scaled.width() - size) // 2)
+        crop_y = 0
+    else:
+        # 一般填滿模式 (Fit)：縮放至填滿圓形後居中裁切
+        scaled = original.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        crop_x = (scaled.width() - size) // 2
+        crop_y = (scaled.height() - size) // 2
+
+    return scaled.copy(crop_x, crop_y, size, size)
+
+
+class _AvatarJobSignals(QObject):
+    # key, image (QImage 或 None)
+    finished = pyqtSignal(object, object)
+
+
+class _AvatarJob(QRunnable):
+    """背景渲染工作 (QImage 可於非 GUI 執行緒繪製)"""
+    def __init__(self, key, image_path, crop_mode, size):
+        super().__init__()
+        self.key = key
+        self.image_path = image_path
+        self.crop_mode = crop_mode
+        self.size = size
+        self.signals = _AvatarJobSignals()
+
+    def run(self):
+        try:
+            image = render_avatar_image(self.image_path, self.crop_mode, self.size)
+        except Exception as e:
+            print(f"[AvatarCache] Background render failed ({self.image_path}): {e}")
+            image = None
+        self.signals.finished.emit(self.key, image)
+
+
+class AvatarCache(QObject):
+    """
+    頭像快取 (GUI 執行緒擁有)
+    - prewarm(): 排入背景渲染
+    - get(): 取得已完成的 QPixmap (未完成時回傳 None)
+    - pin(): 指定目前獎項使用的照片，這些照片的所有裁切版本不會被淘汰
+    """
+    avatarReady = pyqtSignal(str, str)  # image_path, crop_mode
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._images = OrderedDict()   # key -> QImage
+        self._pixmaps = {}             # key -> QPixmap (GUI 執行緒轉換後保留)
+        self._pending = {}             # key -> _AvatarJob (保留參考避免被回收)
+        self._pinned = set()           # 獎項照片的絕對路徑 (不淘汰)
+        self._pool = QThreadPool.globalInstance()
+
+    def prewarm(self, image_path, modes=CROP_MODES, size=AVATAR_SIZE):
+        """在背景準備指定照片的所有裁切版本"""
+        if not image_path or not os.path.exists(image_path):
+            return
+        for mode in modes:
+            key = _cache_key(image_path, mode)
+            if key in self._images or key in self._pending:
+                continue
+            job = _AvatarJob(key, image_path, mode, size)
+            job.setAutoDelete(False)
+            job.signals.finished.connect(self._on_job_finished)
+            self._pending[key] = job
+            self._pool.start(job)
+
+    def is_pending(self, image_path, crop_mode):
+        return _cache_key(image_path, crop_mode) in self._pending
+
+    def get(self, image_path, crop_mode):
+        """回傳已準備好的 QPixmap；尚未完成則回傳 None"""
+        if not image_path:
+            return None
+        key = _cache_key(image_path, crop_mode)
+        pix = self._pixmaps.get(key)
+        if pix is not None:
+            self._images.move_to_end(key)
+            return pix
+        image = self._images.get(key)
+        if image is None:
+            return None
+        self._images.move_to_end(key)
+        pix = QPixmap.fromImage(image)
+        self._pixmaps[key] = pix
+        return pix
+
+    def pin(self, image_paths):
+        """以目前所有獎項照片取代釘選清單，並在背景準備它們的所有裁切版本"""
+        self._pinned = {os.path.abspath(p) for p in image_paths if p}
+        for path in self._pinned:
+            self.prewarm(path)
+        self._evict()
+
+    def _store(self, key, image):
+        self._images[key] = image
+        self._images.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        """淘汰最久未使用的未釘選頭像，直到未釘選數量不超過 MAX_CACHED_AVATARS"""
+        unpinned = [key for key in self._images if key[0] not in self._pinned]
+        for old_key in unpinned[:max(0, len(unpinned) - MAX_CACHED_AVATARS)]:
+            del self._images[old_key]
+            self._pixmaps.pop(old_key, None)
+
+    def _on_job_finished(self, key, image):
+        self._pending.pop(key, None)
+        if image is None:
+            return
+        self._store(key, image)
+        self.avatarReady.emit(key[0], key[2])
+
+
+_shared_cache = None
+
+def avatar_cache():
+    """取得全域共用的頭像快取 (需在 QApplication 建立之後呼叫)"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = AvatarCache()
+    return _shared_cache
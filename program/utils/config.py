@@ -5,6 +5,7 @@ config.py
 功能：
       1. 定義應用程式共用的常數 (如 COLORS 配色表)。
       2. 提供資源路徑解析函式 (resource_path)，解決開發環境與打包環境 (PyInstaller) 的路徑差異問題。
+      3. 提供可寫入的快取資料夾路徑 (get_cache_dir)，存放人臉索引等預先計算結果。
 """
 import sys
 import os
@@ -29,6 +30,62 @@ def resource_path(relative_path):
         # Dev mode
         return os.path.abspath(relative_path)
 
+def get_cache_dir(sub_folder=None):
+    """ 取得可寫入的快取資料夾 (EXE 旁或專案根目錄下的 cache/)，不存在時自動建立 """
+    if getattr(sys, 'frozen', False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        # program/utils/config.py -> 專案根目錄
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    cache_dir = os.path.join(base_dir, "cache")
+    if sub_folder:
+        cache_dir = os.path.join(cache_dir, sub_folder)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+# --- 控制台即時監控 ---
+# "mirror": 依大螢幕狀態重繪的鏡像預覽 (不截圖，跨程序/跨機器也可用)
+# "grab":   直接以縮圖解析度繪製大螢幕畫面 (僅限同一程序)
+LIVE_MONITOR_MODE = "mirror"
+
+# --- 大螢幕程序 ---
+# True: 大螢幕在獨立程序中執行 (亦可用命令列參數 --display-process 啟用)，
+#       控制台的對話框、存檔與照片處理不會造成大螢幕掉幀
+DISPLAY_SEPARATE_PROCESS = False
+
+# --- 多螢幕同步 ---
+# 控制台監聽的 TCP port (0 = 停用；亦可用命令列參數 --sync-hub PORT 啟用)
+# 其他電腦執行 main.py --sync-node 控制台IP:PORT 即可顯示同步的大螢幕
+SYNC_HUB_PORT = 0
+
+# --- 網頁觀眾端 ---
+# 內嵌 HTTP / WebSocket 伺服器的 port (0 = 停用；亦可用命令列參數 --audience-port PORT 啟用)
+# 遠端同仁以瀏覽器開啟 http://控制台IP:PORT/ 即可觀看
+AUDIENCE_SERVER_PORT = 0
+
+# --- 控制 API ---
+# 本機 HTTP 控制 API 的 port (0 = 停用；亦可用命令列參數 --control-api PORT 啟用)
+# 預設只接受本機連線；平板遙控時改為 "0.0.0.0"。請求需帶 X-Api-Token 標頭；
+# CONTROL_API_TOKEN 留空時每次啟動隨機產生 (顯示於主控台)
+CONTROL_API_PORT = 0
+CONTROL_API_HOST = "127.0.0.1"
+CONTROL_API_TOKEN = ""
+
+# --- 閒置省電模式 ---
+# 沒有輸入、指令或轉動超過 IDLE_AFTER_S 秒後，大螢幕進入閒置模式 (0 = 停用)：
+# 呼吸燈降低更新頻率、只重繪 LED 燈環，控制台監控也跟著降頻；任何輸入或指令立即喚醒
+IDLE_AFTER_S = 20
+IDLE_LED_INTERVAL_MS = 200   # 閒置時呼吸燈的更新間隔 (平時 50ms)
+IDLE_BREATH_RATE = 0.5       # 閒置時呼吸燈速度相對於平時的倍率
+
+# --- 轉盤 LED 燈環 ---
+# 燈泡以 Sprite Atlas 批次繪製，可加到數百顆做出密集跑馬燈效果
+WHEEL_LED_COUNT = 36
+
+# --- 大獎慶祝 ---
+# 獎項名稱包含以下任一關鍵字時，確認中獎後使用「大獎模式」彩帶 (數千片紙花，含重力 / 旋轉 / 翻面)
+GRAND_PRIZE_KEYWORDS = ("社長獎",)
+
 # --- 配色設定 ---
 COLORS = [
     QColor(220, 20, 60),   # 猩紅
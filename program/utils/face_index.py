@@ -0,0 +1,226 @@
+"""
+face_index.py
+-------------
+描述：人臉位置索引 (Face Index)。
+功能：
+      1. 使用 OpenCV 內建的 Haar Cascade (純 CPU) 偵測照片中的人臉。
+      2. 每張照片只偵測一次，結果以「檔案內容雜湊 (SHA-1)」為 key 存入 cache/face_index.json，
+         重新啟動或照片改名後仍可直接查詢。
+      3. 偵測一律在背景執行緒進行；繪製時的 smart 裁切只做查詢。
+         整批排程的照片使用專用的小型執行緒池 (不佔用頭像 / 圖層渲染共用的全域 QThreadPool)，
+         索引檔也改為整批完成或每隔數秒才寫入一次。
+      4. 控制台與大螢幕獨立程序各有一份索引：寫檔前先重新讀取檔案並合併，不會覆蓋掉另一個程序的結果。
+      人臉框以 0~1 的相對座標 (x, y, w, h) 儲存，與解碼解析度無關 (已套用 EXIF 方向)。
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+import numpy as np
+import cv2
+from PyQt5.QtCore import QRunnable, QThreadPool
+from PyQt5.QtGui import QImage
+from utils.config import get_cache_dir
+from utils.image_loader import read_image, FIT
+
+INDEX_FILE_NAME = "face_index.json"
+INDEX_VERSION = 1
+DETECT_MAX_SIDE = 640       # [設定] 偵測用的解碼尺寸 (長邊像素)，越小越快
+MIN_FACE_RATIO = 0.04       # [設定] 最小人臉 (相對於短邊)，濾除雜訊
+DETECT_THREADS = 1          # [設定] 整批偵測的專用執行緒數
+SAVE_INTERVAL_S = 2.0       # [設定] 整批偵測期間，索引檔最短寫入間隔
+
+
+def _file_hash(path):
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _qimage_to_gray(image):
+    gray = image.convertToFormat(QImage.Format_Grayscale8)
+    w, h, bpl = gray.width(), gray.height(), gray.bytesPerLine()
+    ptr = gray.constBits()
+    ptr.setsize(h * bpl)
+    return np.frombuffer(ptr, np.uint8).reshape((h, bpl))[:, :w].copy()
+
+
+class FaceIndex:
+    """
+    執行緒安全的人臉索引
+    - lookup(): 只查詢 (未建立索引時回傳 None)
+    - ensure(): 查詢，若沒有則就地偵測並寫入索引 (只能在背景執行緒呼叫)
+    - schedule(): 將多張照片排入背景偵測
+    """
+    def __init__(self, index_path=None):
+        self.index_path = index_path or os.path.join(get_cache_dir(), INDEX_FILE_NAME)
+        self._lock = threading.Lock()
+        self._faces = {}        # file hash -> [[x, y, w, h], ...]
+        self._hashes = {}       # (abspath, mtime, size) -> file hash
+        self._in_progress = {}  # file hash -> threading.Event
+        self._local = threading.local() # 每個執行緒各自的 CascadeClassifier (OpenCV 物件非執行緒安全)
+        self._queued = 0        # 已排程、尚未完成的整批偵測數
+        self._dirty = False     # 索引有尚未寫入檔案的變更
+        self._saved_at = 0.0
+        self._pool = None       # 專用執行緒池 (第一次 schedule 時於 GUI 執行緒建立)
+        self._load()
+
+    # --- 持久化 ---
+    def _read_file(self):
+        """讀取索引檔中的人臉資料 (不存在或格式不符時回傳空 dict)"""
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and isinstance(data.get("faces"), dict):
+                return data["faces"]
+        except Exception as e:
+            print(f"[FaceIndex] 讀取索引失敗，將重新建立: {e}")
+        return {}
+
+    def _load(self):
+        self._faces = self._read_file()
+
+    def _maybe_save_locked(self):
+        """整批偵測進行中時限制寫入頻率；批次結束 (或單張偵測) 時立即寫入"""
+        if self._dirty and (self._queued == 0 or time.monotonic() - self._saved_at >= SAVE_INTERVAL_S):
+            self._save_locked()
+
+    def _save_locked(self):
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp" # 大螢幕獨立程序時可能有兩個程序同時寫入
+        try:
+            # [修正] 先合併另一個程序已寫入的結果 (同一張照片的偵測結果相同，以本程序為準)
+            merged = self._read_file()
+            merged.update(self._faces)
+            self._faces = merged
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "faces": self._faces}, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"[FaceIndex] 寫入索引失敗: {e}")
+
+    # --- 查詢 ---
+    def _hash_for(self, path):
+        st = os.stat(path)
+        memo_key = (os.path.abspath(path), st.st_mtime, st.st_size)
+        with self._lock:
+            cached = self._hashes.get(memo_key)
+        if cached is None:
+            cached = _file_hash(path)
+            with self._lock:
+                self._hashes[memo_key] = cached
+        return cached
+
+    def lookup(self, path):
+        """回傳人臉框清單 (可能為空)；若尚未偵測過則回傳 None"""
+        try:
+            key = self._hash_for(path)
+        except OSError:
+            return None
+        with self._lock:
+            return self._faces.get(key)
+
+    def ensure(self, path):
+        """取得人臉框，若尚未建立索引則立即偵測 (阻塞，僅限背景執行緒)"""
+        try:
+            key = self._hash_for(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            if key in self._faces:
+                return self._faces[key]
+            waiter = self._in_progress.get(key)
+            if waiter is None:
+                self._in_progress[key] = threading.Event()
+        if waiter is not None:
+            # 另一個執行緒正在偵測同一張照片，等待其結果
+            waiter.wait()
+            with self._lock:
+                return self._faces.get(key)
+
+        faces = None
+        try:
+            faces = self._detect(path)
+        except Exception as e:
+            print(f"[FaceIndex] 偵測失敗 ({path}): {e}")
+        with self._lock:
+            if faces is not None:
+                self._faces[key] = faces
+                self._dirty = True
+                self._maybe_save_locked()
+            self._in_progress.pop(key).set()
+        return faces
+
+    def schedule(self, paths):
+        """將尚未建立索引的照片排入背景偵測 (GUI 執行緒可安全呼叫)"""
+        if self._pool is None:
+            self._pool = QThreadPool()
+            self._pool.setMaxThreadCount(DETECT_THREADS)
+        paths = list(paths)
+        with self._lock:
+            self._queued += len(paths)
+        for path in paths:
+            self._pool.start(_FaceJob(self, path))
+
+    def job_finished(self):
+        """整批偵測的一張照片處理完畢 (由 _FaceJob 呼叫，成功與否皆須呼叫)"""
+        with self._lock:
+            self._queued -= 1
+            self._maybe_save_locked()
+
+    # --- 偵測 ---
+    def _classifier(self):
+        clf = getattr(self._local, 'classifier', None)
+        if clf is None:
+            cascade_path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+            clf = cv2.CascadeClassifier(cascade_path)
+            if clf.empty():
+                raise RuntimeError(f"無法載入人臉模型: {cascade_path}")
+            self._local.classifier = clf
+        return clf
+
+    def _detect(self, path):
+        image = read_image(path, DETECT_MAX_SIDE, DETECT_MAX_SIDE, FIT)
+        if image.isNull():
+            return None
+        gray = cv2.equalizeHist(_qimage_to_gray(image))
+        h, w = gray.shape
+        min_side = int(min(w, h) * MIN_FACE_RATIO)
+        boxes = self._classifier().detectMultiScale(
+            gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_side, min_side))
+        # 依面積由大到小排序，第一個視為主角
+        faces = [[x / w, y / h, bw / w, bh / h] for (x, y, bw, bh) in boxes]
+        faces.sort(key=lambda b: b[2] * b[3], reverse=True)
+        return faces
+
+
+class _FaceJob(QRunnable):
+    def __init__(self, index, path):
+        super().__init__()
+        self.index = index
+        self.path = path
+
+    def run(self):
+        try:
+            self.index.ensure(self.path)
+        finally:
+            self.index.job_finished()
+
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+def face_index():
+    """取得全域共用的人臉索引 (背景執行緒亦可呼叫)"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = FaceIndex()
+        return _shared_index
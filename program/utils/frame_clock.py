@@ -0,0 +1,143 @@
+"""
+frame_clock.py
+--------------
+描述：全域畫面時脈 (Frame Clock)。
+功能：
+      1. 以單一 PreciseTimer 取代各元件各自的 QTimer (轉盤 10ms、LED 50ms、彩帶 20ms)，
+         間隔對齊螢幕更新率 (Qt Widgets 沒有 vsync 回呼，以 refreshRate 換算)。
+      2. 訂閱者 subscribe(callback, interval_ms) 後每個畫面 (或每 interval_ms) 收到 dt (秒)。
+      3. request_update(widget, region) 收集重繪需求，每個畫面結束時對每個元件只呼叫一次 update()，
+         同一畫面中多個特效的重繪會合併成一次 paint。
+      4. 沒有任何訂閱者與重繪需求時自動暫停，不消耗 CPU。
+      5. 訂閱者以弱參照保存；元件被刪除 (destroyed) 時自動取消訂閱。回呼發生錯誤只記錄一次。
+"""
+import time
+import weakref
+from PyQt5.QtCore import QObject, QTimer, Qt
+from PyQt5.QtGui import QGuiApplication, QRegion
+
+DEFAULT_REFRESH_HZ = 60.0
+MAX_DT = 0.25  # 暫停或卡頓後的第一個畫面，dt 最多視為 250ms (避免動畫一次跳太遠)
+
+
+def _callback_key(callback):
+    """同一物件的同一方法視為同一訂閱者 (不持有物件本身)"""
+    owner = getattr(callback, '__self__', None)
+    if owner is not None:
+        return (id(owner), callback.__func__)
+    return callback
+
+
+class _Subscriber:
+    __slots__ = ("ref", "interval", "elapsed", "failed")
+
+    def __init__(self, callback, interval):
+        if getattr(callback, '__self__', None) is not None:
+            self.ref = weakref.WeakMethod(callback)
+        else:
+            self.ref = lambda: callback
+        self.interval = interval
+        self.elapsed = 0.0
+        self.failed = False
+
+
+class FrameClock(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = {}   # _callback_key(callback) -> _Subscriber
+        self._dirty = {}         # widget -> QRegion (None = 整個元件)
+        self._last_tick = None
+        self.frame_index = 0
+
+        screen = QGuiApplication.primaryScreen()
+        refresh = screen.refreshRate() if screen is not None else 0
+        self.frame_interval_ms = max(1, int(round(1000.0 / (refresh or DEFAULT_REFRESH_HZ))))
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    # --- 訂閱 ---
+    def subscribe(self, callback, interval_ms=0):
+        """每個畫面 (或至少間隔 interval_ms) 呼叫 callback(dt)；重複訂閱只會更新間隔"""
+        key = _callback_key(callback)
+        sub = self._subscribers.get(key)
+        if sub is None:
+            self._subscribers[key] = _Subscriber(callback, interval_ms / 1000.0)
+            owner = getattr(callback, '__self__', None)
+            if isinstance(owner, QObject):
+                # 元件被刪除時取消訂閱 (lambda 只持有 key，不持有元件)
+                owner.destroyed.connect(lambda *_, _key=key: self._subscribers.pop(_key, None))
+        else:
+            sub.interval = interval_ms / 1000.0
+        self._ensure_running()
+
+    def unsubscribe(self, callback):
+        self._subscribers.pop(_callback_key(callback), None)
+
+    def is_subscribed(self, callback):
+        return _callback_key(callback) in self._subscribers
+
+    # --- 重繪合併 ---
+    def request_update(self, widget, region=None):
+        """在本畫面結束時重繪 widget (region 為 QRegion / QRect；None 表示整個元件)"""
+        if widget in self._dirty:
+            pending = self._dirty[widget]
+            if pending is not None:
+                self._dirty[widget] = None if region is None else pending.united(QRegion(region))
+        else:
+            self._dirty[widget] = None if region is None else QRegion(region)
+        self._ensure_running()
+
+    def _ensure_running(self):
+        if not self._timer.isActive():
+            self._last_tick = time.perf_counter()
+            self._timer.start(self.frame_interval_ms)
+
+    def _tick(self):
+        now = time.perf_counter()
+        dt = min(now - self._last_tick, MAX_DT)
+        self._last_tick = now
+        self.frame_index += 1
+
+        for key, sub in list(self._subscribers.items()):
+            if self._subscribers.get(key) is not sub:
+                continue # 同一畫面中被其他訂閱者取消
+            callback = sub.ref()
+            if callback is None:
+                del self._subscribers[key] # 物件已被回收
+                continue
+            sub.elapsed += dt
+            if sub.elapsed + 1e-4 < sub.interval:
+                continue
+            elapsed, sub.elapsed = sub.elapsed, 0.0
+            try:
+                callback(elapsed)
+            except Exception as e:
+                if not sub.failed: # 每個訂閱者只記錄一次，避免每秒數十行重複訊息
+                    sub.failed = True
+                    print(f"[FrameClock] 訂閱者發生錯誤 ({getattr(callback, '__qualname__', callback)}): {e}")
+
+        dirty, self._dirty = self._dirty, {}
+        for widget, region in dirty.items():
+            try:
+                if region is None:
+                    widget.update()
+                else:
+                    widget.update(region)
+            except RuntimeError:
+                pass # 元件已被刪除
+
+        # 沒有訂閱者也沒有待重繪的元件 -> 暫停
+        if not self._subscribers and not self._dirty:
+            self._timer.stop()
+
+
+_shared_clock = None
+
+def frame_clock():
+    """取得全域共用的畫面時脈 (需在 QApplication 建立之後呼叫)"""
+    global _shared_clock
+    if _shared_clock is None:
+        _shared_clock = FrameClock()
+    return _shared_clock
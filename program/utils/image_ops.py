@@ -0,0 +1,98 @@
+"""
+image_ops.py
+------------
+描述：向量化影像處理工具 (NumPy / OpenCV)。
+功能：
+      1. remove_white_background(): 從四個角落 Flood Fill 找出白色背景，
+         以 erode 保留一圈白邊後將背景設為透明 (取代逐像素的 Python BFS)。
+      2. load_cutout_image() / load_cutout_pixmap(): 讀取 LOGO / 游標素材並去背，
+         結果快取於 cache/assets/ (以路徑、修改時間與參數為 key)，下次啟動直接讀 PNG。
+"""
+import os
+import hashlib
+import numpy as np
+import cv2
+from PyQt5.QtGui import QImage, QPixmap
+from utils.config import get_cache_dir
+from utils.image_loader import read_image, FIT
+
+WHITE_THRESHOLD = 230   # [設定] RGB 皆大於此值視為白色 (可容忍 JPG 的白色雜訊)
+EDGE_PADDING = 5        # [設定] 保留的白邊寬度 (像素)
+
+
+def remove_white_background(image, threshold=WHITE_THRESHOLD, padding=EDGE_PADDING):
+    """
+    將與四個角落相連的白色背景轉為透明。
+
+    Args:
+        image (QImage): 來源圖片 (任意格式)。
+        threshold (int): 白色門檻值。
+        padding (int): 以 3x3 erode 迭代次數保留的白邊寬度。
+
+    Returns:
+        QImage: Format_ARGB32 的去背結果。
+    """
+    img = image.convertToFormat(QImage.Format_ARGB32)
+    w, h, bpl = img.width(), img.height(), img.bytesPerLine()
+    if w == 0 or h == 0:
+        return img
+    ptr = img.constBits()
+    ptr.setsize(h * bpl)
+    # ARGB32 在記憶體中的順序為 B, G, R, A (little-endian)
+    bgra = np.frombuffer(ptr, np.uint8).reshape((h, bpl // 4, 4))[:, :w].copy()
+
+    white = ((bgra[:, :, 0] > threshold) &
+             (bgra[:, :, 1] > threshold) &
+             (bgra[:, :, 2] > threshold)).astype(np.uint8) * 255
+
+    # 1. 從四個角落 Flood Fill (4 鄰居)，與角落相連的白色區域標記為 128
+    mask = np.zeros((h + 2, w + 2), np.uint8)
+    for x, y in ((0, 0), (w - 1, 0), (0, h - 1), (w - 1, h - 1)):
+        if white[y, x] == 255:
+            cv2.floodFill(white, mask, (x, y), 128, 0, 0, 4)
+    background = (white == 128).astype(np.uint8)
+
+    # 2. 邊緣保留 (Erosion)：背景往外縮 padding 像素 (8 鄰居)，圖片外視為背景
+    if padding > 0:
+        background = cv2.erode(background, np.ones((3, 3), np.uint8), iterations=padding,
+                               borderType=cv2.BORDER_CONSTANT, borderValue=1)
+
+    # 3. 去背 (整個像素設為 0 = 完全透明)
+    bgra[background.astype(bool)] = 0
+    return QImage(bgra.data, w, h, w * 4, QImage.Format_ARGB32).copy()
+
+
+def _cache_file(path, max_side, threshold, padding):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0
+    raw = f"{os.path.abspath(path)}|{mtime}|{max_side}|{threshold}|{padding}"
+    return os.path.join(get_cache_dir("assets"), hashlib.sha1(raw.encode('utf-8')).hexdigest() + ".png")
+
+
+def load_cutout_image(path, max_side=None, threshold=WHITE_THRESHOLD, padding=EDGE_PADDING):
+    """讀取素材並去除白色背景 (優先使用磁碟快取)；失敗時回傳 isNull() 的 QImage"""
+    cache_file = _cache_file(path, max_side, threshold, padding)
+    if os.path.exists(cache_file):
+        cached = QImage(cache_file)
+        if not cached.isNull():
+            return cached
+
+    source = read_image(path, max_side, max_side, FIT)
+    if source.isNull():
+        return source
+    result = remove_white_background(source, threshold, padding)
+    try:
+        result.save(cache_file, "PNG")
+    except Exception as e:
+        print(f"[ImageOps] 無法寫入快取 {cache_file}: {e}")
+    return result
+
+
+def load_cutout_pixmap(path, max_side=None, threshold=WHITE_THRESHOLD, padding=EDGE_PADDING):
+    """load_cutout_image 的 QPixmap 版本 (僅限 GUI 執行緒)"""
+    image = load_cutout_image(path, max_side, threshold, padding)
+    if image.isNull():
+        return None
+    return QPixmap.fromImage(image)
@@ -0,0 +1,85 @@
+"""
+layer_renderer.py
+-----------------
+描述：圖層背景渲染 (Threaded Offscreen Layers)。
+功能：
+      1. 將較重的圖層 (例如上千個名字的轉盤面) 交給背景執行緒 (QThreadPool) 以 QImage 繪製。
+      2. 同一圖層只採用最新一次請求的結果；完成後在 GUI 執行緒轉成 QPixmap 並一次替換，
+         GUI 執行緒只負責合成，不會因重繪圖層而卡住動畫。
+      3. [修改] 每個 LayerRenderer 使用自己的單執行緒池；新請求會取消同一圖層尚未開始的舊工作，
+         名單連續變更時不會排出一長串註定被丟棄的渲染。
+"""
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPixmap
+
+
+class _LayerJobSignals(QObject):
+    # 圖層名稱, key, image (QImage 或 None)
+    finished = pyqtSignal(str, object, object)
+
+
+class _LayerJob(QRunnable):
+    """背景渲染工作 (render_fn 只能使用 QImage / QPainter，不可碰觸任何 QWidget)"""
+    def __init__(self, name, key, render_fn, args):
+        super().__init__()
+        self.name = name
+        self.key = key
+        self.render_fn = render_fn
+        self.args = args
+        self.signals = _LayerJobSignals()
+
+    def run(self):
+        try:
+            image = self.render_fn(*self.args)
+        except Exception as e:
+            print(f"[LayerRenderer] 背景渲染失敗 ({self.name}): {e}")
+            image = None
+        self.signals.finished.emit(self.name, self.key, image)
+
+
+class LayerRenderer(QObject):
+    """
+    圖層快取 (GUI 執行緒擁有)
+    - request(): 排入背景渲染 (相同 key 已完成或排程中則略過；同圖層尚未開始的舊工作直接取消)
+    - get(): 取得目前的 (key, QPixmap)，可能是較舊的版本，由呼叫端判斷是否沿用
+    """
+    layerReady = pyqtSignal(str) # 圖層名稱
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._layers = {}       # 名稱 -> (key, QPixmap)
+        self._requested = {}    # 名稱 -> 最新請求的 key
+        self._jobs = set()      # 執行中的工作 (保留參考避免被回收)
+        self._queued = {}       # 名稱 -> 最新排入的工作 (尚未開始時可取消)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def request(self, name, key, render_fn, *args):
+        current = self._layers.get(name)
+        if (current is not None and current[0] == key) or self._requested.get(name) == key:
+            return
+        self._requested[name] = key
+        stale = self._queued.pop(name, None)
+        if stale is not None and self._pool.tryTake(stale):
+            self._jobs.discard(stale)
+        job = _LayerJob(name, key, render_fn, args)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(lambda n, k, image, _job=job: self._on_job_finished(_job, n, k, image))
+        self._jobs.add(job)
+        self._queued[name] = job
+        self._pool.start(job)
+
+    def get(self, name):
+        return self._layers.get(name)
+
+    def _on_job_finished(self, job, name, key, image):
+        self._jobs.discard(job)
+        if self._queued.get(name) is job:
+            del self._queued[name]
+        if self._requested.get(name) != key:
+            return # 已有更新的請求，丟棄過期的結果
+        del self._requested[name]
+        if image is None or image.isNull():
+            return
+        self._layers[name] = (key, QPixmap.fromImage(image))
+        self.layerReady.emit(name)
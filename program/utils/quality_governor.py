@@ -0,0 +1,97 @@
+"""
+quality_governor.py
+-------------------
+描述：特效品質調節器 (Adaptive Quality Governor)。
+功能：
+      1. 收集每一幀各元件 paintEvent 的繪製時間 (轉動中的轉盤、彩帶)，同一幀 (FrameClock 幀序號) 的
+         時間加總後與畫面預算 (FrameClock 的幀間隔) 比較；監控縮圖等離屏繪製期間暫停收集 (pause / resume)。
+      2. 壓力過大時依序關閉特效 (一次一級)：
+           速度線 -> 聚光燈 -> LED 光暈 -> 反鋸齒 -> 彩帶數量減半 -> 文字陰影
+      3. 有餘裕時再依相反順序逐級恢復。降級看短時間平均、升級需要長時間穩定，
+         且每次調整後有冷卻時間 (Hysteresis)，避免品質來回閃爍。
+"""
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, pyqtSignal
+from utils.frame_clock import frame_clock
+
+# 降級順序 (越前面越先關閉)
+EFFECT_ORDER = ("speed_lines", "spotlight", "led_halo", "antialiasing", "confetti", "text_shadow")
+
+DOWN_RATIO = 0.6       # [設定] 繪製時間平均超過幀預算的 60% -> 降一級 (保留時間給合成與物理)
+UP_RATIO = 0.25        # [設定] 長時間低於幀預算的 25% -> 升一級
+DOWN_WINDOW = 15       # [設定] 降級判斷的幀數 (約 0.25 秒，反應要快)
+UP_WINDOW = 120        # [設定] 升級判斷的幀數 (約 2 秒，確認真的有餘裕)
+COOLDOWN_S = 1.0       # [設定] 每次調整後的冷卻時間
+
+
+class QualityGovernor(QObject):
+    levelChanged = pyqtSignal(int) # 目前關閉的特效數量 (0 = 全部開啟)
+
+    def __init__(self, budget_ms, parent=None):
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self.level = 0
+        self._samples = deque(maxlen=UP_WINDOW)
+        self._changed_at = 0.0
+        self._enabled = {name: True for name in EFFECT_ORDER}
+        self._paused = 0
+        self._frame = None      # 目前累計中的幀序號
+        self._frame_ms = 0.0    # 該幀目前的繪製時間總和
+
+    def enabled(self, effect):
+        """目前品質等級下此特效是否開啟"""
+        return self._enabled[effect]
+
+    def pause(self):
+        """暫停收集 (離屏縮圖等不代表真實負載的繪製)；需與 resume() 成對呼叫"""
+        self._paused += 1
+
+    def resume(self):
+        self._paused = max(0, self._paused - 1)
+
+    def record(self, paint_ms):
+        """記錄一次 paintEvent 的繪製時間 (毫秒)；同一幀的多個元件會加總成一個樣本"""
+        if self._paused:
+            return
+        frame = frame_clock().frame_index
+        if frame != self._frame:
+            if self._frame is not None:
+                self._add_sample(self._frame_ms)
+            self._frame, self._frame_ms = frame, 0.0
+        self._frame_ms += paint_ms
+
+    def _add_sample(self, frame_ms):
+        self._samples.append(frame_ms)
+        if time.perf_counter() - self._changed_at < COOLDOWN_S:
+            return
+
+        n = len(self._samples)
+        if n >= DOWN_WINDOW and self.level < len(EFFECT_ORDER):
+            recent = list(self._samples)[-DOWN_WINDOW:]
+            if sum(recent) / DOWN_WINDOW > self.budget_ms * DOWN_RATIO:
+                self._set_level(self.level + 1)
+                return
+        if n >= UP_WINDOW and self.level > 0:
+            if max(self._samples) < self.budget_ms * UP_RATIO:
+                self._set_level(self.level - 1)
+
+    def _set_level(self, level):
+        self.level = level
+        for i, name in enumerate(EFFECT_ORDER):
+            self._enabled[name] = i >= level
+        self._samples.clear()
+        self._changed_at = time.perf_counter()
+        disabled = ", ".join(EFFECT_ORDER[:level]) or "無"
+        print(f"[QualityGovernor] 品質等級 {level} (已關閉: {disabled})")
+        self.levelChanged.emit(level)
+
+
+_shared_governor = None
+
+def quality_governor():
+    """取得全域共用的品質調節器 (需在 QApplication 建立之後呼叫)"""
+    global _shared_governor
+    if _shared_governor is None:
+        _shared_governor = QualityGovernor(frame_clock().frame_interval_ms)
+    return _shared_governor
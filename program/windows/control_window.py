@@ -10,18 +10,27 @@ control_window.py
 """
 import os
 import json # [新增] JSON 用於存檔
-import random
 import sys
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QTextEdit, QLabel, 
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QPushButton, QLabel, 
                              QFileDialog, QMessageBox, QLineEdit, QComboBox, 
                              QGroupBox, QFrame, QInputDialog, QSizePolicy, QSlider)
-from PyQt5.QtCore import Qt, QTimer, QUrl, QSize
-from PyQt5.QtGui import QFont, QImage, QPixmap
+from PyQt5.QtCore import Qt, QUrl, QSize
+from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtMultimedia import QSoundEffect, QMediaPlayer, QMediaContent
 from .display_window import DisplayWindow
+from .display_process import RemoteDisplayProxy
+from services.display_sync import SyncHub, FanoutDisplay
+from services.audience_server import AudienceServer
+from services.control_api import ControlApiServer
 from ui_components.lucky_wheel import LuckyWheelWidget
-from utils.config import resource_path
+from ui_components.live_monitor import LiveMonitor
+from ui_components.display_mirror import DisplayMirror
+from models.roster_model import RosterModel
+from ui_components.roster_editor import RosterEditor
+from utils.config import resource_path, LIVE_MONITOR_MODE, CONTROL_API_HOST, CONTROL_API_TOKEN, GRAND_PRIZE_KEYWORDS
+from utils.avatar_cache import avatar_cache
+from utils.image_loader import probe_image
 
 class ControlWindow(QMainWindow):
     """
@@ -30,8 +39,9 @@ class ControlWindow(QMainWindow):
     - 預覽畫面
     - 決定是否保留中獎結果
     """
-    def __init__(self):
+    def __init__(self, separate_display=False, sync_port=0, audience_port=0, control_api_port=0):
         super().__init__()
+        self.separate_display = separate_display
         self.setWindowTitle("後台控制系統 - 90週年尾牙")
         self.resize(1400, 900) # [修改] 加大視窗尺寸
         
@@ -84,9 +94,17 @@ class ControlWindow(QMainWindow):
             "黃珮珊\n楊麗玉\n江辰平\n范孝慈\n陳妍淇\n張芮溱"
         )
         self.current_prize_idx = -1
+        self.interactive = True       # False: 不跳出確認視窗 (由控制 API 驅動)
+        self.pending_winner = None    # 轉盤已停止、等待確認歸檔的中獎者
+        self.pending_winner_index = None # 中獎者在轉盤上的格子位置 (同名時據此分辨)
+        self._display_synced = False     # 大螢幕轉盤與名單完全一致 (此時中獎者只需移除一格，不必重送整份名單)
+        self._confirming = False         # confirm_winner 移除中獎者中 (只有這次移除需要同步到大螢幕)
+        self._winner_dialog = None
         
         # [新增] 讀取存檔
         self.load_data()
+        # [新增] 名單模型：只在此解析一次，之後以編號增刪 (轉盤依變更信號增量更新)
+        self.roster = RosterModel(self.list_content, self)
         # 不要從存檔還原獎項對應的頭像，使用者每次啟動需重新選擇
         try:
             self.prize_avatars = {}
@@ -94,15 +112,28 @@ class ControlWindow(QMainWindow):
             pass
         
         # 初始化大螢幕視窗
-        self.display_window = DisplayWindow()
-        self.display_window.show() # 開啟第二視窗 (通常會出現在第二螢幕，若無則重疊)
-        
-        # 嘗試將第二視窗移至第二螢幕
-        desktop = QApplication.desktop()
-        if desktop.screenCount() > 1:
-            second_screen_rect = desktop.screenGeometry(1)
-            self.display_window.move(second_screen_rect.topLeft())
-            self.display_window.showFullScreen()
+        # [新增] separate_display=True 時大螢幕在獨立程序中執行 (RemoteDisplayProxy)，
+        # 控制台的對話框與存檔不會影響大螢幕動畫；兩者提供相同的指令介面與信號
+        if self.separate_display:
+            self.display_window = RemoteDisplayProxy(self)
+            self.display_window.displayLost.connect(self.on_display_lost) # [新增] 大螢幕程序意外結束
+        else:
+            self.display_window = DisplayWindow()
+        # 開啟第二視窗 (有第二螢幕時移至第二螢幕全螢幕，若無則重疊)
+        self.display_window.show_on_preferred_screen()
+
+        # [新增] 多螢幕同步：指令與轉動計畫同時廣播給區網內的其他大螢幕節點
+        self.sync_hub = None
+        if sync_port:
+            self.sync_hub = SyncHub(sync_port, self)
+            self.sync_hub.nodesChanged.connect(self.on_sync_nodes_changed)
+            self.display_window = FanoutDisplay(self.display_window, self.sync_hub)
+
+        # [新增] 網頁觀眾端：背景執行緒的 asyncio 伺服器，以固定頻率廣播轉盤狀態
+        self.audience_server = None
+        if audience_port:
+            self.audience_server = AudienceServer(self.display_window, audience_port, parent=self)
+            self.audience_server.start()
         
         # 連接大螢幕的開始信號
         # self.display_window.requestSpin.connect(self.master_start_spin) # [移除] 舊的單擊邏輯
@@ -117,11 +148,12 @@ class ControlWindow(QMainWindow):
         
         self.init_ui()
         self.setup_style()
-        
-        # [新增] 即時監控 Timer
-        self.monitor_timer = QTimer(self)
-        self.monitor_timer.timeout.connect(self.update_live_monitor)
-        self.monitor_timer.start(200) # 每 200ms 更新一次
+
+        # [新增] 本機 HTTP 控制 API (平板 / 彩排腳本)，所有操作皆排入 GUI 執行緒執行
+        self.control_api = None
+        if control_api_port:
+            self.control_api = ControlApiServer(self, control_api_port, CONTROL_API_HOST, CONTROL_API_TOKEN, parent=self)
+            self.control_api.start()
         
     def closeEvent(self, event):
         # 可以在此加入確認對話框
@@ -132,6 +164,10 @@ class ControlWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             # [新增] 關閉前自動存檔
             self.save_data()
+            if self.audience_server is not None:
+                self.audience_server.stop()
+            if self.control_api is not None:
+                self.control_api.stop()
             self.display_window.close()
             event.accept()
         else:
@@ -152,7 +188,7 @@ class ControlWindow(QMainWindow):
             QLabel { color: bdfeff; font-weight: bold; font-size: 16px; font-family: "Microsoft JhengHei"; }
             QPushButton { background-color: #2980b9; color: white; padding: 10px; border-radius: 5px; font-weight: bold; font-family: "Microsoft JhengHei";}
             QPushButton:hover { background-color: #3498db; }
-            QLineEdit, QComboBox, QTextEdit { padding: 8px; color: #333; background: #ecf0f1; border-radius: 4px; font-size: 14px; }
+            QLineEdit, QComboBox, QListView { padding: 8px; color: #333; background: #ecf0f1; border-radius: 4px; font-size: 14px; }
             QGroupBox { border: 2px solid #7f8c8d; border-radius: 5px; margin-top: 20px; font-weight: bold; color: #ecf0f1; padding: 10px; }
             QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
         """)
@@ -213,8 +249,8 @@ class ControlWindow(QMainWindow):
         list_group = QGroupBox("👥 名單管理")
         lg_layout = QVBoxLayout(list_group)
         
-        self.list_edit = QTextEdit()
-        self.list_edit.setPlainText(self.list_content) # [修改] 使用讀取的名單
+        # [修改] 名單編輯器改為 Model/View (直接編輯 RosterModel，數萬筆名單也不卡)
+        self.list_edit = RosterEditor(self.roster)
         
         shuffle_btn = QPushButton("🔀 打散名單排序")
         shuffle_btn.setStyleSheet("background-color: #2980b9; margin-top: 5px;")
@@ -377,10 +413,16 @@ class ControlWindow(QMainWindow):
         lbl_monitor_title.setStyleSheet("color: red; font-weight: bold; background: none; border: none;")
         lbl_monitor_title.setAlignment(Qt.AlignCenter)
         
-        self.live_monitor_label = QLabel()
+        # [修改] 預設使用狀態鏡像 (DisplayMirror)：依大螢幕狀態重繪，不截圖
+        # LIVE_MONITOR_MODE = "grab" 時改用 LiveMonitor (以小視窗解析度直接繪製大螢幕)
+        # 大螢幕在獨立程序時無法直接繪製，一律使用狀態鏡像
+        if LIVE_MONITOR_MODE == "mirror" or self.separate_display:
+            self.live_monitor_label = DisplayMirror(self.display_window)
+        else:
+            self.live_monitor_label = LiveMonitor(self.display_window)
         self.live_monitor_label.setFixedSize(320, 180) # 16:9 小視窗
-        self.live_monitor_label.setStyleSheet("background-color: #000; border: 1px solid #333;")
-        self.live_monitor_label.setScaledContents(True) # 讓截圖自動縮放填滿
+        self.live_monitor_label.setObjectName("liveMonitor") # 以 ID 選擇器設定樣式，避免邊框套用到鏡像的子元件
+        self.live_monitor_label.setStyleSheet("#liveMonitor { background-color: #000; border: 1px solid #333; }")
         
         monitor_layout.addWidget(lbl_monitor_title)
         monitor_layout.addWidget(self.live_monitor_label)
@@ -396,43 +438,20 @@ class ControlWindow(QMainWindow):
         layout.addWidget(control_panel, 1)
         layout.addWidget(preview_panel, 2)
 
-        # 連接【大螢幕】轉盤的結束信號 (若 wheel 尚未建立，使用延遲嘗試連線)
-        def _setup_wheel_connections():
-            try:
-                if hasattr(self.display_window, 'wheel') and self.display_window.wheel is not None:
-                    self.display_window.wheel.spinFinished.connect(self.on_spin_finished)
-                    # 初始化預覽數據
-                    self.update_preview_list()
-                    # 一開始就先同步名單到大螢幕 (不需按發布)
-                    self.display_window.wheel.set_items(self.list_edit.toPlainText())
-                    return True
-            except Exception:
-                pass
-            return False
-
-        # 立即嘗試，若失敗則在 200ms 後再嘗試一次（最多幾次）
-        if not _setup_wheel_connections():
-            # 如果 DisplayWindow 提供 wheelReady 訊號，利用該訊號立即連線
-            try:
-                if hasattr(self.display_window, 'wheelReady'):
-                    self.display_window.wheelReady.connect(lambda: _setup_wheel_connections())
-            except Exception:
-                pass
-            attempt = {'count': 0}
-            def _retry():
-                attempt['count'] += 1
-                if _setup_wheel_connections() or attempt['count'] > 10:
-                    return
-                QTimer.singleShot(200, _retry)
-            QTimer.singleShot(200, _retry)
-        
-        # 即時監控 Timer (已於 __init__ 建立，這裡不重複建立)
+        # 連接【大螢幕】轉盤的結束信號 (DisplayWindow 轉發 wheel.spinFinished，wheel 尚未建立也可先連線)
+        self.display_window.winnerPicked.connect(self.on_winner_picked)
+        self.display_window.spinFinished.connect(self.on_spin_finished)
+        # 名單變更 -> 預覽轉盤 (移除單一中獎者時只移除一格)
+        self.roster.rosterReset.connect(self._on_roster_reset)
+        self.roster.itemRemoved.connect(self._on_roster_item_removed)
+        self.roster.itemsInserted.connect(self._on_roster_items_inserted)
+        self.roster.itemRenamed.connect(self._on_roster_item_renamed)
+        # 初始化預覽數據
+        self._on_roster_reset()
+        # 一開始就先同步名單到大螢幕 (不需按發布；wheel 尚未建立時會暫存)
+        self.display_window.set_items(self.roster.names())
+        self._display_synced = True
 
-    def update_live_monitor(self):
-        """定期截圖大螢幕並顯示在監控區"""
-        if self.display_window.isVisible():
-            pixmap = self.display_window.grab()
-            self.live_monitor_label.setPixmap(pixmap)
 
     def update_physics_params(self):
         """[物理參數] 滑桿數值改變時觸發"""
@@ -449,9 +468,7 @@ class ControlWindow(QMainWindow):
         self.lbl_peg_val.setText(f"{peg_f:.2f}")
         
         # Apply to Display Window (Audience)
-        if hasattr(self.display_window, 'wheel'):
-            self.display_window.wheel.base_friction = base_f
-            self.display_window.wheel.peg_friction = peg_f
+        self.display_window.set_physics(base_f, peg_f)
             
         # Also Apply to Preview Wheel (Operator)
         self.preview_wheel.base_friction = base_f
@@ -533,10 +550,8 @@ class ControlWindow(QMainWindow):
 
     def save_confirmed_list(self):
         # [修改] 按下更新按鈕時，才將編輯框內容視為正式名單並存檔
-        self.list_content = self.list_edit.toPlainText()
-        
-        # 僅更新預覽轉盤
-        self.preview_wheel.set_items(self.list_content)
+        # 編輯器已即時更新名單模型與預覽轉盤，此處只需存檔
+        self.list_content = self.roster.to_text()
         
         # 自動存檔
         self.save_data()
@@ -582,8 +597,8 @@ class ControlWindow(QMainWindow):
         
         # 大螢幕不更新，等待發布
         
-    def publish_to_display(self):
-        """將目前設定發布到大螢幕"""
+    def publish_to_display(self, interactive=True):
+        """將目前設定發布到大螢幕 (interactive=False 時不顯示提示視窗，供控制 API 使用)"""
         current_prize = self.prize_combo.currentText()
         idx = self.prize_combo.currentIndex()
         avatar_path = None
@@ -592,16 +607,11 @@ class ControlWindow(QMainWindow):
                 avatar_path = self.prize_avatars.get(str(idx))
         except Exception:
             avatar_path = None
-        items_text = self.list_edit.toPlainText()
-        
-        # 更新大螢幕
-        self.display_window.update_prize_name(current_prize)
-        self.display_window.wheel.set_items(items_text)
-        self.display_window.wheel.set_presenter_avatar(avatar_path, crop_mode='fit')
-        
-        # [修改] 發布時，如果大螢幕還在中獎畫面，這也是一種 "重置" 訊號
-        self.display_window.hide_winner_message()
-        self.display_window.spin_btn.setEnabled(True)
+        # 更新大螢幕 (標題、名單、頭像；若大螢幕還在中獎畫面，這也是一種 "重置" 訊號)
+        self.display_window.publish(current_prize, self.roster.names(), avatar_path, crop_mode='fit')
+        self._display_synced = True
+        if not interactive:
+            return
         
         msg = QMessageBox(self)
         msg.setWindowTitle("發布成功")
@@ -667,6 +677,7 @@ class ControlWindow(QMainWindow):
                 self.prize_avatars = new_map
             except Exception:
                 pass
+            avatar_cache().pin(self.prize_avatars.values()) # 已刪除獎項的照片不再釘選
                 
             self.update_preview_content()
             self.save_data() # [新增] 自動存檔
@@ -690,24 +701,35 @@ class ControlWindow(QMainWindow):
             msg.exec_()
 
     def shuffle_list(self):
-        text = self.list_edit.toPlainText()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        if lines:
-            random.shuffle(lines)
-            self.list_edit.setPlainText("\n".join(lines))
-            self.update_preview_list() # 自動更新預覽，讓使用者直接看到打散後的轉盤
-
-    def update_preview_list(self):
-        items_text = self.list_edit.toPlainText()
-        # 僅更新預覽轉盤
-        self.preview_wheel.set_items(items_text)
+        # [修改] 背景執行緒打散；完成後 rosterReset 自動更新編輯器與預覽，讓使用者直接看到打散後的轉盤
+        self.roster.shuffle_async()
+
+    def _on_roster_reset(self):
+        self.preview_wheel.set_items(self.roster.names())
+        self._display_synced = False # 大螢幕等待發布
+
+    def _on_roster_item_removed(self, person_id, index, name):
+        self.preview_wheel.remove_item(index)
+        if self._confirming and self._display_synced:
+            # [優化] 確認中獎：大螢幕只移除同一格 (不重送整份名單，獨立程序 / 同步節點也只傳一個數字)
+            self.display_window.remove_item(index)
+        else:
+            self._display_synced = False # 編輯器中的刪除等待發布
+
+    def _on_roster_items_inserted(self, index, names):
+        self.preview_wheel.insert_items(index, names)
+        self._display_synced = False
+
+    def _on_roster_item_renamed(self, index, name):
+        self.preview_wheel.rename_item(index, name)
+        self._display_synced = False
 
     def load_avatar(self):
         try:
             fname, _ = QFileDialog.getOpenFileName(self, '選擇照片', '', "Images (*.jpg *.jpeg *.png *.bmp *.JPG *.JPEG *.PNG);;All Files (*)")
             if fname:
-                image = QImage(fname)
-                if image.isNull():
+                # [優化] 只讀檔頭檢查格式，不完整解碼原圖
+                if probe_image(fname) is None:
                     QMessageBox.warning(self, "讀取錯誤", "圖片讀取失敗，請確認格式。")
                     return
 
@@ -717,6 +739,8 @@ class ControlWindow(QMainWindow):
                         self.prize_avatars[str(idx)] = fname
                     except Exception:
                         pass
+                # [新增] 指定後立即於背景準備 fit / smart 兩種頭像，發布時只需切換 (獎項照片釘選在快取中)
+                avatar_cache().pin(self.prize_avatars.values())
                 
                 self.update_preview_content()
                 
@@ -742,9 +766,8 @@ class ControlWindow(QMainWindow):
         if current_prize:
             try:
                 # 優先使用接收參數的顯示方法
-                if hasattr(self.display_window, 'show_photo_selector_for_prize'):
-                    self.display_window.show_photo_selector_for_prize(current_prize)
-                    return
+                self.display_window.show_photo_selector_for_prize(current_prize)
+                return
             except Exception:
                 pass
         # 回退：不帶參數的顯示方法
@@ -761,6 +784,8 @@ class ControlWindow(QMainWindow):
             self.prize_avatars[str(idx)] = path
         except Exception:
             pass
+        # [新增] 背景預先渲染頭像 (fit / smart)；獎項照片釘選在快取中
+        avatar_cache().pin(self.prize_avatars.values())
         
         # 更新即時預覽
         # 更新即時預覽 (同步顯示大螢幕選的結果)
@@ -802,35 +827,56 @@ class ControlWindow(QMainWindow):
         except Exception:
             pass
 
+    def on_display_lost(self):
+        """大螢幕程序意外結束：提示操作人員，並可重新啟動後重新發布目前設定"""
+        self.statusBar().showMessage("⚠ 大螢幕程序已中斷")
+        self._display_synced = False
+        self.sys_spin_btn.setEnabled(True)
+        reply = QMessageBox.question(self, "大螢幕中斷",
+                                     "大螢幕程序已意外結束，目前的指令不會顯示在大螢幕上。\n是否重新啟動大螢幕？",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply == QMessageBox.Yes:
+            self.display_window.respawn()
+            self.publish_to_display(interactive=False) # 新的大螢幕從目前的獎項 / 名單 / 頭像開始
+            self.statusBar().showMessage("🖥 大螢幕已重新啟動", 5000)
+
+    def on_sync_nodes_changed(self, nodes):
+        """多螢幕同步節點的連線 / 延遲狀態 (顯示於狀態列)"""
+        if not nodes:
+            self.statusBar().showMessage(f"🖥 同步節點：0 (port {self.sync_hub.port})")
+            return
+        parts = []
+        for node in nodes:
+            rtt = "-" if node["rtt_ms"] is None else f"{node['rtt_ms']:.1f}ms"
+            offset = "-" if node["offset_ms"] is None else f"{node['offset_ms']:+.1f}ms"
+            parts.append(f"{node['node']} RTT {rtt} 時差 {offset}")
+        self.statusBar().showMessage(f"🖥 同步節點：{len(nodes)}  |  " + "  |  ".join(parts))
+
     def on_remote_spin_started(self):
         """當大螢幕開始轉動 (長按) 時，鎖定系統端按鈕"""
         self.sys_spin_btn.setEnabled(False)
-        self.display_window.spin_btn.setEnabled(False) # 確保這裡也鎖定
+        self.display_window.set_spin_enabled(False) # 確保這裡也鎖定
 
     def master_start_spin(self):
         """主控端與顯示端同步啟動"""
-        # 檢查是否轉動中 (檢查大螢幕狀態)
-        if self.display_window.wheel.is_spinning:
+        # 檢查是否轉動中 (檢查大螢幕狀態)，並開始轉動 (大螢幕端會進入專注模式並鎖定按鈕)
+        if not self.display_window.start_spin():
             return
 
-        # 產生同步的速度參數
-        speed = random.uniform(25, 40)
-        
-        self.display_window.set_focus_mode(True)
-        # 2. 開始轉動
-        self.display_window.wheel.start_spin()
-        
-        # 3. UI 狀態
-        self.display_window.spin_btn.setEnabled(False)
+        # UI 狀態
         self.sys_spin_btn.setEnabled(False)
 
+    def on_winner_picked(self, winner_name, index):
+        """大螢幕轉盤的中獎格子位置 (在 spinFinished 之前收到)"""
+        self.pending_winner_index = index
+
     def on_spin_finished(self, winner_name):
         """當轉盤動畫完全停止時觸發"""
         current_prize = self.prize_combo.currentText()
+        self.pending_winner = winner_name
         
-        # 1. 大螢幕顯示彈窗 (Overlay) (使用 DisplayWindow 內的 overlay 物件)
-        if hasattr(self.display_window, 'overlay'):
-            self.display_window.overlay.show_winner(winner_name, current_prize)
+        # 1. 大螢幕顯示彈窗 (Overlay)
+        self.display_window.present_winner(winner_name, current_prize)
         
         # [修改] 中獎音樂提前至此處播放
         # [修改] 中獎音樂提前至此處播放
@@ -840,6 +886,10 @@ class ControlWindow(QMainWindow):
             self.win_sound.play()
             print("[Debug] QMediaPlayer play() called")
 
+        # [新增] 非互動模式 (控制 API / 彩排腳本)：不跳出視窗，等待 API 確認或保留
+        if not self.interactive:
+            return
+
         # 2. 系統端跳出確認視窗 (Action)
         msg = QMessageBox(self)
         msg.setWindowTitle("中獎確認")
@@ -847,40 +897,53 @@ class ControlWindow(QMainWindow):
         btn_confirm = msg.addButton("確認 (Confirm)", QMessageBox.YesRole)
         btn_cancel = msg.addButton("保留 (Cancel)", QMessageBox.NoRole)
         msg.setIcon(QMessageBox.Question)
+        self._winner_dialog = msg
         msg.exec_()
+        self._winner_dialog = None
         
+        if self.pending_winner != winner_name:
+            return # 對話框開啟期間已由控制 API 處理
         if msg.clickedButton() == btn_confirm:
             self.confirm_winner(winner_name)
         else:
-            # Cancel: 隱藏 Overlay，重置狀態，但不移除名單
-            self.display_window.overlay.hide()
-            self.display_window.set_focus_mode(False)
-            self.sys_spin_btn.setEnabled(True)
-            self.display_window.spin_btn.setEnabled(True)
+            self.cancel_winner()
+
+    def _resolve_pending_winner(self):
+        """清除待確認的中獎者，並關閉仍開著的確認視窗"""
+        self.pending_winner = None
+        self.pending_winner_index = None
+        if self._winner_dialog is not None:
+            self._winner_dialog.reject()
+
+    def cancel_winner(self):
+        """Cancel: 隱藏 Overlay，重置狀態，但不移除名單"""
+        self._resolve_pending_winner()
+        self.display_window.dismiss_winner()
+        self.sys_spin_btn.setEnabled(True)
 
     def confirm_winner(self, winner_name):
-        # 1. 啟動彩帶 (音效已提前播放)
-        
-        self.display_window.overlay.hide()
-        self.display_window.confetti.start()
-        
-        # 3秒後停止彩帶
-        QTimer.singleShot(3000, self.display_window.confetti.stop)
-        
-        # [修改] 2. 執行飛入動畫並加入名單
-        self.display_window.animate_winner_to_list(winner_name)
-        
-        # 3. 從轉盤名單移除
-        current_text = self.list_edit.toPlainText()
-        lines = [line.strip() for line in current_text.split('\n') if line.strip()]
-        
-        if winner_name in lines:
-            lines.remove(winner_name)
-            self.list_edit.setPlainText("\n".join(lines))
-            self.display_window.wheel.set_items(lines)
-            self.update_preview_list() # 更新預覽
-        
-        # 4. 恢復一般模式
-        self.display_window.set_focus_mode(False)
+        index = self.pending_winner_index
+        self._resolve_pending_winner()
+        # 1. 從轉盤名單移除 ([修正] 依中獎格子找出是哪一位，同名時不會刪錯人)
+        person_id = self.roster.resolve(winner_name, index)
+        
+        remaining = None
+        if person_id is not None:
+            # itemRemoved 更新編輯器與預覽 (只移除一列 / 一格)；大螢幕與名單一致時也只移除一格
+            self._confirming = True
+            try:
+                self.roster.remove(person_id, index) # 以中獎格子直接移除，不必查詢位置索引
+            finally:
+                self._confirming = False
+            if not self._display_synced:
+                # 名單有尚未發布的修改：這次改為送出整份名單，之後恢復逐格同步
+                remaining = self.roster.names()
+                self._display_synced = True
+        
+        # 2. 大螢幕：彩帶 (3 秒後停止) + 飛入動畫加入名單 + 更新轉盤 + 恢復一般模式 (音效已提前播放)
+        # [新增] 大獎 (獎項名稱含 GRAND_PRIZE_KEYWORDS) 使用大量紙花模式，時間也加長
+        prize = self.prize_combo.currentText()
+        grand = any(keyword in prize for keyword in GRAND_PRIZE_KEYWORDS)
+        self.display_window.celebrate_winner(winner_name, remaining, confetti_ms=8000 if grand else 3000, grand=grand,
+                                             prize_name=prize)
         self.sys_spin_btn.setEnabled(True)
-        self.display_window.spin_btn.setEnabled(True)
@@ -0,0 +1,318 @@
+"""
+display_process.py
+------------------
+描述：大螢幕獨立程序模式 (Display Process)。
+功能：
+      1. RemoteDisplayProxy (控制台端)：啟動子程序執行 DisplayWindow，
+         提供與 DisplayWindow 相同的指令介面 (publish / start_spin / present_winner ...) 與信號，
+         ControlWindow 不需要知道大螢幕是否在同一個程序中。
+      2. DisplayHost (大螢幕端)：在子程序中建立 DisplayWindow，執行收到的指令並回傳事件。
+      3. 傳輸層為 QLocalServer / QLocalSocket (Windows Named Pipe / Unix Domain Socket)，
+         每行一則 UTF-8 JSON 訊息：
+           控制台 -> 大螢幕 : {"cmd": "publish", "args": [...]}
+           大螢幕 -> 控制台 : {"event": "spinFinished", "args": ["王小明"]}
+      控制台的對話框、存檔、照片處理因此不會再佔用大螢幕動畫的 GUI 執行緒。
+      4. 大螢幕程序意外結束 (或啟動後遲遲未連線) 時發出 displayLost，由控制台提示操作人員並可 respawn()。
+"""
+import os
+import sys
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QProcess, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from services.json_lines import JsonLineChannel
+
+# 控制台可以呼叫的大螢幕指令 (白名單)
+DISPLAY_COMMANDS = (
+    "publish", "set_items", "remove_item", "set_physics", "start_spin", "set_spin_enabled",
+    "present_winner", "dismiss_winner", "celebrate_winner",
+    "show_photo_selector", "show_photo_selector_for_prize",
+)
+# 由大螢幕轉發回控制台的信號
+CONNECT_TIMEOUT_MS = 15000 # [設定] 啟動大螢幕程序後等待連線的時間，逾時視為啟動失敗
+
+DISPLAY_EVENTS = ("spinStarted", "winnerPicked", "spinFinished", "avatarUpdated", "wheelReady", "spinPlanned", "spinReleased",
+                  "winnerAdded")
+
+
+class RemoteDisplayProxy(QObject):
+    """
+    控制台端的大螢幕代理
+    - 指令以非同步方式送出 (不等待大螢幕回應)，連線建立前的指令會先排隊
+    - snapshot_state() 回傳最近一次收到的狀態，並在背景要求下一份 (供 DisplayMirror / AudienceServer 使用)；
+      名單由代理快取，每位呼叫端依自己的 known_items_rev 決定是否附上
+    - 子程序以 detached 方式啟動：關閉時只送出 close 指令，不阻塞控制台 (子程序自行存檔後結束，
+      控制台連線中斷時子程序也會自行關閉)
+    """
+    displayLost = pyqtSignal() # 大螢幕程序意外結束 / 無法啟動
+    spinStarted = pyqtSignal()
+    spinFinished = pyqtSignal(str)
+    winnerPicked = pyqtSignal(str, int)
+    avatarUpdated = pyqtSignal(str)
+    wheelReady = pyqtSignal()
+    spinPlanned = pyqtSignal(dict)
+    spinReleased = pyqtSignal(dict)
+    winnerAdded = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server_name = f"lucky_wheel_display_{os.getpid()}"
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._channel = None
+        self._queue = []
+        self._running = False   # 已啟動子程序且尚未結束 (連線前的指令會排隊)
+        self._closing = False
+        self._connect_timer = QTimer(self)
+        self._connect_timer.setSingleShot(True)
+        self._connect_timer.timeout.connect(self._on_connect_timeout)
+        self._spinning = False
+        self._last_state = None
+        self._state_requested = False
+        self._items = None       # 最近一次收到的轉盤名單 (快取，各呼叫端共用)
+        self._frame_callbacks = {} # 重繪確認編號 -> callback (call_after_next_frame)
+        self._next_frame_id = 1
+        self._items_rev = None   # 上述名單的版本
+        self._winners = []       # 大螢幕的榮譽榜紀錄 (連線時取得完整清單，之後依 winnerAdded 追加)
+
+    # --- 程序管理 ---
+    def show_on_preferred_screen(self):
+        """啟動大螢幕子程序 (視窗位置由子程序自行決定)"""
+        if self._running:
+            return
+        self._closing = False
+        QLocalServer.removeServer(self.server_name) # 清除上次異常結束殘留的 socket
+        if not self._server.isListening() and not self._server.listen(self.server_name):
+            print(f"[DisplayProxy] 無法建立 IPC 通道: {self._server.errorString()}")
+            QTimer.singleShot(0, self.displayLost.emit)
+            return
+
+        if getattr(sys, 'frozen', False):
+            program, args = sys.executable, []
+        else:
+            main_script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+            program, args = sys.executable, [main_script]
+        ok, pid = QProcess.startDetached(program, args + ["--display-node", self.server_name])
+        if not ok:
+            print("[DisplayProxy] 無法啟動大螢幕程序")
+            QTimer.singleShot(0, self.displayLost.emit)
+            return
+        self._running = True
+        self._connect_timer.start(CONNECT_TIMEOUT_MS)
+        print(f"[DisplayProxy] 已啟動大螢幕程序 ({self.server_name}, pid {pid})")
+
+    def respawn(self):
+        """重新啟動大螢幕程序 (之後需重新發布獎項設定)"""
+        self._lost()
+        self._queue = []
+        self.show_on_preferred_screen()
+
+    def close(self):
+        """關閉大螢幕程序 (不等待；子程序收到 close 後自行存檔並結束)"""
+        self._closing = True
+        self._connect_timer.stop()
+        if self._channel is not None:
+            self._channel.send({"cmd": "close", "args": []})
+            self._channel.device.waitForBytesWritten(500) # 確保 close 在程式結束前送出 (訊息很小，實際幾乎不等待)
+        self._running = False
+        return True
+
+    def _lost(self):
+        self._channel = None
+        self._running = False
+        self._spinning = False
+        self._state_requested = False
+        self._items = None
+        self._items_rev = None
+        self._frame_callbacks.clear() # 不會再收到確認 (呼叫端自有逾時)
+        self._connect_timer.stop()
+
+    def _on_connect_timeout(self):
+        if self._channel is None and self._running and not self._closing:
+            print("[DisplayProxy] 大螢幕程序未在時間內連線")
+            self._lost()
+            self.displayLost.emit()
+
+    def _on_new_connection(self):
+        socket = self._server.nextPendingConnection()
+        if socket is None:
+            return
+        self._connect_timer.stop()
+        self._channel = JsonLineChannel(socket, self)
+        self._channel.messageReceived.connect(self._on_message)
+        socket.disconnected.connect(self._on_disconnected)
+        for message in self._queue:
+            self._channel.send(message)
+        self._queue = []
+
+    def _on_disconnected(self):
+        self._lost()
+        if not self._closing:
+            print("[DisplayProxy] 大螢幕程序意外結束")
+            self.displayLost.emit()
+
+    # --- 訊息 ---
+    def _send(self, cmd, *args):
+        message = {"cmd": cmd, "args": list(args)}
+        if self._channel is None:
+            if self._running:
+                self._queue.append(message)
+            elif not self._closing:
+                print(f"[DisplayProxy] 大螢幕程序未執行，略過指令: {cmd}")
+            return
+        self._channel.send(message)
+
+    def _on_message(self, message):
+        event = message.get("event")
+        args = message.get("args") or []
+        if event == "state":
+            self._state_requested = False
+            self._last_state = args[0] if args else None
+            wheel = (self._last_state or {}).get("wheel") or {}
+            if self._last_state and "items" in self._last_state:
+                self._items = self._last_state.pop("items")
+                self._items_rev = wheel.get("items_rev")
+            self._spinning = bool(wheel.get("spinning", self._spinning))
+            return
+        if event == "winners":
+            self._winners = list(args[0]) if args and isinstance(args[0], list) else []
+            return
+        if event == "winnerAdded" and args:
+            self._winners.append(args[0])
+        if event == "frameAck":
+            callback = self._frame_callbacks.pop(args[0] if args else None, None)
+            if callback is not None:
+                callback()
+            return
+        if event in ("spinStarted", "spinPlanned"):
+            self._spinning = True
+        elif event == "spinFinished":
+            self._spinning = False
+        if event in DISPLAY_EVENTS:
+            getattr(self, event).emit(*args)
+
+    # --- 指令介面 (與 DisplayWindow 相同) ---
+    def publish(self, prize_name, items, avatar_path=None, crop_mode='fit'):
+        if not isinstance(items, list):
+            items = [line.strip() for line in items.split('\n') if line.strip()]
+        self._send("publish", prize_name, items, avatar_path, crop_mode)
+
+    def set_items(self, items):
+        if not isinstance(items, list):
+            items = [line.strip() for line in items.split('\n') if line.strip()]
+        self._send("set_items", items)
+
+    def remove_item(self, index):
+        self._send("remove_item", index)
+
+    def set_physics(self, base_friction, peg_friction):
+        self._send("set_physics", base_friction, peg_friction)
+
+    def is_spinning(self):
+        return self._spinning
+
+    def start_spin(self):
+        if self._spinning:
+            return False
+        self._spinning = True
+        self._send("start_spin")
+        return True
+
+    def set_spin_enabled(self, enabled):
+        self._send("set_spin_enabled", bool(enabled))
+
+    def present_winner(self, winner_name, prize_name):
+        self._send("present_winner", winner_name, prize_name)
+
+    def dismiss_winner(self):
+        self._send("dismiss_winner")
+
+    def celebrate_winner(self, winner_name, remaining_items=None, confetti_ms=3000, grand=False, prize_name=None):
+        self._send("celebrate_winner", winner_name, remaining_items, confetti_ms, grand, prize_name)
+
+    def show_photo_selector(self):
+        self._send("show_photo_selector")
+
+    def show_photo_selector_for_prize(self, prize_name):
+        self._send("show_photo_selector_for_prize", prize_name)
+
+    def winner_records(self):
+        """大螢幕目前的榮譽榜紀錄 (代理端快取)"""
+        return list(self._winners)
+
+    def call_after_next_frame(self, callback):
+        """大螢幕完成下一次重繪後呼叫 callback (子程序經 IPC 回傳確認，排在先前送出的指令之後)"""
+        if not self._running:
+            return
+        frame_id = self._next_frame_id
+        self._next_frame_id += 1
+        self._frame_callbacks[frame_id] = callback
+        self._send("frame_ack", frame_id)
+
+    def snapshot_state(self, known_items_rev=None):
+        """回傳最近一次的大螢幕狀態 (可能落後一個更新週期)，並要求下一份"""
+        if self._channel is not None and not self._state_requested:
+            self._state_requested = True
+            # 以代理自己快取的版本要求 (與呼叫端無關)，名單只在大螢幕端改變時才傳過來
+            self._channel.send({"cmd": "snapshot_state", "args": [self._items_rev]})
+        if not self._last_state:
+            return None
+        state = dict(self._last_state)
+        rev = (state.get("wheel") or {}).get("items_rev")
+        if known_items_rev != rev and self._items is not None and self._items_rev == rev:
+            state["items"] = list(self._items)
+        return state
+
+
+class DisplayHost(QObject):
+    """
+    大螢幕端 (子程序)：建立 DisplayWindow，連回控制台並執行指令
+    """
+    def __init__(self, server_name, parent=None):
+        super().__init__(parent)
+        from windows.display_window import DisplayWindow
+        self.display = DisplayWindow()
+        self.display.show_on_preferred_screen()
+
+        for name in DISPLAY_EVENTS:
+            getattr(self.display, name).connect(lambda *args, _name=name: self._emit_event(_name, *args))
+
+        self.socket = QLocalSocket(self)
+        self.channel = JsonLineChannel(self.socket, self)
+        self.channel.messageReceived.connect(self._on_message)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.connectToServer(server_name)
+        if not self.socket.waitForConnected(5000):
+            print(f"[DisplayHost] 無法連線到控制台 ({server_name}): {self.socket.errorString()}")
+        else:
+            # 榮譽榜由大螢幕程序從 winners.json 還原，先交給控制台 (同步節點連線時轉送)
+            self.channel.send({"event": "winners", "args": [self.display.winner_records()]})
+
+    def _emit_event(self, name, *args):
+        self.channel.send({"event": name, "args": list(args)})
+
+    def _on_message(self, message):
+        cmd = message.get("cmd")
+        args = message.get("args") or []
+        try:
+            if cmd == "snapshot_state":
+                self.channel.send({"event": "state", "args": [self.display.snapshot_state(*args)]})
+            elif cmd == "frame_ack":
+                frame_id = args[0] if args else None
+                self.display.call_after_next_frame(lambda: self.channel.send({"event": "frameAck", "args": [frame_id]}))
+            elif cmd == "close":
+                self._shutdown()
+            elif cmd in DISPLAY_COMMANDS:
+                getattr(self.display, cmd)(*args)
+            else:
+                print(f"[DisplayHost] 未知的指令: {cmd}")
+        except Exception as e:
+            print(f"[DisplayHost] 執行指令 {cmd} 失敗: {e}")
+
+    def _on_disconnected(self):
+        # 控制台已結束 (或當機)，大螢幕跟著關閉
+        print("[DisplayHost] 控制台連線中斷，關閉大螢幕")
+        self._shutdown()
+
+    def _shutdown(self):
+        self.display.close()
+        QApplication.instance().quit()
@@ -10,17 +10,27 @@ display_window.py
 """
 import os
 import sys
+import time
 
 # 若直接執行此檔案，將上層目錄加入 sys.path 以讀取模組
 if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget, QGraphicsOpacityEffect, QApplication
-from PyQt5.QtGui import QPixmap, QCursor, QImage
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QVariantAnimation, QEasingCurve, QTimer, QEvent, QThread
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QApplication
+from PyQt5.QtGui import QPixmap, QPainter, QFontMetrics
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QTimer, QEvent
 from ui_components.lucky_wheel import LuckyWheelWidget
-from ui_components.effects import ConfettiWidget, WinnerOverlay, FlyingLabel
+from ui_components.effects import ConfettiWidget, WinnerOverlay, FlyInLayer, DimmedSnapshot
 from ui_components.photo_selector import PhotoSelectorOverlay # [新增]
+from ui_components.winner_board import WinnerBoard
+from utils.avatar_cache import avatar_cache
+from utils.quality_governor import quality_governor
+from utils.image_loader import read_pixmap
+from utils.image_ops import load_cutout_pixmap
+from utils.config import IDLE_AFTER_S
+from models.winner_model import WinnerListModel, winners_file_path
+
+MIRROR_WINNER_ROWS = 20 # [設定] 狀態中附帶的榮譽榜紀錄數 (鏡像只顯示最後幾列，需大於畫面可見列數)
 
 class DisplayWindow(QWidget):
     """
@@ -31,11 +41,20 @@ class DisplayWindow(QWidget):
     requestSpin = pyqtSignal() # 保留給其他用途，或相容性
     spinStarted = pyqtSignal() # [新增] 通知主控端轉動開始 (鎖定UI)
     avatarUpdated = pyqtSignal(str) # [新增] 通知主控端已選擇新照片
+    spinFinished = pyqtSignal(str) # [新增] 轉盤停止 (轉發 wheel.spinFinished，控制端不需直接存取 wheel)
+    winnerPicked = pyqtSignal(str, int) # [新增] 中獎者與格子位置 (轉發 wheel.winnerPicked)
+    spinPlanned = pyqtSignal(dict) # [新增] 轉動計畫 (轉發 wheel.spinPlanned，供多螢幕同步)
+    spinReleased = pyqtSignal(dict) # [新增] 長按放開 (轉發 wheel.spinReleased)
     wheelReady = pyqtSignal()
+    winnerAdded = pyqtSignal(dict) # [新增] 榮譽榜新增一筆紀錄 (飛入動畫結束時)，供控制台保存目前的榮譽榜
 
-    def __init__(self):
+    def __init__(self, interactive=True, persist_winners=True):
         super().__init__()
         self.setWindowTitle("大螢幕抽獎")
+        # [新增] interactive=False: 同步節點 (其他投影機) 不顯示抽獎按鈕，轉動完全由主控端的轉動計畫驅動
+        self.interactive = interactive
+        # [新增] persist_winners=False: 同步節點的榮譽榜由控制台提供 (set_winners)，不讀寫本機的 winners.json
+        self.persist_winners = persist_winners
         
         # Overlay and Confetti (Initialize early)
         self.overlay = WinnerOverlay(self)
@@ -47,8 +66,8 @@ class DisplayWindow(QWidget):
         self.confetti.hide()
         self.photo_selector.hide()
         
-        # [新增] 初始化飛行動畫屬性
-        self.fly_anim = None
+        # [修改] 名字飛入動畫圖層 (Sprite，可同時多個)
+        self.fly_layer = FlyInLayer(self)
 
         # [新增] 滑鼠跟隨 Logo
         self.cursor_fol_label = QLabel(self)
@@ -73,9 +92,10 @@ class DisplayWindow(QWidget):
             
             # 載入一般狀態圖片 (Logo)
             if os.path.exists(logo_path):
-                pix = QPixmap(logo_path)
+                # [修正] 以原始解析度解碼：縮小後的邊緣像素已被平滑、不再是純白，遮罩會留下一圈白邊
+                pix = read_pixmap(logo_path)
                 # 90 週年圖片與 Logo 去背處理 (將白色背景轉為透明)
-                # 注意：這會將所有純白色像素變更為透明
+                # 注意：這會將所有純白色像素變更為透明 (需在縮小前建立遮罩)
                 pix.setMask(pix.createMaskFromColor(Qt.white))
                 self.pixmap_normal = pix.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             else:
@@ -83,77 +103,9 @@ class DisplayWindow(QWidget):
 
             # 載入活躍狀態圖片 (90_logo)
             if os.path.exists(logo_active_path):
-                pix = QPixmap(logo_active_path)
-                
-                # [修正] 使用 QImage.Format_ARGB32 (5) 以支援透明度
-                # 之前使用 4 (RGB32) 會導致 Alpha 被忽略，變成黑色
-                temp_pix = pix.scaled(250, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                img = temp_pix.toImage().convertToFormat(QImage.Format_ARGB32)
-                
-                width = img.width()
-                height = img.height()
-                
-                from PyQt5.QtGui import qRed, qGreen, qBlue
-                
-                # BFS Flood Fill (從四個角落開始找白色背景)
-                visited = set()
-                # 檢查四個角落，如果是白色就加入起始點
-                start_points = [(0, 0), (width-1, 0), (0, height-1), (width-1, height-1)]
-                stack = []
-                
-                for x, y in start_points:
-                    p = img.pixel(x, y)
-                    # [調整] 門檻值設為 230，更能容忍 JPG 的白色雜訊，確保背景能被選取
-                    if qRed(p) > 230 and qGreen(p) > 230 and qBlue(p) > 230:
-                        stack.append((x, y))
-
-                while stack:
-                    x, y = stack.pop()
-                    if (x, y) in visited: continue
-                    visited.add((x, y))
-                    
-                    # 檢查四鄰居
-                    for nx, ny in [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]:
-                        if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited:
-                            p = img.pixel(nx, ny)
-                            # 同樣使用 230
-                            if qRed(p) > 230 and qGreen(p) > 230 and qBlue(p) > 230:
-                                stack.append((nx, ny))
-                
-                # [新增] 邊緣保留邏輯 (Erosion)
-                # 使用者希望能保留 "一點點" 白色邊緣
-                # 加大 padding_size 讓白邊更明顯
-                padding_size = 5 # 保留 5 像素寬的白邊
-                
-                bg_pixels = visited
-                
-                for _ in range(padding_size):
-                    border_pixels = set()
-                    for x, y in bg_pixels:
-                        # 檢查 8 鄰居 (讓邊緣更圓滑)
-                        is_border = False
-                        for nx in range(x-1, x+2):
-                            for ny in range(y-1, y+2):
-                                if (nx == x and ny == y): continue
-                                # 如果鄰居在圖片範圍內，且不在 current bg_pixels 裡，代表它是 "內容" (或是已保留的邊緣)
-                                # 那目前的 (x,y) 就是新的邊緣，應該被保留
-                                if 0 <= nx < width and 0 <= ny < height:
-                                    if (nx, ny) not in bg_pixels:
-                                        is_border = True
-                                        break
-                            if is_border: break
-                        
-                        if is_border:
-                            border_pixels.add((x, y))
-                    
-                    # 將邊緣從背景集合中移除 (也就是保留下來不透明)
-                    bg_pixels = bg_pixels - border_pixels
-                
-                # 最後執行去背
-                for x, y in bg_pixels:
-                     img.setPixel(x, y, 0)
-                
-                self.pixmap_active = QPixmap.fromImage(img)
+                # [優化] 去背改用 NumPy / OpenCV (floodFill + erode)，並快取於磁碟
+                # 從四個角落找白色背景 (門檻 230)，保留 5 像素白邊
+                self.pixmap_active = load_cutout_pixmap(logo_active_path, 250, threshold=230, padding=5)
             else:
                 print(f"Warning: Active Logo not found at {logo_active_path}")
 
@@ -170,11 +122,26 @@ class DisplayWindow(QWidget):
 
         self.setMouseTracking(True) # 啟用滑鼠追蹤
         
-        # [修改] 使用 Timer 進行滑鼠追蹤更新
-        # 這能確保 (1) 游標永遠在最上層 (透過不斷 raise_) (2) 跟隨速度穩定流暢
-        self.cursor_timer = QTimer(self)
-        self.cursor_timer.timeout.connect(self.update_cursor_position)
-        self.cursor_timer.start(16) # 約 60 FPS
+        # [修改] 改為事件驅動：由全域 eventFilter 接收 MouseMove 更新 Logo 位置 (取代 16ms 輪詢 Timer)
+        # 滑鼠不動時完全不消耗 CPU；層級只在 z-order 真正改變時才重新整理
+        self._hover_cache = {}          # widget -> 是否為手指游標 (含父層)
+        self._last_cursor_pos = None    # 上次處理的全域座標 (同一次移動可能傳遞給多層 widget)
+        self._restack_pending = False
+
+        # [新增] 重繪計數 (給控制台監控判斷畫面是否有變動)
+        self.frame_serial = 0
+        self._rendering_preview = False
+        self._frame_callbacks = [] # 等待下一次重繪完成的回呼 (量測指令到畫面的延遲)
+
+        # [新增] 閒置省電模式：最後一次輸入 / 指令後 IDLE_AFTER_S 秒進入
+        # 單次 Timer 到期時才檢查，期間的輸入只更新時間戳記，不做任何輪詢
+        self.idle_mode = False
+        self._last_activity = time.monotonic()
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._check_idle)
+        if IDLE_AFTER_S > 0:
+            self._idle_timer.start(int(IDLE_AFTER_S * 1000))
 
 
 
@@ -205,8 +172,10 @@ class DisplayWindow(QWidget):
         """)
 
         # 轉盤 (attempt immediate creation; if it fails we'll create later)
+        self._pending_items = None # wheel 尚未建立前收到的名單
         try:
             self.wheel = LuckyWheelWidget()
+            self._connect_wheel_signals()
         except Exception:
             self.wheel = None
         # 開始按鈕 (設為浮動，不放入 Layout 以免影響轉盤大小)
@@ -226,8 +195,7 @@ class DisplayWindow(QWidget):
         self.spin_btn.pressed.connect(self.on_btn_pressed)
         # self.spin_btn.released.connect(self.on_btn_released) # [修改] 移除標準信號，改由 eventFilter 全權處理
 
-        # [新增] 安裝事件過濾器以處理「按住後移出按鈕外放開」的情況
-        self.spin_btn.installEventFilter(self)
+        # [新增] 「按住後移出按鈕外放開」的情況由全域 eventFilter 處理 (見 __init__ 結尾)
 
         # ---------------------------------------------------------
         # [按鈕位置設定]
@@ -247,67 +215,192 @@ class DisplayWindow(QWidget):
             self.left_layout.addWidget(self.wheel, 1)
 
         # --- RIGHT SIDE: Winner List ---
-        self.right_container = QWidget()
-        self.right_container.setFixedWidth(350)
-        self.right_container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 0.4); 
-                border-left: 3px solid rgba(255, 215, 0, 0.5);
-                border-radius: 15px;
-            }
-        """)
-        right_layout = QVBoxLayout(self.right_container)
-
-        lbl_list_title = QLabel("🏆 榮譽榜")
-        lbl_list_title.setAlignment(Qt.AlignCenter)
-        lbl_list_title.setStyleSheet("color: #f1c40f; font-size: 32px; font-weight: bold; padding: 10px; background: transparent; border: none;")
-
-        self.winner_list = QListWidget()
-        self.winner_list.setFocusPolicy(Qt.NoFocus)
-        self.winner_list.setStyleSheet("""
-            QListWidget {
-                background-color: transparent;
-                border: none;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-                font-family: "Microsoft JhengHei";
-                outline: none;
-            }
-            QListWidget::item {
-                padding: 15px;
-                border-bottom: 1px solid rgba(255,255,255,0.1);
-                color: #ecf0f1;
-            }
-            QListWidget::item:selected {
-                background: transparent;
-                color: #f1c40f;
-            }
-        """)
-        right_layout.addWidget(lbl_list_title)
-        right_layout.addWidget(self.winner_list)
+        # [修改] 榮譽榜改為 Model/View：固定列高 + 逐像素捲動，上百位得獎者也只繪製可見的列；
+        #        名單自動存檔，程式重開時立即還原 (面板與控制台鏡像共用 WinnerBoard)
+        self.winner_model = WinnerListModel(winners_file_path() if persist_winners else None, self)
+        self.winner_model.load()
+        self.right_container = WinnerBoard(self.winner_model)
+        self.winner_list = self.right_container.list_view
+        self.winner_list.scrollToBottom()
 
         # Add to main layout
         main_layout.addWidget(self.left_container, 7)
         main_layout.addWidget(self.right_container, 3)
 
+        # [新增] 專注模式：右側名單改以快取的變暗快照顯示 (隱藏時保留版面空間)
+        policy = self.right_container.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.right_container.setSizePolicy(policy)
+        self.dimmed_board = DimmedSnapshot(0.2, self) # 轉動時變很暗 (0.2)
+        model = self.winner_model
+        for sig in (model.rowsInserted, model.rowsRemoved, model.modelReset, model.dataChanged):
+            sig.connect(self.dimmed_board.invalidate)
+
         # 全螢幕設定
         self.showFullScreen()
 
         # Ensure the wheel exists (deferred init will create and add if missing)
         QTimer.singleShot(50, self.ensure_wheel_initialized)
 
+        # [新增] 全域事件過濾：所有子元件都啟用滑鼠追蹤，MouseMove 才會送達
+        for child in self.findChildren(QWidget):
+            child.setMouseTracking(True)
+        QApplication.instance().installEventFilter(self)
+        self._schedule_restack()
+
     def eventFilter(self, obj, event):
-        """處理按鈕的特殊事件 (例如移出邊界後放開)"""
-        if obj == self.spin_btn:
-            if event.type() == QEvent.MouseButtonRelease:
-                # 無論滑鼠是否在按鈕內，只要放開左鍵，都視為結束長按
-                # 判斷是否為左鍵
-                if event.button() == Qt.LeftButton:
-                    self.on_btn_released()
-                    return True # 事件已處理
+        """
+        全域事件過濾 (安裝於 QApplication)：
+        1. 處理按鈕的特殊事件 (例如移出邊界後放開)
+        2. 滑鼠移動 -> 更新跟隨 Logo
+        3. 游標形狀 / 子元件層級改變 -> 更新快取與重新排序
+        """
+        etype = event.type()
+        if etype == QEvent.Paint:
+            # 監控縮圖自己觸發的重繪不計入
+            if not self._rendering_preview and obj.isWidgetType() and obj.window() is self:
+                self.frame_serial += 1
+                if self._frame_callbacks:
+                    # 同一次重繪會依序繪製多個子元件，排到事件佇列最後才算「畫面完成」
+                    callbacks, self._frame_callbacks = self._frame_callbacks, []
+                    QTimer.singleShot(0, lambda: [cb() for cb in callbacks])
+        elif etype == QEvent.MouseMove:
+            if obj.isWidgetType() and obj.window() is self:
+                self.wake()
+                self.update_cursor_position(obj, event.globalPos())
+        elif obj is getattr(self, 'spin_btn', None) and etype == QEvent.MouseButtonRelease:
+            # 無論滑鼠是否在按鈕內，只要放開左鍵，都視為結束長按
+            # 判斷是否為左鍵
+            if event.button() == Qt.LeftButton:
+                self.on_btn_released()
+                return True # 事件已處理
+        elif etype in (QEvent.MouseButtonPress, QEvent.KeyPress, QEvent.Wheel, QEvent.TouchBegin):
+            # 只計入大螢幕本身的輸入 (控制台的操作已透過指令介面喚醒大螢幕)
+            if obj.isWidgetType() and obj.window() is self:
+                self.wake()
+        elif etype == QEvent.CursorChange:
+            self._hover_cache.clear()
+        elif etype in (QEvent.ChildAdded, QEvent.ChildRemoved):
+            if obj.isWidgetType() and obj.window() is self:
+                self._hover_cache.clear()
+                child = event.child()
+                if etype == QEvent.ChildAdded and child.isWidgetType():
+                    child.setMouseTracking(True)
+                if obj is self:
+                    self._schedule_restack()
+        elif etype in (QEvent.ZOrderChange, QEvent.Show, QEvent.Hide):
+            if obj.isWidgetType() and obj.parent() is self:
+                self._schedule_restack()
         return super().eventFilter(obj, event)
 
+    # --- 閒置省電模式 ---
+    def wake(self):
+        """有輸入或指令：記錄活動時間，閒置中則立即恢復正常動畫"""
+        self._last_activity = time.monotonic()
+        if self.idle_mode:
+            self.idle_mode = False
+            if self.wheel is not None:
+                self.wheel.set_idle(False)
+            print("[DisplayWindow] 結束閒置模式")
+            if IDLE_AFTER_S > 0:
+                self._idle_timer.start(int(IDLE_AFTER_S * 1000))
+
+    def _check_idle(self):
+        remaining = IDLE_AFTER_S - (time.monotonic() - self._last_activity)
+        if remaining > 0:
+            self._idle_timer.start(int(remaining * 1000) + 1)
+            return
+        if self.is_spinning() or self.confetti.is_active:
+            self._idle_timer.start(int(IDLE_AFTER_S * 1000))
+            return
+        self.idle_mode = True
+        if self.wheel is not None:
+            self.wheel.set_idle(True)
+        print("[DisplayWindow] 進入閒置模式")
+
+    def call_after_next_frame(self, callback):
+        """下一次大螢幕重繪完成後呼叫 callback (GUI 執行緒)"""
+        self._frame_callbacks.append(callback)
+
+    def snapshot_state(self, known_items_rev=None):
+        """
+        [新增] 取得大螢幕目前的完整顯示狀態 (可序列化為 JSON)，供控制台鏡像預覽使用。
+        known_items_rev 與目前名單版本相同時不附上名單，減少複製與傳輸量。
+        """
+        state = {
+            "size": [self.width(), self.height()],
+            "prize": self.prize_label.text(),
+            "wheel": None,
+            "overlay": {
+                "visible": self.overlay.isVisible(),
+                "prize": self.overlay.current_prize,
+                "name": self.overlay.current_name,
+            },
+            "confetti": self.confetti.is_active,
+            "confetti_mode": self.confetti.mode,
+            "winners": self.winner_model.display_texts(-10),
+            "winner_records": self.winner_model.records(-MIRROR_WINNER_ROWS),
+            "winner_count": self.winner_model.rowCount(),
+            "flights": self.fly_layer.snapshot(),
+            "spin_btn": self.spin_btn.isVisible() and self.spin_btn.isEnabled(),
+            "idle": self.idle_mode,
+        }
+        if getattr(self, 'wheel', None) is not None:
+            state["wheel"] = self.wheel.get_state()
+            if known_items_rev != self.wheel.items_rev:
+                state["items"] = list(self.wheel.items)
+        return state
+
+    def render_preview(self, size):
+        """以指定尺寸 (監控視窗解析度) 直接繪製整個大螢幕，取代 grab() 全尺寸截圖"""
+        if self.width() <= 0 or self.height() <= 0:
+            return None
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.black)
+        scale = min(size.width() / self.width(), size.height() / self.height())
+        painter = QPainter(pixmap)
+        self._rendering_preview = True
+        quality_governor().pause() # 縮小的離屏繪製很便宜，不計入畫面預算
+        try:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.translate((size.width() - self.width() * scale) / 2,
+                              (size.height() - self.height() * scale) / 2)
+            painter.scale(scale, scale)
+            self.render(painter)
+        finally:
+            self._rendering_preview = False
+            quality_governor().resume()
+            painter.end()
+        return pixmap
+
+    def _schedule_restack(self):
+        """合併同一輪事件中的多次層級變動，稍後只檢查一次"""
+        if not self._restack_pending:
+            self._restack_pending = True
+            QTimer.singleShot(0, self._restack_if_needed)
+
+    def _restack_if_needed(self):
+        """確保 [跟隨 Logo] 在最上層、[開始按鈕] 在其下；順序已正確時不做任何事"""
+        self._restack_pending = False
+        stack = [c for c in self.children() if c.isWidgetType() and c.isVisible()]
+        desired = []
+        if hasattr(self, 'spin_btn') and self.spin_btn.isVisible():
+            # 當照片選擇 overlay 顯示時，不要把按鈕抬到 overlay 之上
+            if not (hasattr(self, 'photo_selector') and self.photo_selector.isVisible()):
+                desired.append(self.spin_btn)
+        if self.cursor_fol_label.isVisible():
+            desired.append(self.cursor_fol_label)
+        if not desired or stack[-len(desired):] == desired:
+            return
+        for widget in desired:
+            widget.raise_()
+
+    def _connect_wheel_signals(self):
+        self.wheel.winnerPicked.connect(self.winnerPicked)
+        self.wheel.spinFinished.connect(self.spinFinished)
+        self.wheel.spinPlanned.connect(self.spinPlanned)
+        self.wheel.spinReleased.connect(self.spinReleased)
+
     def ensure_wheel_initialized(self):
         """Ensure `self.wheel` exists and is added to the left layout. Emits `wheelReady` when ready."""
         try:
@@ -317,6 +410,10 @@ class DisplayWindow(QWidget):
 
             # create wheel and insert into left layout
             self.wheel = LuckyWheelWidget()
+            self._connect_wheel_signals()
+            if self._pending_items is not None:
+                self.wheel.set_items(self._pending_items)
+                self._pending_items = None
             # add to left layout (ensure attribute exists)
             if hasattr(self, 'left_layout'):
                 self.left_layout.addWidget(self.wheel, 1)
@@ -355,7 +452,9 @@ class DisplayWindow(QWidget):
     def update_btn_pos(self):
         """[絕對定位] 根據目前的 x, y 與 左側容器位置，計算按鈕座標"""
         # 確保 spin_btn 在最上層且顯示，但如果照片選擇 overlay 正在顯示，避免把按鈕蓋在 overlay 之上
-        if hasattr(self, 'spin_btn'):
+        if hasattr(self, 'spin_btn') and not self.interactive:
+            self.spin_btn.hide()
+        elif hasattr(self, 'spin_btn'):
             # only show/raise if photo selector not visible
             if not (hasattr(self, 'photo_selector') and self.photo_selector.isVisible()):
                 self.spin_btn.show()
@@ -390,24 +489,45 @@ class DisplayWindow(QWidget):
 
     def set_focus_mode(self, active):
         """專注模式：轉動時將右側名單變暗"""
-        op = QGraphicsOpacityEffect(self.right_container)
-        op.setOpacity(0.2 if active else 1.0) # 轉動時變很暗 (0.2)
-        self.right_container.setGraphicsEffect(op)
-
-    def animate_winner_to_list(self, name):
-        """第二階段動畫：名字飛入名單 (Fly-in Collection)"""
+        # [優化] 不再每次建立 QGraphicsOpacityEffect (轉動時每幀都要離屏合成整個面板)
+        # 改為貼上快取的變暗快照，名單內容或尺寸改變後才重新擷取
+        board = self.dimmed_board
+        if active:
+            if board.isVisible():
+                return
+            if not board.is_valid() or board.size() != self.right_container.size():
+                board.capture(self.right_container)
+            board.setGeometry(self.right_container.geometry())
+            board.show()
+            self.right_container.hide()
+        elif board.isVisible():
+            self.right_container.show()
+            board.hide()
+
+    def _refresh_dimmed_board(self):
+        if self.dimmed_board.isVisible():
+            self.dimmed_board.capture(self.right_container)
+            self.dimmed_board.setGeometry(self.right_container.geometry())
+            self.dimmed_board.update()
+
+    def animate_winner_to_list(self, name, prize_name=None):
+        """第二階段動畫：名字飛入名單 (Fly-in Collection)；獎項在起飛時就決定，飛行途中切換獎項也不影響"""
+        prize = self._winner_prize(prize_name)
         # 1. 計算起點 (螢幕中心) 與 終點 (名單末尾)
         start_pos = self.rect().center()
         
         # 取得右側名單 widget
         list_widget = self.winner_list
         # 計算名單中下一個項目的預計位置
-        count = list_widget.count()
+        count = self.winner_model.rowCount()
         if count > 0:
-            last_rect = list_widget.visualItemRect(list_widget.item(count-1))
+            last_rect = list_widget.visualRect(self.winner_model.index(count-1))
             target_y = last_rect.bottom() + 10
+            row_height = last_rect.height()
         else:
             target_y = 10
+            # 名單還是空的：依樣式估算列高 (兩行文字 + 上下 padding 15px + 底線 1px)
+            row_height = QFontMetrics(list_widget.font()).lineSpacing() * 2 + 31
             
         # 轉換座標 (WinnerList -> DisplayWindow)
         # 注意：winner_list 在 right_container 內，需兩層轉換
@@ -419,50 +539,40 @@ class DisplayWindow(QWidget):
         end_y = local_list_pos.y() + target_y
         end_pos = QPoint(int(end_x), int(end_y))
         
-        # 2. 創建飛行標籤
-        fly_label = FlyingLabel(name, self)
-        fly_label.move(start_pos)
-        
-        # 3. 貝茲曲線與屬性動畫
-        self.fly_anim = QVariantAnimation(self)
-        self.fly_anim.setDuration(1200) # 1.2秒飛入，增加優雅感
-        self.fly_anim.setStartValue(0.0)
-        self.fly_anim.setEndValue(1.0)
-        self.fly_anim.setEasingCurve(QEasingCurve.InOutQuad)
-        
-        # 控制點 (決定弧度)
+        # [修改] 連續確認多位中獎者時，前面還在飛的名字也會佔位，往下排
+        pending = self.fly_layer.active_count
+        if pending:
+            end_pos.setY(end_pos.y() + pending * row_height)
+
+        # 2. 控制點 (決定弧度)
         # 設在起點與終點的中間，但往上拉高 (Y軸減小)，形成拋物線
         mid_x = (start_pos.x() + end_pos.x()) / 2
         ctrl_p1 = QPoint(int(mid_x), start_pos.y() - 300) 
-        
-        def update_step(t):
-            # 貝茲曲線公式: (1-t)^2 * P0 + 2(1-t)t * P1 + t^2 * P2
-            x = (1-t)**2 * start_pos.x() + 2*(1-t)*t * ctrl_p1.x() + t**2 * end_pos.x()
-            y = (1-t)**2 * start_pos.y() + 2*(1-t)*t * ctrl_p1.y() + t**2 * end_pos.y()
-            fly_label.move(int(x), int(y))
-            
-            # 同步縮放 (從 2.5倍 縮到 1.0倍)
-            scale = 2.5 - (1.5 * t)
-            fly_label.set_scale(scale)
-
-        def on_finished():
-            fly_label.close()
-            # [重要] 真正將名字加入名單
-            self.add_winner(name) 
-            # 播放入榜音效 (如果有的話)
-            # QApplication.beep() 
-            
-        self.fly_anim.valueChanged.connect(update_step)
-        self.fly_anim.finished.connect(on_finished)
-        self.fly_anim.start()
 
-    def add_winner(self, name):
-        prize = self.prize_label.text().replace("🎉", "").strip()
-        if "準備中" in prize: prize = "特別獎"
+        # 3. 以 Sprite 圖層飛入 (1.2秒，增加優雅感)；結束時真正將名字加入名單
+        self.fly_layer.fly(name, start_pos, ctrl_p1, end_pos, 1200, lambda: self.add_winner(name, prize))
+
+    def _winner_prize(self, prize_name=None):
+        """榮譽榜上的獎項名稱 (優先使用控制台傳來的獎項，未提供時才退回標題文字)"""
+        prize = (prize_name or self.prize_label.text()).replace("🎉", "").strip()
+        if not prize or "準備中" in prize: prize = "特別獎"
+        return prize
+
+    def add_winner(self, name, prize_name=None):
+        prize = self._winner_prize(prize_name)
         
-        # Format: [Prize] Name
-        item_text = f"【{prize}】\n   {name}"
-        self.winner_list.addItem(item_text)
+        # Format: [Prize] Name (由 Model 統一格式化並存檔)
+        record = self.winner_model.add_winner(prize, name)
+        self.winner_list.scrollToBottom()
+        self.winnerAdded.emit(dict(record))
+
+    def winner_records(self):
+        """[新增] 目前的榮譽榜紀錄 (供同步節點連線時取得完整榮譽榜)"""
+        return self.winner_model.records()
+
+    def set_winners(self, records):
+        """[新增] 以控制台提供的紀錄整份替換榮譽榜 (同步節點連線 / 重新連線時)"""
+        self.winner_model.replace(records)
         self.winner_list.scrollToBottom()
 
     def resizeEvent(self, event):
@@ -470,6 +580,13 @@ class DisplayWindow(QWidget):
             self.overlay.resize(self.size())
         if hasattr(self, 'confetti'):
             self.confetti.resize(self.size())
+        if hasattr(self, 'fly_layer'):
+            self.fly_layer.resize(self.size())
+        if hasattr(self, 'dimmed_board'):
+            self.dimmed_board.invalidate()
+            if self.dimmed_board.isVisible():
+                # 專注模式中改變尺寸：版面調整後重新擷取
+                QTimer.singleShot(0, self._refresh_dimmed_board)
         if hasattr(self, 'cursor_fol_label'):
              self.cursor_fol_label.raise_()
         
@@ -503,6 +620,8 @@ class DisplayWindow(QWidget):
                 f.write(f"DisplayWindow: on_photo_selected -> {path}\n")
         except Exception:
             pass
+        # [新增] 立即排入背景渲染，延遲套用時通常已可直接切換
+        avatar_cache().prewarm(path)
         # 更新轉盤：改為延遲執行以避免在選取流程中直接觸發 native 層的 race/crash
         try:
             def _safe_set():
@@ -527,6 +646,108 @@ class DisplayWindow(QWidget):
         except Exception:
             pass
 
+    # --- 控制端指令介面 (Command API) ---
+    # 控制台只透過以下方法操作大螢幕，不直接存取 wheel / overlay / confetti，
+    # 因此大螢幕可以在同一程序 (DisplayWindow) 或獨立程序 (RemoteDisplayProxy) 中執行。
+
+    def show_on_preferred_screen(self):
+        """顯示大螢幕，若有第二螢幕則移至第二螢幕全螢幕顯示"""
+        self.show()
+        desktop = QApplication.desktop()
+        if desktop.screenCount() > 1:
+            self.move(desktop.screenGeometry(1).topLeft())
+            self.showFullScreen()
+
+    def publish(self, prize_name, items, avatar_path=None, crop_mode='fit'):
+        """發布獎項設定 (標題、名單、頭像)，並重置中獎畫面"""
+        self.wake()
+        self.update_prize_name(prize_name)
+        self.set_items(items)
+        if self.wheel is not None:
+            self.wheel.set_presenter_avatar(avatar_path, crop_mode=crop_mode)
+        # 發布時，如果大螢幕還在中獎畫面，這也是一種 "重置" 訊號
+        self.hide_winner_message()
+        self.spin_btn.setEnabled(True)
+
+    def set_items(self, items):
+        """更新轉盤名單 (字串或清單)"""
+        self.wake()
+        if self.wheel is None:
+            self._pending_items = items
+            return
+        self.wheel.set_items(items)
+
+    def remove_item(self, index):
+        """[新增] 轉盤只移除一格 (確認中獎者時使用，不必重送整份名單)"""
+        self.wake()
+        if self.wheel is None:
+            if self._pending_items is not None:
+                items = self._pending_items
+                if not isinstance(items, list):
+                    items = [line.strip() for line in items.split('\n') if line.strip()]
+                self._pending_items = items[:index] + items[index + 1:] if 0 <= index < len(items) else items
+            return
+        self.wheel.remove_item(index)
+
+    def set_physics(self, base_friction, peg_friction):
+        if self.wheel is not None:
+            self.wheel.base_friction = base_friction
+            self.wheel.peg_friction = peg_friction
+
+    def is_spinning(self):
+        return bool(self.wheel is not None and self.wheel.is_spinning)
+
+    def start_spin(self):
+        """由控制端啟動轉盤；已在轉動時回傳 False"""
+        self.wake()
+        if self.wheel is None or self.wheel.is_spinning:
+            return False
+        self.set_focus_mode(True)
+        self.wheel.start_spin()
+        self.spin_btn.setEnabled(False)
+        return True
+
+    def run_spin_plan(self, plan, clock_offset=0.0):
+        """依主控端的轉動計畫在本機重現轉動 (同步節點用)；clock_offset = 本機時鐘 - 主控端時鐘"""
+        self.wake()
+        if self.wheel is None:
+            return
+        self.set_focus_mode(True)
+        self.spin_btn.setEnabled(False)
+        self.wheel.run_spin_plan(plan, clock_offset)
+
+    def release_spin(self, step):
+        """套用主控端的長按放開 (同步節點用)"""
+        if self.wheel is not None:
+            self.wheel.apply_release(step)
+
+    def set_spin_enabled(self, enabled):
+        self.spin_btn.setEnabled(enabled)
+
+    def present_winner(self, winner_name, prize_name):
+        """第一階段：顯示中獎彈窗 (Overlay)"""
+        self.wake()
+        self.overlay.show_winner(winner_name, prize_name)
+
+    def dismiss_winner(self):
+        """保留 (不歸檔)：隱藏彈窗並恢復可抽獎狀態"""
+        self.wake()
+        self.overlay.hide()
+        self.set_focus_mode(False)
+        self.spin_btn.setEnabled(True)
+
+    def celebrate_winner(self, winner_name, remaining_items=None, confetti_ms=3000, grand=False, prize_name=None):
+        """確認歸檔：彩帶 + 名字飛入榮譽榜 (記錄於 prize_name 獎項下)，並更新轉盤名單"""
+        self.wake()
+        self.overlay.hide()
+        self.confetti.start('grand' if grand else 'normal') # [新增] 大獎使用大量紙花模式
+        QTimer.singleShot(confetti_ms, self.confetti.stop)
+        self.animate_winner_to_list(winner_name, prize_name)
+        if remaining_items is not None:
+            self.set_items(remaining_items)
+        self.set_focus_mode(False)
+        self.spin_btn.setEnabled(True)
+
     def update_prize_name(self, prize_name):
         self.prize_label.setText(prize_name)
         
@@ -536,66 +757,63 @@ class DisplayWindow(QWidget):
         
     def hide_winner_message(self):
         self.overlay.hide()
-        self.spin_btn.show()
+        self.spin_btn.setVisible(self.interactive)
+
+    def _is_hovering_pointer(self, widget):
+        """向上遍歷檢查是否有 PointingHandCursor (結果依 widget 快取，游標形狀改變時清除)"""
+        cached = self._hover_cache.get(widget)
+        if cached is not None:
+            return cached
+        result = False
+        curr = widget
+        while curr:
+            if curr.cursor().shape() == Qt.PointingHandCursor:
+                result = True
+                break
+            if curr.isWindow(): break # 到了視窗層就停止
+            curr = curr.parent()
+        self._hover_cache[widget] = result
+        return result
+
+    def update_cursor_position(self, widget_under_mouse, global_pos):
+        """滑鼠移動時更新 Logo 位置與狀態 (由 eventFilter 呼叫)"""
+        if not self.cursor_fol_label.isVisible():
+            return
+        if global_pos == self._last_cursor_pos:
+            return
+        self._last_cursor_pos = QPoint(global_pos)
 
-    def update_cursor_position(self):
-        """定時更新 Logo 位置與層級"""
-        # [修正] 確保按鈕在最上層，但當照片選擇 overlay 顯示時，不要把按鈕抬到 overlay 之上
-        if hasattr(self, 'spin_btn') and self.spin_btn.isVisible():
-            if not (hasattr(self, 'photo_selector') and self.photo_selector.isVisible()):
-                self.spin_btn.raise_()
-            
-        if hasattr(self, 'cursor_fol_label') and self.cursor_fol_label.isVisible():
-            # 1. 強制置頂
-            self.cursor_fol_label.raise_()
-            
-            # 2. 偵測滑鼠下方的元件狀態 (檢查是否為手指游標)
-            global_pos = QCursor.pos()
-            widget_under_mouse = QApplication.widgetAt(global_pos)
-            
-            is_hovering_btn = False
-            if widget_under_mouse:
-                # 向上遍歷檢查是否有 PointingHandCursor
-                curr = widget_under_mouse
-                while curr:
-                    if curr.cursor().shape() == Qt.PointingHandCursor:
-                        is_hovering_btn = True
-                        break
-                    if curr.isWindow(): break # 到了視窗層就停止
-                    curr = curr.parent()
-            
-            # 狀態切換邏輯
-            target_pixmap = self.pixmap_normal
-            current_state_str = "normal"
-            
-            if is_hovering_btn and self.pixmap_active:
-                target_pixmap = self.pixmap_active
-                current_state_str = "active"
-            
-            # 只有在狀態改變時才更新 Pixmap (節省資源)
-            if self.cursor_state != current_state_str:
-                self.cursor_state = current_state_str
-                if target_pixmap:
-                    self.cursor_fol_label.setPixmap(target_pixmap)
-                    self.cursor_fol_label.setFixedSize(target_pixmap.size())
-
-            # 3. 計算位置
-            local_pos = self.mapFromGlobal(global_pos)
-            
-            
-            if self.cursor_state == "active":
-                # 手指狀態：放在手指下方且置中
-                # [修正] 圖片寬度改為 250，所以向左移 125 以置中
-                # 假設手指游標高約 30，所以向下移 30
-                target_pos = local_pos + QPoint(-125, 30)
-            else:
-                # 一般狀態：緊貼箭頭右下
-                target_pos = local_pos + QPoint(8, 8)
-            
-            self.cursor_fol_label.move(target_pos)
+        # 1. 偵測滑鼠下方的元件狀態 (檢查是否為手指游標)
+        is_hovering_btn = self._is_hovering_pointer(widget_under_mouse)
 
-    # 移除 eventFilter，改用 Timer 處理全域滑鼠
-    # def eventFilter(self, source, event): ...
+        # 狀態切換邏輯
+        target_pixmap = self.pixmap_normal
+        current_state_str = "normal"
+        
+        if is_hovering_btn and self.pixmap_active:
+            target_pixmap = self.pixmap_active
+            current_state_str = "active"
+        
+        # 只有在狀態改變時才更新 Pixmap (節省資源)
+        if self.cursor_state != current_state_str:
+            self.cursor_state = current_state_str
+            if target_pixmap:
+                self.cursor_fol_label.setPixmap(target_pixmap)
+                self.cursor_fol_label.setFixedSize(target_pixmap.size())
+
+        # 2. 計算位置
+        local_pos = self.mapFromGlobal(global_pos)
+        
+        if self.cursor_state == "active":
+            # 手指狀態：放在手指下方且置中
+            # [修正] 圖片寬度改為 250，所以向左移 125 以置中
+            # 假設手指游標高約 30，所以向下移 30
+            target_pos = local_pos + QPoint(-125, 30)
+        else:
+            # 一般狀態：緊貼箭頭右下
+            target_pos = local_pos + QPoint(8, 8)
+        
+        self.cursor_fol_label.move(target_pos)
 
 
 